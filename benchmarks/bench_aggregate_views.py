@@ -0,0 +1,101 @@
+"""Benchmark : accesseurs skills/events sans copie contre copie par accès
+
+A read-heavy scan touches `skills` and `events` of every aggregate. Before,
+each access returned a new list; the aggregate now hands out its tuples.
+The copying accessors are reproduced by a subclass to compare both on the
+same data: time of transient scans (filter, serialize) and memory held when
+the accessed sequences are kept (as a serializer building its output does).
+
+Usage : python benchmarks/bench_aggregate_views.py [--size 100000]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+)
+from harness import print_result, run_scenario
+
+SKILLS = ["Python", "Java", "Go", "Rust", "Sql", "Docker"]
+
+
+class CopyingTrainerAccountRequest(TrainerAccountRequest):
+    """The accessors as they were: a new list on every access"""
+
+    @property
+    def skills(self) -> List[Skill]:
+        return list(self._skills)
+
+    @property
+    def events(self) -> List:
+        return list(self._events)
+
+
+def create_requests(size: int) -> List[TrainerAccountRequest]:
+    return [
+        TrainerAccountRequest.submit(
+            CandidatInfo.create("Jean", "Dupont", f"user{i}@example.com"),
+            [
+                Skill.create(SkillName(SKILLS[i % 6]), SkillLevel.expert()),
+                Skill.create(SkillName(SKILLS[(i + 1) % 6]), SkillLevel.beginner()),
+                Skill.create(SkillName(SKILLS[(i + 2) % 6]), SkillLevel.intermediate()),
+            ],
+        )
+        for i in range(size)
+    ]
+
+
+def copying(requests: List[TrainerAccountRequest]) -> List[TrainerAccountRequest]:
+    copies = []
+    for request in requests:
+        copy = CopyingTrainerAccountRequest(
+            request.id, request.candidate_info, request.skills, request.statut, request.submission_date,
+        )
+        copy._events = request.events
+        copies.append(copy)
+    return copies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=100_000)
+    args = parser.parse_args()
+
+    python = SkillName("Python")
+    expert = SkillLevel.expert()
+    kept: List = []
+
+    def filter_scan():
+        return lambda request: any(skill.name == python and skill.level == expert for skill in request.skills)
+
+    def serialize_scan():
+        return lambda request: (len(request.skills), [skill.name.value for skill in request.skills], len(request.events))
+
+    def keep_skills():
+        kept.clear()
+        return lambda request: kept.append(request.skills)
+
+    requests = create_requests(args.size)
+    for label, population in (("tuple views", requests), ("list copies", copying(requests))):
+        print(f"{label} ({args.size:,} requests, 3 skills each)")
+        for name, prepare in (
+            ("filter on skills", filter_scan),
+            ("serialize skills and events", serialize_scan),
+            ("keep every skills sequence", keep_skills),
+        ):
+            print_result(run_scenario(name, prepare, population, batch=100))
+        kept.clear()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark : codec binaire comparé à pickle et à JSON
+
+Requests and TrainerAccountRequestSubmitted events are encoded and decoded
+with the binary codec, with pickle (highest protocol) and with JSON: the
+EventSerializer payloads for events, a document of the stored fields
+rebuilt through _rehydrate for requests. The binary codec decodes once
+validating, its default, and once trusted (`validate=False`, the path
+comparable to JSON's). Sizes are the mean encoded bytes per record;
+`decode_many` is timed both ways on one buffer of every frame.
+
+Usage : python benchmarks/bench_binary_codec.py [--number 50000]
+"""
+
+import argparse
+import json
+import pickle
+import sys
+from datetime import datetime
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+)
+from infrastructure.events import EventSerializer
+from infrastructure.trainer import TrainerAccountRequestBinaryCodec
+from harness import print_result, run_scenario
+
+FIRST_NAMES = ["Jean", "Marie", "Paul", "Anne", "Luc", "Eva", "Hugo", "Lea"]
+LAST_NAMES = ["Dupont", "Martin", "Durand", "Petit", "Moreau", "Lefebvre"]
+SKILLS = ["Python", "Java", "Go", "Rust", "Sql", "Docker"]
+
+MICRO_BATCH = 100
+
+
+def create_request(i: int) -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create(FIRST_NAMES[i % 8], LAST_NAMES[i % 6], f"user{i}@example.com"),
+        [
+            Skill.create(SkillName(SKILLS[i % 6]), SkillLevel.expert()),
+            Skill.create(SkillName(SKILLS[(i + 1) % 6]), SkillLevel.beginner()),
+        ],
+    )
+
+
+def request_to_json(request: TrainerAccountRequest) -> str:
+    full_name = request.candidate_info.full_name
+    return json.dumps({
+        'id': request.id.value,
+        'first_name': full_name.first_name,
+        'last_name': full_name.last_name,
+        'email': request.candidate_info.email.value,
+        'status': request.statut.value,
+        'submission_date': request.submission_date.isoformat(),
+        'skills': [[skill.id.value, skill.name.value, skill.level.value] for skill in request.skills],
+    })
+
+
+def request_from_json(text: str) -> TrainerAccountRequest:
+    document = json.loads(text)
+    return TrainerAccountRequest._rehydrate(
+        document['id'],
+        document['first_name'],
+        document['last_name'],
+        document['email'],
+        document['skills'],
+        document['status'],
+        datetime.fromisoformat(document['submission_date']),
+    )
+
+
+def compare(label: str, values: list, formats: dict) -> None:
+    print(f"{label} ({len(values):,} records)")
+    sizes = {}
+    for name, (encode, decode, size) in formats.items():
+        encoded = [encode(value) for value in values]
+        sizes[name] = sum(size(data) for data in encoded) / len(encoded)
+        print_result(run_scenario(f"{name} encode", lambda: encode, values, batch=MICRO_BATCH, memory=False))
+        print_result(run_scenario(f"{name} decode", lambda: decode, encoded, batch=MICRO_BATCH, memory=False))
+    for name, size in sizes.items():
+        print(f"  {name:<14} {size:>7.1f} bytes/record  ({size / sizes['binary']:.2f}x binary)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=50_000)
+    args = parser.parse_args()
+
+    codec = TrainerAccountRequestBinaryCodec()
+    serializer = EventSerializer.default()
+    requests = [create_request(i) for i in range(args.number)]
+    events = [event for request in requests for event in request.pull_events()]
+    protocol = pickle.HIGHEST_PROTOCOL
+
+    def trusted_decode(data: bytes):
+        # every record was encoded just above, in this process
+        return codec.decode(data, validate=False)
+
+    compare("TrainerAccountRequest", requests, {
+        'binary': (codec.encode, codec.decode, len),
+        'binary trusted': (codec.encode, trusted_decode, len),
+        'pickle': (lambda value: pickle.dumps(value, protocol), pickle.loads, len),
+        'json': (request_to_json, request_from_json, lambda text: len(text.encode('utf-8'))),
+    })
+    compare("TrainerAccountRequestSubmitted", events, {
+        'binary': (codec.encode, codec.decode, len),
+        'binary trusted': (codec.encode, trusted_decode, len),
+        'pickle': (lambda value: pickle.dumps(value, protocol), pickle.loads, len),
+        'json': (
+            serializer.serialize,
+            lambda serialized: serializer.deserialize(*serialized),
+            lambda serialized: len(serialized[1].encode('utf-8')),
+        ),
+    })
+
+    buffer = b''.join(codec.encode_many(requests))
+    print(f"Stream of {args.number:,} requests ({len(buffer):,} bytes)")
+    print_result(run_scenario(
+        "decode_many", lambda: lambda data: sum(1 for _ in codec.decode_many(data)), [buffer], memory=False,
+    ))
+    print_result(run_scenario(
+        "decode_many trusted",
+        lambda: lambda data: sum(1 for _ in codec.decode_many(data, validate=False)),
+        [buffer],
+        memory=False,
+    ))
+
+
+if __name__ == '__main__':
+    main()
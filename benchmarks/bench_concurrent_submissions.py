@@ -0,0 +1,136 @@
+"""Benchmark : soumissions concurrentes avec réservation atomique d'email
+
+Each submission reserves its email, does `--latency-ms` of work that does not
+need the email (validation, calls to other services, simulated by a sleep),
+then saves. Half the submissions reuse an email already submitted, so
+threads race for the same emails. A global lock around check-then-save is
+compared with per-email reservation (striped locks in memory, constraints in
+SQLite). Every run checks that no email was saved twice.
+
+Usage : python benchmarks/bench_concurrent_submissions.py [--submissions 2000] [--threads 1 2 4 8] [--latency-ms 1]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    ConcurrentInMemoryTrainerAccountRequestRepository,
+    SqliteTrainerAccountRequestRepository,
+)
+
+
+def build_requests(submissions: int):
+    emails = [f"user{i}@example.com" for i in range(submissions // 2)]
+    return [
+        TrainerAccountRequest.submit(
+            CandidatInfo.create("Jean", "Dupont", random.choice(emails)),
+            [Skill.create(SkillName("Python"), SkillLevel.expert())],
+        )
+        for _ in range(submissions)
+    ]
+
+
+def global_lock(repo, latency: float):
+    lock = threading.Lock()
+
+    def submit(request) -> bool:
+        with lock:
+            if repo.exists_by_email(request.candidate_info.email):
+                return False
+            time.sleep(latency)
+            repo.save(request)
+            return True
+    return submit
+
+
+def reservation(repo, latency: float):
+    def submit(request) -> bool:
+        if not repo.reserve_email(request.candidate_info.email, request.id):
+            return False
+        time.sleep(latency)
+        return repo.save_if_email_unused(request)
+    return submit
+
+
+def run(submit, requests, threads: int) -> float:
+    chunks = [requests[index::threads] for index in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(chunk):
+        barrier.wait()
+        for request in chunk:
+            submit(request)
+
+    workers = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def check(repo, requests) -> None:
+    saved = repo.find_by_status(RequestStatus.pending_validation())
+    emails = [request.candidate_info.email for request in saved]
+    expected = len({request.candidate_info.email for request in requests})
+    if len(emails) != len(set(emails)) or len(emails) != expected:
+        raise AssertionError(f"{len(emails)} saved, {len(set(emails))} distinct emails, {expected} expected")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--submissions', type=int, default=2000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--latency-ms', type=float, default=1.0)
+    args = parser.parse_args()
+
+    random.seed(0)
+    requests = build_requests(args.submissions)
+    latency = args.latency_ms / 1000
+
+    print(f"{args.submissions} submissions, {args.latency_ms} ms of work each; submissions/s")
+    print(f"{'threads':>8} {'global lock':>14} {'striped locks':>14} {'sqlite':>14}")
+    with tempfile.TemporaryDirectory() as directory:
+        for threads in args.threads:
+            results = []
+
+            repo = IndexedInMemoryTrainerAccountRequestRepository()
+            results.append(run(global_lock(repo, latency), requests, threads))
+            check(repo, requests)
+
+            repo = ConcurrentInMemoryTrainerAccountRequestRepository()
+            results.append(run(reservation(repo, latency), requests, threads))
+            check(repo, requests)
+
+            pool = SqliteConnectionPool(str(Path(directory) / f"bench{threads}.db"), size=threads, timeout=30)
+            repo = SqliteTrainerAccountRequestRepository(pool)
+            results.append(run(reservation(repo, latency), requests, threads))
+            check(repo, requests)
+            pool.close()
+
+            print(f"{threads:>8} " + " ".join(f"{len(requests) / elapsed:>14,.0f}" for elapsed in results))
+    print("no email saved twice")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark : latence de chargement du repository event-sourcé selon la longueur du flux
+
+Usage : python benchmarks/bench_event_sourcing.py [--lengths 10 100 1000 5000] [--snapshot-every 100] [--loads 50]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import EventSourcedTrainerAccountRequestRepository
+
+
+def build_stream(repo, length: int) -> TrainerAccountRequest:
+    """One request whose stream holds `length` events"""
+    request = TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", f"stream{length}@example.com"),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+    skill_id = request.skills[0].id
+    # saved by slices, as an aggregate would be over its lifetime
+    for position in range(1, length):
+        request.upgrade_skill(skill_id, SkillLevel.expert())
+        if position % 50 == 0:
+            repo.save(request)
+    repo.save(request)
+    return request
+
+
+def load_latency(repo, request, loads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loads):
+        repo.find(request.id)
+    return (time.perf_counter() - start) * 1e6 / loads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lengths', type=int, nargs='+', default=[10, 100, 1000, 5000])
+    parser.add_argument('--snapshot-every', type=int, default=100)
+    parser.add_argument('--loads', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'events':>8} {'no snapshot':>14} {'snapshots':>14} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(str(Path(directory) / "bench.db"))
+        with_snapshots = EventSourcedTrainerAccountRequestRepository(pool, snapshot_every=args.snapshot_every)
+        without_snapshots = EventSourcedTrainerAccountRequestRepository(pool, snapshot_every=None)
+        for length in args.lengths:
+            request = build_stream(with_snapshots, length)
+            full_replay = load_latency(without_snapshots, request, args.loads)
+            from_snapshot = load_latency(with_snapshots, request, args.loads)
+            print(
+                f"{length:>8} {full_replay:>11.1f} us {from_snapshot:>11.1f} us "
+                f"{full_replay / from_snapshot:>7.1f}x"
+            )
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark mémoire : repository par colonnes contre repository à base de dict
+
+Usage : python benchmarks/bench_memory.py [--size 100000]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+)
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    ColumnarTrainerAccountRequestRepository,
+)
+
+FIRST_NAMES = ["Jean", "Marie", "Paul", "Anne", "Luc", "Eva", "Hugo", "Lea"]
+LAST_NAMES = ["Dupont", "Martin", "Durand", "Petit", "Moreau", "Lefebvre"]
+SKILLS = ["Python", "Java", "Go", "Rust", "Sql", "Docker"]
+
+
+def create_request(i: int) -> TrainerAccountRequest:
+    request = TrainerAccountRequest.submit(
+        CandidatInfo.create(FIRST_NAMES[i % 8], LAST_NAMES[i % 6], f"user{i}@example.com"),
+        [
+            Skill.create(SkillName(SKILLS[i % 6]), SkillLevel.expert()),
+            Skill.create(SkillName(SKILLS[(i + 1) % 6]), SkillLevel.beginner()),
+        ],
+    )
+    request.clear_events()
+    return request
+
+
+def measure(repository_class, size: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    repo = repository_class()
+    for i in range(size):
+        repo.save(create_request(i))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del repo
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=100000)
+    args = parser.parse_args()
+
+    results = {}
+    for repository_class in (
+        IndexedInMemoryTrainerAccountRequestRepository,
+        ColumnarTrainerAccountRequestRepository,
+    ):
+        used = measure(repository_class, args.size)
+        results[repository_class.__name__] = used
+        print(
+            f"  {repository_class.__name__:<48} {used / args.size:>8.0f} B/request  "
+            f"{used / args.size * 1_000_000 / 2 ** 20:>8.0f} MiB per million"
+        )
+
+    indexed, columnar = results.values()
+    print(f"  columnar / dict-based: {columnar / indexed:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark : validation des candidatures répartie sur plusieurs processus
+
+Compares building requests with the validating constructors in one process
+(the import path) with ParallelCandidateValidator for several worker counts.
+Speedup is bounded by the number of cores of the machine.
+
+Usage : python benchmarks/bench_parallel_validation.py [--rows 200000] [--workers 1 2 4 8] [--chunk-size 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from application.trainer import ParallelCandidateValidator
+from application.trainer.use_cases.candidate_rows import build_candidate
+from domain.trainer import TrainerAccountRequest
+
+
+def build_rows(count: int):
+    return [
+        {
+            'first_name': 'jean-pierre',
+            'last_name': f"dupont{'abcdefghij'[i % 10]}",
+            'email': f"User{i}@Example.com",
+            'skills': 'python:EXPERT;java:BEGINNER;Go:INTERMEDIATE',
+        }
+        for i in range(count)
+    ]
+
+
+def sequential(rows):
+    # requests are kept, as an import keeps them until they are saved
+    return [TrainerAccountRequest.submit(*build_candidate(row)) for row in rows]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    print(f"{args.rows} rows, {os.cpu_count()} cores")
+
+    start = time.perf_counter()
+    sequential(rows)
+    baseline = time.perf_counter() - start
+    print(f"  {'single process':<16} {args.rows / baseline:>12,.0f} rows/s")
+
+    for workers in args.workers:
+        with ParallelCandidateValidator(workers, args.chunk_size) as validator:
+            # start the workers outside the timing
+            list(validator.build_requests(rows[:workers]))
+            start = time.perf_counter()
+            # chunks are kept, as with the sequential path
+            chunks = list(validator.build_requests(rows))
+            elapsed = time.perf_counter() - start
+        assert sum(len(requests) for requests, _ in chunks) == args.rows
+        assert not any(errors for _, errors in chunks)
+        print(
+            f"  {f'{workers} workers':<16} {args.rows / elapsed:>12,.0f} rows/s"
+            f"  speedup {baseline / elapsed:>5.2f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark : reconstruction des agrégats lus en base, validée contre _rehydrate
+
+Rows as a repository reads them are turned into aggregates in two ways:
+through the validating constructors of the value objects (what the
+repositories did before), and through TrainerAccountRequest._rehydrate. The
+SQLite repository is then timed on find_many and find_by_status_page.
+
+Usage : python benchmarks/bench_rehydration.py [--size 50000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    RequestId,
+    Email,
+    FullName,
+    CandidatInfo,
+    RequestStatus,
+    Skill,
+    SkillId,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import SqliteTrainerAccountRequestRepository
+from harness import print_result, run_scenario
+
+SKILLS = ["Python", "Java", "Go", "Rust", "Sql", "Docker"]
+
+
+def stored_rows(size: int):
+    rows = []
+    for i in range(size):
+        request = TrainerAccountRequest.submit(
+            CandidatInfo.create("Jean", "Dupont", f"user{i}@example.com"),
+            [
+                Skill.create(SkillName(SKILLS[i % 6]), SkillLevel.expert()),
+                Skill.create(SkillName(SKILLS[(i + 1) % 6]), SkillLevel.beginner()),
+            ],
+        )
+        rows.append((
+            request.id.value,
+            "Jean",
+            "Dupont",
+            request.candidate_info.email.value,
+            [(skill.id.value, skill.name.value, skill.level.value) for skill in request.skills],
+            request.statut.value,
+            request.submission_date,
+        ))
+    return rows
+
+
+def validated(row) -> TrainerAccountRequest:
+    request_id, first_name, last_name, email, skills, status, submission_date = row
+    return TrainerAccountRequest(
+        request_id=RequestId(request_id),
+        candidate_info=CandidatInfo(FullName(first_name, last_name), Email(email)),
+        skills=[Skill(SkillId(skill_id), SkillName(name), SkillLevel(level)) for skill_id, name, level in skills],
+        status=RequestStatus(status),
+        submission_date=submission_date,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=50_000)
+    args = parser.parse_args()
+
+    rows = stored_rows(args.size)
+    print(f"Aggregates from stored rows ({args.size:,} requests, 2 skills each)")
+    before = run_scenario("validating constructors", lambda: validated, rows, batch=100)
+    print_result(before)
+    after = run_scenario("_rehydrate", lambda: lambda row: TrainerAccountRequest._rehydrate(*row), rows, batch=100)
+    print_result(after)
+    print(f"  speedup: {after['ops_per_sec'] / before['ops_per_sec']:.1f}x")
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(str(Path(directory) / "bench.db"))
+        repo = SqliteTrainerAccountRequestRepository(pool)
+        requests = [TrainerAccountRequest._rehydrate(*row) for row in rows]
+        repo.save_many(requests)
+        ids = [request.id for request in random.Random(0).sample(requests, min(len(requests), 10_000))]
+        print(f"SqliteTrainerAccountRequestRepository ({args.size:,} requests)")
+        batches = [ids[start:start + 500] for start in range(0, len(ids), 500)]
+        result = run_scenario("find_many (500 ids)", lambda: repo.find_many, batches, memory=False)
+        print_result(result)
+        pending = RequestStatus.pending_validation()
+        result = run_scenario(
+            "find_by_status_page (500)", lambda: lambda _: repo.find_by_status_page(pending, None, 500), range(20),
+            memory=False,
+        )
+        print_result(result)
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark : repository SQLite contre repository en mémoire indexé
+
+Usage : python benchmarks/bench_repositories.py [--size 10000] [--lookups 2000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    SqliteTrainerAccountRequestRepository,
+)
+
+
+def build_requests(size: int):
+    return [
+        TrainerAccountRequest.submit(
+            CandidatInfo.create("Jean", "Dupont", f"user{i}@example.com"),
+            [Skill.create(SkillName("Python"), SkillLevel.expert())],
+        )
+        for i in range(size)
+    ]
+
+
+def timed(label: str, operations: int, function) -> None:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22} {operations / elapsed:>12,.0f} ops/s  {elapsed * 1e6 / operations:>9.2f} us/op")
+
+
+def run(repo, requests, lookups: int) -> None:
+    """`repo` must be empty: it is filled by the save scenario"""
+    hits = [Email(f"user{random.randrange(len(requests))}@example.com") for _ in range(lookups)]
+    misses = [Email(f"missing{i}@example.com") for i in range(lookups)]
+    sample_ids = [requests[random.randrange(len(requests))].id for _ in range(lookups)]
+
+    def save_all():
+        for request in requests:
+            repo.save(request)
+
+    def find_by_email():
+        for email in hits:
+            repo.find_by_email(email)
+
+    def exists_hit():
+        for email in hits:
+            repo.exists_by_email(email)
+
+    def exists_miss():
+        for email in misses:
+            repo.exists_by_email(email)
+
+    timed("save", len(requests), save_all)
+    timed("find_by_email", lookups, find_by_email)
+    timed("exists_by_email (hit)", lookups, exists_hit)
+    timed("exists_by_email (miss)", lookups, exists_miss)
+    timed("exists_by_emails", lookups, lambda: repo.exists_by_emails(hits))
+    timed("find_many", lookups, lambda: repo.find_many(sample_ids))
+    repo.clear()
+    timed("save_many", len(requests), lambda: repo.save_many(requests))
+    timed("count_by_status", 100, lambda: [repo.count_by_status(RequestStatus.pending_validation()) for _ in range(100)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--lookups', type=int, default=2000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    requests = build_requests(args.size)
+
+    print(f"IndexedInMemoryTrainerAccountRequestRepository ({args.size} requests)")
+    run(IndexedInMemoryTrainerAccountRequestRepository(), requests, args.lookups)
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(str(Path(directory) / "bench.db"))
+        print(f"SqliteTrainerAccountRequestRepository ({args.size} requests, WAL)")
+        run(SqliteTrainerAccountRequestRepository(pool), requests, args.lookups)
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
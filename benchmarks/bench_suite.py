@@ -0,0 +1,203 @@
+"""Suite de benchmarks du domaine formateur : value objects, agrégat, repositories
+
+Value object scenarios run on `--number` distinct inputs. Repository scenarios
+fill each repository with `--sizes` requests, then run `--lookups` queries on
+it. Every scenario reports ops/s, latency percentiles and the peak memory it
+allocates (tracemalloc only sees memory allocated by Python: the pages SQLite
+caches itself are not counted). `--output` writes the results as JSON.
+
+Usage : python benchmarks/bench_suite.py [--only Email] [--number 100000]
+        [--sizes 10000 100000 1000000] [--lookups 10000]
+        [--repositories indexed columnar sqlite] [--no-memory] [--output results.json]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    Email,
+    FullName,
+    CandidatInfo,
+    RequestId,
+    RequestStatus,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    TrainerAccountRequestRepositoryInterface,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    ColumnarTrainerAccountRequestRepository,
+    SqliteTrainerAccountRequestRepository,
+)
+from harness import Result, print_result, run_scenario, write_results
+
+FIRST_NAMES = ["Jean", "Marie", "Paul", "Anne", "Luc", "Eva", "Hugo", "Lea"]
+LAST_NAMES = ["Dupont", "Martin", "Durand", "Petit", "Moreau", "Lefebvre"]
+SKILLS = ["Python", "Java", "Go", "Rust", "Sql", "Docker"]
+
+# sub-microsecond operations are timed by batches of this many calls
+MICRO_BATCH = 100
+
+REPOSITORY_OPERATIONS = ('save', 'find', 'find_by_email', 'exists_by_email (miss)', 'find_by_status_page', 'count_by_status')
+
+
+def create_request(i: int) -> TrainerAccountRequest:
+    request = TrainerAccountRequest.submit(
+        CandidatInfo.create(FIRST_NAMES[i % 8], LAST_NAMES[i % 6], f"user{i}@example.com"),
+        [
+            Skill.create(SkillName(SKILLS[i % 6]), SkillLevel.expert()),
+            Skill.create(SkillName(SKILLS[(i + 1) % 6]), SkillLevel.beginner()),
+        ],
+    )
+    request.clear_events()
+    return request
+
+
+def value_object_scenarios(number: int) -> Dict[str, Callable[[], tuple]]:
+    """name -> function returning (prepare, arguments, batch), built only if the scenario runs"""
+    emails = [f"User{i}@Example.com" for i in range(number)]
+    names = [(FIRST_NAMES[i % 8], LAST_NAMES[i % 6]) for i in range(number)]
+    request_ids = [str(RequestId.generate()) for _ in range(min(number, 10000))]
+
+    def fresh_emails():
+        # hash() is cached on the instance: the cold scenario needs new instances on every pass
+        values = [Email(email) for email in emails]
+        return lambda i: hash(values[i])
+
+    def equal_pairs(factory):
+        pairs = [(factory(i), factory(i)) for i in range(number)]
+        return lambda i: pairs[i][0] == pairs[i][1]
+
+    def submissions():
+        skills = [Skill.create(SkillName("Python"), SkillLevel.expert())]
+        candidates = [CandidatInfo.create(first, last, email) for (first, last), email in zip(names, emails)]
+        return lambda i: TrainerAccountRequest.submit(candidates[i], skills)
+
+    indexes = range(number)
+    return {
+        'Email()': lambda: (lambda: Email, emails, MICRO_BATCH),
+        'FullName()': lambda: (lambda: lambda name: FullName(*name), names, MICRO_BATCH),
+        'CandidatInfo.create()': lambda: (
+            lambda: lambda i: CandidatInfo.create(*names[i], emails[i]), indexes, MICRO_BATCH,
+        ),
+        'SkillName()': lambda: (lambda: SkillName, [SKILLS[i % 6] for i in indexes], MICRO_BATCH),
+        'RequestId.generate()': lambda: (lambda: lambda _: RequestId.generate(), indexes, MICRO_BATCH),
+        'RequestId.from_string()': lambda: (lambda: RequestId.from_string, request_ids, MICRO_BATCH),
+        'hash(Email) cold': lambda: (fresh_emails, indexes, MICRO_BATCH),
+        'hash(Email) cached': lambda: (
+            lambda: (lambda values: lambda i: hash(values[i]))([Email(email) for email in emails[:1000]]),
+            [i % 1000 for i in indexes],
+            MICRO_BATCH,
+        ),
+        'Email == Email': lambda: (lambda: equal_pairs(lambda i: Email(emails[i])), indexes, MICRO_BATCH),
+        'CandidatInfo == CandidatInfo': lambda: (
+            lambda: equal_pairs(lambda i: CandidatInfo.create(*names[i], emails[i])), indexes, MICRO_BATCH,
+        ),
+        'TrainerAccountRequest.submit()': lambda: (submissions, indexes, MICRO_BATCH),
+    }
+
+
+def repository_scenarios(
+    repo: TrainerAccountRequestRepositoryInterface,
+    requests: List[TrainerAccountRequest],
+    lookups: int,
+) -> Dict[str, Callable[[], tuple]]:
+    """Scenarios in running order: 'save' fills `repo`, the others query it"""
+    size = len(requests)
+    rng = random.Random(size)
+    hits = [requests[rng.randrange(size)] for _ in range(lookups)]
+    pending = RequestStatus.pending_validation()
+
+    def filled_by_save():
+        repo.clear()
+        return repo.save
+
+    scenarios = {
+        'save': lambda: (filled_by_save, requests, 1),
+        'find': lambda: (lambda: repo.find, [request.id for request in hits], 1),
+        'find_by_email': lambda: (
+            lambda: repo.find_by_email, [request.candidate_info.email for request in hits], 1,
+        ),
+        'exists_by_email (miss)': lambda: (
+            lambda: repo.exists_by_email, [Email(f"missing{i}@example.com") for i in range(lookups)], 1,
+        ),
+        'find_by_status_page': lambda: (
+            lambda: lambda _: repo.find_by_status_page(pending, None, 50), range(max(lookups // 100, 1)), 1,
+        ),
+        'count_by_status': lambda: (lambda: lambda _: repo.count_by_status(pending), range(lookups), 1),
+    }
+    assert tuple(scenarios) == REPOSITORY_OPERATIONS
+    return scenarios
+
+
+def run(name: str, scenario: Callable[[], tuple], memory: bool, size=None) -> Result:
+    prepare, arguments, batch = scenario()
+    result = run_scenario(name, prepare, arguments, batch=batch, memory=memory, size=size)
+    print_result(result)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--only', default='', help="run only the scenarios whose name contains this text")
+    parser.add_argument('--number', type=int, default=100_000)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--lookups', type=int, default=10_000)
+    parser.add_argument(
+        '--repositories', nargs='+', default=['indexed', 'columnar'],
+        choices=['indexed', 'columnar', 'sqlite'],
+    )
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--output', help="write the results to this JSON file")
+    args = parser.parse_args()
+    memory = not args.no_memory
+
+    results = []
+    print(f"Value objects and aggregate ({args.number:,} operations)")
+    for name, scenario in value_object_scenarios(args.number).items():
+        if args.only in name:
+            results.append(run(name, scenario, memory))
+
+    repositories = {
+        'indexed': lambda pool: IndexedInMemoryTrainerAccountRequestRepository(),
+        'columnar': lambda pool: ColumnarTrainerAccountRequestRepository(),
+        'sqlite': SqliteTrainerAccountRequestRepository,
+    }
+    selected = {
+        repository: [name for name in REPOSITORY_OPERATIONS if args.only in f"{repository}.{name}"]
+        for repository in args.repositories
+    }
+    for size in args.sizes if any(selected.values()) else []:
+        requests = [create_request(i) for i in range(size)]
+        for repository, names in selected.items():
+            if not names:
+                continue
+            with tempfile.TemporaryDirectory() as directory:
+                pool = SqliteConnectionPool(str(Path(directory) / "bench.db")) if repository == 'sqlite' else None
+                repo = repositories[repository](pool)
+                print(f"{type(repo).__name__} ({size:,} requests)")
+                for name, scenario in repository_scenarios(repo, requests, args.lookups).items():
+                    # the query scenarios need the repository filled by save
+                    if name in names or name == 'save':
+                        results.append(run(f"{repository}.{name}", scenario, memory, size))
+                if pool is not None:
+                    pool.close()
+        del requests
+
+    if args.output:
+        write_results(args.output, results, vars(args))
+        print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
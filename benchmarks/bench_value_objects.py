@@ -0,0 +1,48 @@
+"""Micro-benchmark : égalité et hachage des value objects
+
+Usage : python benchmarks/bench_value_objects.py [--number 200000]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import Email, RequestId, RequestStatus, CandidatInfo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000)
+    args = parser.parse_args()
+
+    email = Email('john@example.com')
+    same_email = Email('JOHN@example.com')
+    request_id = RequestId.generate()
+    same_request_id = RequestId.from_string(str(request_id))
+    status = RequestStatus.pending_validation()
+    candidat_info = CandidatInfo.create('john', 'doe', 'john@example.com')
+    same_candidat_info = CandidatInfo.create('john', 'doe', 'john@example.com')
+    emails = {Email(f'user{i}@example.com'): i for i in range(10000)}
+    emails[email] = -1
+
+    scenarios = [
+        ('hash(Email)', lambda: hash(email)),
+        ('hash(RequestId)', lambda: hash(request_id)),
+        ('hash(CandidatInfo)', lambda: hash(candidat_info)),
+        ('Email == Email', lambda: email == same_email),
+        ('RequestId == RequestId', lambda: request_id == same_request_id),
+        ('CandidatInfo == CandidatInfo', lambda: candidat_info == same_candidat_info),
+        ('RequestStatus == itself', lambda: status == status),
+        ('dict[Email] lookup', lambda: emails[same_email]),
+    ]
+    for label, scenario in scenarios:
+        elapsed = timeit.timeit(scenario, number=args.number)
+        print(f"  {label:<30} {elapsed * 1e9 / args.number:>8.1f} ns/op")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Outils de mesure communs aux benchmarks
+
+A scenario is an operation applied to each item of a list of arguments. The
+timed pass records the latency of every batch of `batch` calls: sub-microsecond
+operations are timed in batches so the timer's own cost does not dominate,
+slower ones one call at a time. A second pass runs the same workload under
+tracemalloc (which slows code down several times) to measure the peak memory
+it allocates.
+"""
+
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+Result = Dict[str, Any]
+
+# called before each pass, returns the operation: a fresh state per pass
+# (an empty repository to fill, for instance) keeps the two passes comparable
+Prepare = Callable[[], Callable[[Any], Any]]
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Linear interpolation between the closest ranks of sorted `samples`"""
+    if not samples:
+        raise ValueError("No samples")
+    position = (len(samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+
+def timed_pass(operation: Callable[[Any], Any], arguments: Sequence[Any], batch: int) -> List[float]:
+    """Seconds per call for each batch of `batch` calls"""
+    clock = time.perf_counter
+    samples = []
+    for start in range(0, len(arguments), batch):
+        chunk = arguments[start:start + batch]
+        began = clock()
+        for argument in chunk:
+            operation(argument)
+        samples.append((clock() - began) / len(chunk))
+    return samples
+
+
+def peak_memory(operation: Callable[[Any], Any], arguments: Sequence[Any]) -> int:
+    """Bytes allocated at the highest point of the pass, above what was live before it"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for argument in arguments:
+            operation(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(peak - baseline, 0)
+
+
+def run_scenario(
+    name: str,
+    prepare: Prepare,
+    arguments: Sequence[Any],
+    batch: int = 1,
+    memory: bool = True,
+    size: Optional[int] = None,
+) -> Result:
+    if not arguments:
+        raise ValueError(f"Scenario {name} has no arguments")
+    gc.collect()
+    operation = prepare()
+    began = time.perf_counter()
+    samples = timed_pass(operation, arguments, batch)
+    elapsed = time.perf_counter() - began
+    samples.sort()
+    return {
+        'name': name,
+        'size': size,
+        'operations': len(arguments),
+        'batch': batch,
+        'seconds': elapsed,
+        'ops_per_sec': len(arguments) / elapsed,
+        'mean_us': sum(samples) / len(samples) * 1e6,
+        'p50_us': percentile(samples, 0.50) * 1e6,
+        'p90_us': percentile(samples, 0.90) * 1e6,
+        'p99_us': percentile(samples, 0.99) * 1e6,
+        'max_us': samples[-1] * 1e6,
+        'peak_memory_bytes': peak_memory(prepare(), arguments) if memory else None,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def print_result(result: Result) -> None:
+    label = result['name'] if result['size'] is None else f"{result['name']} [{result['size']:,}]"
+    memory = result['peak_memory_bytes']
+    print(
+        f"  {label:<44} {result['ops_per_sec']:>12,.0f} ops/s"
+        f"  p50 {result['p50_us']:>9.2f} us  p90 {result['p90_us']:>9.2f} us  p99 {result['p99_us']:>9.2f} us"
+        + ("" if memory is None else f"  peak {memory / 1024:>10,.1f} KiB")
+    )
+    sys.stdout.flush()
+
+
+def write_results(path: str, results: List[Result], arguments: Dict[str, Any]) -> None:
+    document = {'environment': environment(), 'arguments': arguments, 'results': results}
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump(document, output, indent=2)
+        output.write('\n')
+
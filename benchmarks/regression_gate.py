@@ -0,0 +1,252 @@
+"""Garde-fou de performance : compare les scénarios chronométrés à une référence
+
+Each scenario is timed over `--trials` trials of `--number` calls. Every
+trial time is divided by the time of a fixed pure-Python calibration loop
+run just before it, so a baseline recorded on one machine stays usable on a
+faster or slower one. The scenario's score is the median of these ratios,
+and their median absolute deviation tells how noisy it was.
+
+A scenario regresses when its normalized time exceeds the baseline's by more
+than its tolerance: the one stored for it in the baseline file, widened to
+NOISE_MARGIN times the noise measured in the baseline and in this run when
+those were noisier. At least MIN_TRIALS trials are required, as a median of
+fewer moves with a single slow trial. The gate prints a table of every
+scenario and exits with status 1 if any regressed.
+`--update` records the current run as the new baseline, keeping the
+tolerances already in the file.
+
+Usage : python benchmarks/regression_gate.py [--baseline benchmarks/baseline.json]
+        [--trials 11] [--number 5000] [--only submit] [--update]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from domain.trainer import (
+    Email,
+    FullName,
+    CandidatInfo,
+    RequestId,
+    RequestStatus,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    SqliteTrainerAccountRequestRepository,
+)
+from harness import environment, percentile, timed_pass
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.20
+MIN_TRIALS = 5
+# a change within this many times the combined noise is not told apart from noise
+NOISE_MARGIN = 3.0
+REPOSITORY_SIZE = 2000
+
+CALIBRATION_CALLS = range(100)
+# fewer calls of a slow scenario per trial measure its first, colder calls more than its speed
+MIN_SLOW_CALLS = 10
+
+# (operation, arguments); built once, then timed on every trial
+Workload = Tuple[Callable[[Any], Any], Sequence[Any]]
+
+
+def calibration(_) -> int:
+    total = 0
+    for i in range(200):
+        total += len(str(i)) + len({i: i})
+    return total
+
+
+def create_request(i: int) -> TrainerAccountRequest:
+    request = TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", f"user{i}@example.com"),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+    request.clear_events()
+    return request
+
+
+def scenarios(
+    number: int,
+    directory: str,
+    pools: List[SqliteConnectionPool],
+) -> Dict[str, Tuple[Callable[[], Workload], float]]:
+    """name -> (function building the workload, default tolerance); SQLite pools opened are added to `pools`"""
+    emails = [f"User{i}@Example.com" for i in range(number)]
+    request_ids = [str(RequestId.generate()) for _ in range(number)]
+    indexes = range(number)
+    pending = RequestStatus.pending_validation()
+
+    def submissions() -> Workload:
+        skills = [Skill.create(SkillName("Python"), SkillLevel.expert())]
+        candidates = [CandidatInfo.create("jean", "dupont", email) for email in emails]
+        return (lambda i: TrainerAccountRequest.submit(candidates[i], skills)), indexes
+
+    def filled(repo) -> Any:
+        repo.save_many([create_request(i) for i in range(REPOSITORY_SIZE)])
+        return repo
+
+    def find_by_email(repo) -> Workload:
+        filled(repo)
+        return repo.find_by_email, [Email(f"user{i % REPOSITORY_SIZE}@example.com") for i in indexes]
+
+    def find_by_status(repo, calls: int) -> Workload:
+        filled(repo)
+        return (lambda _: repo.find_by_status(pending)), range(calls)
+
+    def sqlite_repository() -> SqliteTrainerAccountRequestRepository:
+        pools.append(SqliteConnectionPool(str(Path(directory) / f"gate{len(pools)}.db")))
+        return SqliteTrainerAccountRequestRepository(pools[-1])
+
+    return {
+        'Email()': (lambda: (Email, emails), 0.20),
+        'FullName()': (lambda: ((lambda i: FullName("jean", "dupont")), indexes), 0.20),
+        'CandidatInfo.create()': (lambda: ((lambda i: CandidatInfo.create("jean", "dupont", emails[i])), indexes), 0.20),
+        'RequestId.from_string()': (lambda: (RequestId.from_string, request_ids), 0.20),
+        'TrainerAccountRequest.submit()': (submissions, 0.20),
+        'indexed.find_by_email': (lambda: find_by_email(IndexedInMemoryTrainerAccountRequestRepository()), 0.30),
+        'indexed.find_by_status': (
+            lambda: find_by_status(IndexedInMemoryTrainerAccountRequestRepository(), max(number // 200, MIN_SLOW_CALLS)), 0.30,
+        ),
+        'sqlite.find_by_email': (lambda: find_by_email(sqlite_repository()), 0.40),
+        'sqlite.find_by_status': (lambda: find_by_status(sqlite_repository(), max(number // 500, MIN_SLOW_CALLS)), 0.40),
+    }
+
+
+def measure(workload: Workload, trials: int) -> Dict[str, float]:
+    """
+    Each trial times the calibration loop right before the scenario, so a
+    machine that slows down during the run slows both sides of the ratio
+    """
+    operation, arguments = workload
+    timed_pass(operation, arguments[:100], len(arguments))  # warm-up
+    times, ratios = [], []
+    for _ in range(trials):
+        gc.collect()
+        [reference] = timed_pass(calibration, CALIBRATION_CALLS, len(CALIBRATION_CALLS))
+        [time] = timed_pass(operation, arguments, len(arguments))
+        times.append(time)
+        ratios.append(time / reference)
+    times.sort()
+    ratios.sort()
+    normalized = percentile(ratios, 0.5)
+    deviations = sorted(abs(ratio - normalized) for ratio in ratios)
+    return {
+        'median_us': percentile(times, 0.5) * 1e6,
+        'normalized': normalized,
+        # median absolute deviation, relative to the median: the noise of this scenario
+        'noise': percentile(deviations, 0.5) / normalized,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> Tuple[List[List[str]], List[str]]:
+    """Table rows for every current scenario, and the names of those that regressed"""
+    rows, regressions = [], []
+    for name, measured in current['scenarios'].items():
+        reference = baseline['scenarios'].get(name)
+        if reference is None:
+            rows.append([name, '-', f"{measured['normalized']:.4f}", '-', '-', 'new'])
+            continue
+        change = measured['normalized'] / reference['normalized'] - 1
+        tolerance = max(
+            reference.get('tolerance', DEFAULT_TOLERANCE),
+            NOISE_MARGIN * (reference.get('noise', 0.0) + measured['noise']),
+        )
+        if change > tolerance:
+            status = 'REGRESSED'
+            regressions.append(name)
+        elif change < -tolerance:
+            status = 'faster'
+        else:
+            status = 'ok'
+        rows.append([
+            name,
+            f"{reference['normalized']:.4f}",
+            f"{measured['normalized']:.4f}",
+            f"{change:+.1%}",
+            f"{tolerance:.0%}",
+            status,
+        ])
+    return rows, regressions
+
+
+def print_table(rows: List[List[str]]) -> None:
+    header = ['scenario', 'baseline', 'current', 'change', 'tolerance', 'status']
+    widths = [max(len(row[column]) for row in rows + [header]) for column in range(len(header))]
+    for row in [header, ['-' * width for width in widths]] + rows:
+        print('  ' + '  '.join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths))
+        ))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE))
+    parser.add_argument('--trials', type=int, default=11, help=f"at least {MIN_TRIALS}")
+    parser.add_argument('--number', type=int, default=5000)
+    parser.add_argument('--only', default='', help="run only the scenarios whose name contains this text")
+    parser.add_argument('--update', action='store_true', help="record this run as the new baseline")
+    args = parser.parse_args()
+    if args.trials < MIN_TRIALS:
+        parser.error(f"--trials must be at least {MIN_TRIALS}: the median of fewer trials is too noisy to gate on")
+    if args.number < 1:
+        parser.error("--number must be at least 1")
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8')) if baseline_path.exists() else None
+    if baseline is None and not args.update:
+        print(f"No baseline at {baseline_path}: run with --update to record one", file=sys.stderr)
+        return 2
+
+    current = {'environment': environment(), 'scenarios': {}}
+    tolerances = {}
+    pools: List[SqliteConnectionPool] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (workload, tolerance) in scenarios(args.number, directory, pools).items():
+            if args.only not in name:
+                continue
+            measured = measure(workload(), args.trials)
+            current['scenarios'][name] = measured
+            tolerances[name] = tolerance
+            print(f"  {name:<32} {measured['median_us']:>10.2f} us  noise {measured['noise']:.1%}")
+            sys.stdout.flush()
+        for pool in pools:
+            pool.close()
+
+    if args.update:
+        previous = baseline['scenarios'] if baseline else {}
+        scenarios_to_keep = {} if args.only == '' else dict(previous)
+        for name, measured in current['scenarios'].items():
+            measured['tolerance'] = previous.get(name, {}).get('tolerance', tolerances[name])
+            scenarios_to_keep[name] = measured
+        current['scenarios'] = scenarios_to_keep
+        baseline_path.write_text(json.dumps(current, indent=2) + '\n', encoding='utf-8')
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    rows, regressions = compare(baseline, current)
+    print()
+    print_table(rows)
+    if regressions:
+        print(f"\n{len(regressions)} scenario(s) regressed: {', '.join(regressions)}")
+        return 1
+    print("\nNo regression")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
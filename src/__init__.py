@@ -1,5 +1,5 @@
 """Source code"""
 
-from . import domain
+from . import domain, application, infrastructure
 
-__all__ = ['domain']
+__all__ = ['domain', 'application', 'infrastructure']
@@ -0,0 +1,5 @@
+"""Couche application"""
+
+from . import trainer
+
+__all__ = ['trainer']
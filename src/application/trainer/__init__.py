@@ -0,0 +1,36 @@
+"""Cas d'utilisation pour le domaine Formateur"""
+
+from .readers import (
+    InvalidRow,
+    read_csv,
+    read_jsonl,
+)
+
+from .use_cases import (
+    ImportReport,
+    ImportRowError,
+    ImportTrainerApplications,
+    SubmitTrainerAccountRequest,
+    AsyncSubmitTrainerAccountRequest,
+)
+
+from .unit_of_work import (
+    TrainerAccountRequestUnitOfWork,
+)
+
+from .validation import (
+    ParallelCandidateValidator,
+)
+
+__all__ = [
+    'InvalidRow',
+    'read_csv',
+    'read_jsonl',
+    'ImportReport',
+    'ImportRowError',
+    'ImportTrainerApplications',
+    'SubmitTrainerAccountRequest',
+    'AsyncSubmitTrainerAccountRequest',
+    'TrainerAccountRequestUnitOfWork',
+    'ParallelCandidateValidator',
+]
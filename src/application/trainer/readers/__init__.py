@@ -0,0 +1,5 @@
+"""Lecteurs de fichiers de candidatures formateur"""
+
+from .trainer_application_readers import InvalidRow, read_csv, read_jsonl
+
+__all__ = ['InvalidRow', 'read_csv', 'read_jsonl']
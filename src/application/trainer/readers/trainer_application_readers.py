@@ -0,0 +1,53 @@
+"""Lecture en flux des fichiers partenaires (CSV, JSONL) de candidatures formateur"""
+
+import csv
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, TextIO, Union
+
+Source = Union[str, Path, TextIO]
+
+
+class InvalidRow:
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return f"InvalidRow(reason={self.reason!r})"
+
+
+@contextmanager
+def _open(source: Source) -> Iterator[TextIO]:
+    if isinstance(source, (str, Path)):
+        with open(source, newline='', encoding='utf-8') as file:
+            yield file
+    else:
+        yield source
+
+
+def read_csv(source: Source, delimiter: str = ',') -> Iterator[Union[Dict[str, Any], InvalidRow]]:
+    with _open(source) as file:
+        reader = csv.DictReader(file, delimiter=delimiter)
+        for row in reader:
+            if None in row:
+                yield InvalidRow(f"Line {reader.line_num} has too many columns")
+            else:
+                yield row
+
+
+def read_jsonl(source: Source) -> Iterator[Union[Dict[str, Any], InvalidRow]]:
+    with _open(source) as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as error:
+                yield InvalidRow(f"Line {line_number} is not valid JSON: {error}")
+                continue
+            if isinstance(row, dict):
+                yield row
+            else:
+                yield InvalidRow(f"Line {line_number} is not a JSON object")
@@ -0,0 +1,5 @@
+"""Unit of Work pour le domaine Formateur"""
+
+from .trainer_account_request_unit_of_work import TrainerAccountRequestUnitOfWork
+
+__all__ = ['TrainerAccountRequestUnitOfWork']
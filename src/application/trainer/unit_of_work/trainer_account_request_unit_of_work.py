@@ -0,0 +1,145 @@
+"""Unit of Work : carte d'identité et suivi des modifications des demandes"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.repositories import TrainerAccountRequestRepositoryInterface
+from domain.trainer.value_objects import RequestId, Email, RequestStatus, SkillId, SkillLevel
+
+Snapshot = Tuple[RequestStatus, Tuple[Tuple[SkillId, SkillLevel], ...]]
+
+
+class TrainerAccountRequestUnitOfWork:
+
+    def __init__(
+        self,
+        repository: TrainerAccountRequestRepositoryInterface,
+        publish: Optional[Callable[[List[Any]], Any]] = None,
+    ):
+        self._repository = repository
+        self._publish = publish
+        self._identity_map: Dict[str, TrainerAccountRequest] = {}
+        self._id_by_email: Dict[str, str] = {}
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._new: Dict[str, TrainerAccountRequest] = {}
+        self._removed: Dict[str, TrainerAccountRequest] = {}
+        self._collected_events: List[Any] = []
+
+    def __enter__(self) -> 'TrainerAccountRequestUnitOfWork':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @property
+    def collected_events(self) -> List[Any]:
+        return self._collected_events
+
+    def get(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        key = request_id.value
+        if key in self._removed:
+            return None
+        request = self._identity_map.get(key)
+        if request is None:
+            request = self._track(self._repository.find(request_id))
+        return request
+
+    def get_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        request_ids = list(request_ids)
+        missing = [
+            request_id for request_id in request_ids
+            if request_id.value not in self._identity_map and request_id.value not in self._removed
+        ]
+        if missing:
+            for request in self._repository.find_many(missing):
+                self._track(request)
+        identity_map = self._identity_map
+        return [
+            identity_map[request_id.value] for request_id in request_ids
+            if request_id.value in identity_map and request_id.value not in self._removed
+        ]
+
+    def get_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        request_id = self._id_by_email.get(email.value)
+        if request_id is not None:
+            return None if request_id in self._removed else self._identity_map[request_id]
+        return self._track(self._repository.find_by_email(email))
+
+    def add(self, request: TrainerAccountRequest) -> None:
+        key = request.id.value
+        self._removed.pop(key, None)
+        self._identity_map[key] = request
+        self._id_by_email[request.candidate_info.email.value] = key
+        self._new[key] = request
+
+    def remove(self, request: TrainerAccountRequest) -> None:
+        key = request.id.value
+        if self._new.pop(key, None) is not None and key not in self._snapshots:
+            self._forget(key)
+            return
+        self._removed[key] = request
+
+    def is_dirty(self, request: TrainerAccountRequest) -> bool:
+        key = request.id.value
+        if key in self._new or request.events:
+            return True
+        snapshot = self._snapshots.get(key)
+        return snapshot is not None and snapshot != self._snapshot(request)
+
+    def dirty(self) -> List[TrainerAccountRequest]:
+        return [
+            request for key, request in self._identity_map.items()
+            if key not in self._removed and self.is_dirty(request)
+        ]
+
+    def commit(self) -> List[Any]:
+        dirty = self.dirty()
+        # read before saving: a repository with an outbox takes them off the aggregates
+        events = [event for request in dirty for event in request.events]
+        if dirty:
+            self._repository.save_many(dirty)
+        for key, request in self._removed.items():
+            self._repository.delete(request)
+            self._forget(key)
+        self._removed.clear()
+        self._new.clear()
+        for request in dirty:
+            request.clear_events()
+            self._snapshots[request.id.value] = self._snapshot(request)
+        self._collected_events.extend(events)
+        if events and self._publish is not None:
+            self._publish(events)
+        return events
+
+    def rollback(self) -> None:
+        """Oublie les agrégats suivis ; leurs modifications en mémoire ne sont pas annulées"""
+        self._identity_map.clear()
+        self._id_by_email.clear()
+        self._snapshots.clear()
+        self._new.clear()
+        self._removed.clear()
+
+    def _track(self, request: Optional[TrainerAccountRequest]) -> Optional[TrainerAccountRequest]:
+        if request is None:
+            return None
+        key = request.id.value
+        known = self._identity_map.get(key)
+        if known is not None:
+            return None if key in self._removed else known
+        self._identity_map[key] = request
+        self._id_by_email[request.candidate_info.email.value] = key
+        self._snapshots[key] = self._snapshot(request)
+        return request
+
+    def _forget(self, key: str) -> None:
+        request = self._identity_map.pop(key, None)
+        if request is not None:
+            self._id_by_email.pop(request.candidate_info.email.value, None)
+        self._snapshots.pop(key, None)
+
+    @staticmethod
+    def _snapshot(request: TrainerAccountRequest) -> Snapshot:
+        return request.statut, tuple((skill.id, skill.level) for skill in request.skills)
@@ -0,0 +1,14 @@
+"""Cas d'utilisation pour le domaine Formateur"""
+
+from .import_report import ImportReport, ImportRowError
+from .import_trainer_applications import ImportTrainerApplications
+from .submit_trainer_account_request import SubmitTrainerAccountRequest
+from .async_submit_trainer_account_request import AsyncSubmitTrainerAccountRequest
+
+__all__ = [
+    'ImportReport',
+    'ImportRowError',
+    'ImportTrainerApplications',
+    'SubmitTrainerAccountRequest',
+    'AsyncSubmitTrainerAccountRequest',
+]
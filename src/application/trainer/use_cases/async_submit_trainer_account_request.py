@@ -0,0 +1,50 @@
+"""Cas d'utilisation asynchrone : soumettre une demande de compte formateur"""
+
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.entities import Skill
+from domain.trainer.repositories import AsyncTrainerAccountRequestRepository
+from domain.trainer.services import AsyncVerifyEmailUniqueness
+from domain.trainer.value_objects import CandidatInfo, SkillName, SkillLevel
+from application.trainer.use_cases.submit_trainer_account_request import Trace, no_trace
+
+EventPublisher = Callable[[List[Any]], Awaitable[Any]]
+
+
+class AsyncSubmitTrainerAccountRequest:
+
+    def __init__(
+        self,
+        request_repository: AsyncTrainerAccountRequestRepository,
+        publish: Optional[EventPublisher] = None,
+        trace: Optional[Trace] = None,
+    ):
+        self._request_repository = request_repository
+        self._verify_email_uniqueness = AsyncVerifyEmailUniqueness(request_repository)
+        self._publish = publish
+        self._trace = trace or no_trace
+
+    async def execute(
+        self,
+        first_name: str,
+        last_name: str,
+        email: str,
+        skills: Sequence[Tuple[str, str]],
+    ) -> TrainerAccountRequest:
+        trace = self._trace
+        with trace("submit"):
+            with trace("submit.candidate_info"):
+                candidate_info = CandidatInfo.create(first_name, last_name, email)
+            with trace("submit.skills"):
+                request_skills = [Skill.create(SkillName(name), SkillLevel(level)) for name, level in skills]
+            with trace("submit.email_uniqueness"):
+                await self._verify_email_uniqueness.execute(candidate_info.email)
+            with trace("submit.aggregate"):
+                request = TrainerAccountRequest.submit(candidate_info, request_skills)
+            with trace("submit.save"):
+                await self._request_repository.save(request)
+            if self._publish is not None:
+                with trace("submit.publish"):
+                    await self._publish(request.pull_events())
+        return request
@@ -0,0 +1,74 @@
+"""Construction des candidats à partir des lignes importées"""
+
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.entities import Skill
+from domain.trainer.exceptions import RequiredSkillsException, TrainerAccountRequestException
+from domain.trainer.value_objects import CandidatInfo, SkillName, SkillLevel
+from application.trainer.readers import InvalidRow
+from application.trainer.use_cases.import_report import ImportRowError
+
+Row = Union[Mapping[str, Any], InvalidRow]
+# (record number, submitted request) for the valid rows of a chunk, and the errors of the others
+RequestChunk = Tuple[List[Tuple[int, TrainerAccountRequest]], List[ImportRowError]]
+
+# errors that reject a row instead of stopping the import: anything else is a bug
+ROW_ERRORS = (KeyError, ValueError, TrainerAccountRequestException)
+
+
+def build_candidate(row: Mapping[str, Any]) -> Tuple[CandidatInfo, List[Skill]]:
+    """Lève une des ROW_ERRORS si la ligne est invalide"""
+    if not isinstance(row, Mapping):
+        raise ValueError(f"Row must be a mapping of fields, not {type(row).__name__}")
+    candidate_info = CandidatInfo.create(_text(row, 'first_name'), _text(row, 'last_name'), _text(row, 'email'))
+    skills = [
+        Skill.create(SkillName(name), SkillLevel(level))
+        for name, level in parse_skills(row.get('skills'))
+    ]
+    if not skills:
+        raise RequiredSkillsException()
+    return candidate_info, skills
+
+
+def parse_skills(raw: Any) -> List[Tuple[str, str]]:
+    if not raw:
+        return []
+    if isinstance(raw, str):
+        skills = []
+        for item in raw.split(';'):
+            if not item.strip():
+                continue
+            name, separator, level = item.partition(':')
+            if not separator:
+                raise ValueError(f"Skill '{item.strip()}' must be written 'name:LEVEL'")
+            skills.append((name, level.strip()))
+        return skills
+    if not isinstance(raw, list):
+        raise ValueError("Skills must be a 'name:LEVEL;...' string or a list of skills")
+    skills = []
+    for skill in raw:
+        if not isinstance(skill, Mapping):
+            raise ValueError("Each skill must be an object with a name and a level")
+        skills.append((_text(skill, 'name', "Skill field"), _text(skill, 'level', "Skill field")))
+    return skills
+
+
+def raw_email(row: Mapping[str, Any]) -> Optional[str]:
+    email = row.get('email') if isinstance(row, Mapping) else None
+    return email if isinstance(email, str) else None
+
+
+def _text(fields: Mapping[str, Any], name: str, label: str = "Field") -> str:
+    value = fields.get(name)
+    if value is None:
+        raise ValueError(f"Missing {label.lower()} '{name}'")
+    if not isinstance(value, str):
+        raise ValueError(f"{label} '{name}' must be text, not {type(value).__name__}")
+    return value
+
+
+def rejection_reason(error: Exception) -> str:
+    if isinstance(error, KeyError):
+        return f"Missing field {error}"
+    return str(error)
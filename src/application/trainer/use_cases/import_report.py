@@ -0,0 +1,66 @@
+"""Rapport d'import en masse des candidatures formateur"""
+
+import time
+from typing import Dict, List, Optional
+
+
+class ImportRowError:
+    """`record_number` numérote les enregistrements à partir de 1, pas les lignes du fichier : l'en-tête CSV ne compte pas"""
+
+    def __init__(self, record_number: int, email: Optional[str], reason: str):
+        self.record_number = record_number
+        self.email = email
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return (
+            f"ImportRowError("
+            f"record_number={self.record_number}, "
+            f"email={self.email!r}, "
+            f"reason={self.reason!r})"
+        )
+
+
+class ImportReport:
+
+    STAGES = ('validation', 'uniqueness', 'save')
+
+    def __init__(self):
+        self.rows_read = 0
+        self.imported = 0
+        self.chunks = 0
+        self.errors: List[ImportRowError] = []
+        self.stage_seconds: Dict[str, float] = {stage: 0.0 for stage in self.STAGES}
+        self._started = time.perf_counter()
+        self._elapsed: Optional[float] = None
+
+    @property
+    def rejected(self) -> int:
+        return len(self.errors)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self._elapsed is None:
+            return time.perf_counter() - self._started
+        return self._elapsed
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.rows_read / elapsed if elapsed > 0 else 0.0
+
+    def reject(self, record_number: int, email: Optional[str], reason: str) -> None:
+        self.errors.append(ImportRowError(record_number, email, reason))
+
+    def finish(self) -> None:
+        self._elapsed = time.perf_counter() - self._started
+
+    def summary(self) -> str:
+        stages = ', '.join(f"{stage} {seconds:.3f}s" for stage, seconds in self.stage_seconds.items())
+        return (
+            f"{self.rows_read} rows read, {self.imported} imported, {self.rejected} rejected "
+            f"in {self.elapsed_seconds:.3f}s ({self.rows_per_second:,.0f} rows/s; {stages})"
+        )
+
+    def __repr__(self) -> str:
+        return f"ImportReport({self.summary()})"
@@ -0,0 +1,115 @@
+"""Cas d'utilisation : import en masse de candidatures formateur"""
+
+import time
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories import TrainerAccountRequestRepositoryInterface
+from domain.trainer.services import VerifyEmailUniqueness
+from application.trainer.readers import InvalidRow
+from application.trainer.use_cases.candidate_rows import (
+    ROW_ERRORS,
+    RequestChunk,
+    Row,
+    build_candidate,
+    raw_email,
+    rejection_reason,
+)
+from application.trainer.use_cases.import_report import ImportReport, ImportRowError
+
+
+class ImportTrainerApplications:
+
+    def __init__(
+        self,
+        request_repository: TrainerAccountRequestRepositoryInterface,
+        chunk_size: int = 1000,
+        build_requests: Optional[Callable[[Iterable[Row]], Iterable[RequestChunk]]] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self._request_repository = request_repository
+        self._verify_email_uniqueness = VerifyEmailUniqueness(request_repository)
+        self._chunk_size = chunk_size
+        self._build_requests = build_requests or self._build_requests_in_process
+
+    def execute(self, rows: Iterable[Row]) -> ImportReport:
+        report = ImportReport()
+        chunks = iter(self._build_requests(rows))
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            report.stage_seconds['validation'] += time.perf_counter() - started
+            self._import_chunk(*chunk, report)
+        report.finish()
+        return report
+
+    def _build_requests_in_process(self, rows: Iterable[Row]) -> Iterator[RequestChunk]:
+        numbered = enumerate(rows, start=1)
+        while True:
+            chunk = list(islice(numbered, self._chunk_size))
+            if not chunk:
+                return
+            yield self._build_chunk(chunk)
+
+    @staticmethod
+    def _build_chunk(chunk: Sequence[Tuple[int, Row]]) -> RequestChunk:
+        requests: List[Tuple[int, TrainerAccountRequest]] = []
+        errors: List[ImportRowError] = []
+        for record_number, row in chunk:
+            if isinstance(row, InvalidRow):
+                errors.append(ImportRowError(record_number, None, row.reason))
+                continue
+            try:
+                candidate_info, skills = build_candidate(row)
+            except ROW_ERRORS as error:
+                errors.append(ImportRowError(record_number, raw_email(row), rejection_reason(error)))
+                continue
+            requests.append((record_number, TrainerAccountRequest.submit(candidate_info, skills)))
+        return requests, errors
+
+    def _import_chunk(
+        self,
+        requests: Sequence[Tuple[int, TrainerAccountRequest]],
+        errors: Sequence[ImportRowError],
+        report: ImportReport,
+    ) -> None:
+        report.chunks += 1
+        report.rows_read += len(requests) + len(errors)
+        report.errors.extend(errors)
+
+        started = time.perf_counter()
+        availability = self._verify_email_uniqueness.execute_many(
+            [request.candidate_info.email for _, request in requests]
+        )
+        available: List[Tuple[int, TrainerAccountRequest]] = []
+        for (record_number, request), is_available in zip(requests, availability):
+            if not is_available:
+                email = request.candidate_info.email
+                report.reject(record_number, email.value, str(EmailAlreadyUsedException(email)))
+                continue
+            available.append((record_number, request))
+        verified = time.perf_counter()
+        report.stage_seconds['uniqueness'] += verified - started
+
+        self._save(available, report)
+        report.stage_seconds['save'] += time.perf_counter() - verified
+
+    def _save(self, requests: Sequence[Tuple[int, TrainerAccountRequest]], report: ImportReport) -> None:
+        try:
+            self._request_repository.save_many(request for _, request in requests)
+            report.imported += len(requests)
+            return
+        except EmailAlreadyUsedException:
+            pass
+        # an email was taken since the check: save one by one to isolate the rows involved
+        for record_number, request in requests:
+            try:
+                self._request_repository.save(request)
+                report.imported += 1
+            except EmailAlreadyUsedException as error:
+                report.reject(record_number, request.candidate_info.email.value, str(error))
@@ -0,0 +1,59 @@
+"""Cas d'utilisation : soumettre une demande de compte formateur"""
+
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, List, Optional, Sequence, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.entities import Skill
+from domain.trainer.repositories import TrainerAccountRequestRepositoryInterface
+from domain.trainer.services import VerifyEmailUniqueness
+from domain.trainer.value_objects import CandidatInfo, SkillName, SkillLevel
+
+EventPublisher = Callable[[List[Any]], Any]
+
+# opens a named span around a step, e.g. Tracer.span from infrastructure.monitoring
+Trace = Callable[[str], ContextManager]
+
+_NO_SPAN = nullcontext()
+
+
+def no_trace(name: str) -> ContextManager:
+    return _NO_SPAN
+
+
+class SubmitTrainerAccountRequest:
+
+    def __init__(
+        self,
+        request_repository: TrainerAccountRequestRepositoryInterface,
+        publish: Optional[EventPublisher] = None,
+        trace: Optional[Trace] = None,
+    ):
+        self._request_repository = request_repository
+        self._verify_email_uniqueness = VerifyEmailUniqueness(request_repository)
+        self._publish = publish
+        self._trace = trace or no_trace
+
+    def execute(
+        self,
+        first_name: str,
+        last_name: str,
+        email: str,
+        skills: Sequence[Tuple[str, str]],
+    ) -> TrainerAccountRequest:
+        trace = self._trace
+        with trace("submit"):
+            with trace("submit.candidate_info"):
+                candidate_info = CandidatInfo.create(first_name, last_name, email)
+            with trace("submit.skills"):
+                request_skills = [Skill.create(SkillName(name), SkillLevel(level)) for name, level in skills]
+            with trace("submit.email_uniqueness"):
+                self._verify_email_uniqueness.execute(candidate_info.email)
+            with trace("submit.aggregate"):
+                request = TrainerAccountRequest.submit(candidate_info, request_skills)
+            with trace("submit.save"):
+                self._request_repository.save(request)
+            if self._publish is not None:
+                with trace("submit.publish"):
+                    self._publish(request.pull_events())
+        return request
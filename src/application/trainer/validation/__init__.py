@@ -0,0 +1,9 @@
+"""Validation parallèle des candidatures formateur"""
+
+from .parallel_candidate_validator import (
+    ParallelCandidateValidator,
+    rebuild_request,
+    validate_rows,
+)
+
+__all__ = ['ParallelCandidateValidator', 'rebuild_request', 'validate_rows']
@@ -0,0 +1,125 @@
+"""Validation parallèle des candidatures, répartie sur plusieurs processus"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.entities import Skill
+from domain.trainer.value_objects import (
+    RequestId,
+    Email,
+    FullName,
+    CandidatInfo,
+    SkillId,
+    SkillName,
+    SkillLevel,
+)
+from application.trainer.readers import InvalidRow
+from application.trainer.use_cases.candidate_rows import (
+    ROW_ERRORS,
+    RequestChunk,
+    Row,
+    build_candidate,
+    raw_email,
+    rejection_reason,
+)
+from application.trainer.use_cases.import_report import ImportRowError
+
+# (record number, request id, first name, last name, email, ((skill id, name, level), ...)), all normalized
+ValidCandidate = Tuple[int, str, str, str, str, Tuple[Tuple[str, str, str], ...]]
+# (record number, raw email if any, reason)
+RejectedRow = Tuple[int, Optional[str], str]
+ValidationChunk = Tuple[List[ValidCandidate], List[RejectedRow]]
+
+
+def validate_rows(rows: Sequence[Tuple[int, Row]]) -> ValidationChunk:
+    valid: List[ValidCandidate] = []
+    rejected: List[RejectedRow] = []
+    for record_number, row in rows:
+        if isinstance(row, InvalidRow):
+            rejected.append((record_number, None, row.reason))
+            continue
+        try:
+            candidate_info, skills = build_candidate(row)
+        except ROW_ERRORS as error:
+            rejected.append((record_number, raw_email(row), rejection_reason(error)))
+            continue
+        full_name = candidate_info.full_name
+        valid.append((
+            record_number,
+            RequestId.generate().value,
+            full_name.first_name,
+            full_name.last_name,
+            candidate_info.email.value,
+            tuple((skill.id.value, skill.name.value, skill.level.value) for skill in skills),
+        ))
+    return valid, rejected
+
+
+def rebuild_request(candidate: ValidCandidate) -> TrainerAccountRequest:
+    _, request_id, first_name, last_name, email, skills = candidate
+    skill_id, skill_name, skill_level = SkillId._from_trusted, SkillName._from_trusted, SkillLevel._from_trusted
+    return TrainerAccountRequest.submit(
+        CandidatInfo._from_trusted(FullName._from_trusted(first_name, last_name), Email._from_trusted(email)),
+        [Skill(skill_id(id_), skill_name(name), skill_level(level)) for id_, name, level in skills],
+        RequestId._from_trusted(request_id),
+    )
+
+
+class ParallelCandidateValidator:
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 2000):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self._max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self._chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ParallelCandidateValidator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def validate(self, rows: Iterable[Row]) -> Iterator[ValidationChunk]:
+        numbered = enumerate(rows, start=1)
+        chunks = iter(lambda: list(islice(numbered, self._chunk_size)), [])
+        if self._max_workers == 0:
+            yield from map(validate_rows, chunks)
+            return
+
+        executor = self._get_executor()
+        window = 2 * self._max_workers
+        pending: Deque[Future] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(validate_rows, chunk))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # on a failure or an early stop, no chunk keeps a worker busy once we return
+            for future in pending:
+                future.cancel()
+            wait(pending)
+
+    def build_requests(self, rows: Iterable[Row]) -> Iterator[RequestChunk]:
+        for valid, rejected in self.validate(rows):
+            yield (
+                [(candidate[0], rebuild_request(candidate)) for candidate in valid],
+                [ImportRowError(*error) for error in rejected],
+            )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._max_workers)
+        return self._executor
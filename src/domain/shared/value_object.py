@@ -1,10 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable, Dict, Tuple
 
 
 class ValueObject(ABC):
 
-    __slots__ = ()
+    __slots__ = ('_hash',)
+
+    _fields: Tuple[str, ...] = ()
+    _setters: Tuple[Callable[[Any, Any], None], ...] = ()
+    _key: Callable[['ValueObject'], Any] = staticmethod(lambda value_object: ())
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = tuple(
+            slot
+            for klass in reversed(cls.__mro__)
+            for slot in klass.__dict__.get('__slots__', ())
+            if slot != '_hash'
+        )
+        cls._fields = fields
+        cls._setters = tuple(getattr(cls, field).__set__ for field in fields)
+        if len(fields) > 1:
+            cls._key = attrgetter(*fields)
+        elif fields:
+            cls._key = attrgetter(fields[0])
+
+    @classmethod
+    def _from_trusted(cls, *values: Any) -> 'ValueObject':
+        instance = object.__new__(cls)
+        for set_field, value in zip(cls._setters, values):
+            set_field(instance, value)
+        return instance
 
     def __setattr__(self, name: str, value: Any) -> None:
         raise AttributeError(f"Cannot modify attribute '{name}' - ValueObject is immutable")
@@ -13,24 +40,27 @@ class ValueObject(ABC):
         raise AttributeError(f"Cannot delete attribute '{name}' - ValueObject is immutable")
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
-        for slot in self.__slots__:
-            try:
-                if getattr(self, slot) != getattr(other, slot):
-                    return False
-            except AttributeError:
-                return False
-        return True
+        return self._key(self) == other._key(other)
 
     def __hash__(self) -> int:
-        values = []
-        for slot in self.__slots__:
-            try:
-                values.append(getattr(self, slot))
-            except AttributeError:
-                pass
-        return hash(frozenset((id(v), v) if hasattr(v, '__hash__') else (id(v),) for v in values))
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash(self._key(self))
+            object.__setattr__(self, '_hash', value)
+            return value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the cached hash is left out: str hashes differ between processes
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for field, value in state.items():
+            object.__setattr__(self, field, value)
 
     def __repr__(self) -> str:
         attrs = []
@@ -21,6 +21,9 @@ from .aggregates import (
 
 from .events import (
     TrainerAccountRequestSubmitted,
+    TrainerAccountRequestApproved,
+    TrainerAccountRequestRejected,
+    SkillLevelUpgraded,
 )
 
 from .exceptions import (
@@ -28,14 +31,21 @@ from .exceptions import (
     RequiredSkillsException,
     EmailAlreadyUsedException,
     SkillCannotDowngradeException,
+    InvalidStatusTransitionException,
+    SkillNotFoundException,
+    ConcurrentModificationException,
 )
 
 from .repositories import (
     TrainerAccountRequestRepositoryInterface,
+    AsyncTrainerAccountRequestRepository,
+    RequestPage,
+    PageCursor,
 )
 
 from .services import (
     VerifyEmailUniqueness,
+    AsyncVerifyEmailUniqueness,
 )
 
 __all__ = [
@@ -54,13 +64,23 @@ __all__ = [
     'TrainerAccountRequest',
     # Events
     'TrainerAccountRequestSubmitted',
+    'TrainerAccountRequestApproved',
+    'TrainerAccountRequestRejected',
+    'SkillLevelUpgraded',
     # Exceptions
     'TrainerAccountRequestException',
     'RequiredSkillsException',
     'EmailAlreadyUsedException',
     'SkillCannotDowngradeException',
+    'InvalidStatusTransitionException',
+    'SkillNotFoundException',
+    'ConcurrentModificationException',
     # Repositories
     'TrainerAccountRequestRepositoryInterface',
+    'AsyncTrainerAccountRequestRepository',
+    'RequestPage',
+    'PageCursor',
     # Services
     'VerifyEmailUniqueness',
+    'AsyncVerifyEmailUniqueness',
 ]
@@ -1,21 +1,29 @@
 """TrainerAccountRequest - Point d'entrée de l'agrégat pour la demande de compte formateur"""
 
 from datetime import datetime
-from typing import List
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple
 
 from domain.shared import Entity
 from domain.trainer.value_objects import (
     RequestId,
     Email,
+    FullName,
     RequestStatus,
     CandidatInfo,
+    SkillId,
+    SkillLevel,
 )
 from domain.trainer.entities import Skill
 from domain.trainer.events import (
     TrainerAccountRequestSubmitted,
+    TrainerAccountRequestApproved,
+    TrainerAccountRequestRejected,
+    SkillLevelUpgraded,
 )
 from domain.trainer.exceptions import (
     RequiredSkillsException,
+    InvalidStatusTransitionException,
+    SkillNotFoundException,
 )
 
 
@@ -25,7 +33,7 @@ class TrainerAccountRequest(Entity[RequestId]):
         self,
         request_id: RequestId,
         candidate_info: CandidatInfo,
-        skills: List[Skill],
+        skills: Sequence[Skill],
         status: RequestStatus,
         submission_date: datetime,
     ):
@@ -35,19 +43,27 @@ class TrainerAccountRequest(Entity[RequestId]):
             raise RequiredSkillsException()
 
         self._candidate_info = candidate_info
-        self._skills = list(skills)
+        # tuples: readers get the stored sequence itself, it cannot be changed behind the aggregate's back
+        self._skills: Tuple[Skill, ...] = tuple(skills)
         self._status = status
         self._submission_date = submission_date
 
-        self._events: List = []
+        self._events: Tuple[Any, ...] = ()
 
     @property
     def candidate_info(self) -> CandidatInfo:
         return self._candidate_info
 
     @property
-    def skills(self) -> List[Skill]:
-        return list(self._skills)
+    def skills(self) -> Tuple[Skill, ...]:
+        return self._skills
+
+    @property
+    def skill_count(self) -> int:
+        return len(self._skills)
+
+    def iter_skills(self) -> Iterator[Skill]:
+        return iter(self._skills)
 
     @property
     def statut(self) -> RequestStatus:
@@ -59,22 +75,24 @@ class TrainerAccountRequest(Entity[RequestId]):
 
 
     @property
-    def events(self) -> List:
-        return list(self._events)
+    def events(self) -> Tuple[Any, ...]:
+        return self._events
 
 
     @staticmethod
     def submit(
         candidate_info: CandidatInfo,
-        skills: List[Skill]
+        skills: Sequence[Skill],
+        request_id: Optional[RequestId] = None
     ) -> 'TrainerAccountRequest':
+        """`request_id` lets a caller assign an identity it generated beforehand"""
 
         if not skills:
             raise RequiredSkillsException()
 
         # Create the aggregate
         request = TrainerAccountRequest(
-            request_id=RequestId.generate(),
+            request_id=request_id or RequestId.generate(),
             candidate_info=candidate_info,
             skills=skills,
             status=RequestStatus.pending_validation(),
@@ -85,17 +103,94 @@ class TrainerAccountRequest(Entity[RequestId]):
             TrainerAccountRequestSubmitted(
                 request_id=request.id,
                 candidate_email=candidate_info.email,
+                occurred_on=request.submission_date,
+                candidate_info=candidate_info,
+                skills=tuple((skill.id, skill.name, skill.level) for skill in request._skills),
             )
         )
 
         return request
 
+    @staticmethod
+    def _rehydrate(
+        request_id: str,
+        first_name: str,
+        last_name: str,
+        email: str,
+        skills: Iterable[Tuple[str, str, str]],
+        status: str,
+        submission_date: datetime,
+    ) -> 'TrainerAccountRequest':
+        """Request read back from storage, from the stored (already normalized) values.
+
+        Nothing is validated again, so only repositories and serializers call
+        it, with values that went through the value objects when the request
+        was saved, never input from outside the system. `skills` are
+        (id, name, level) triples.
+        """
+        skills = tuple(Skill._rehydrate(skill_id, name, level) for skill_id, name, level in skills)
+        if not skills:
+            raise RequiredSkillsException()
+        request = object.__new__(TrainerAccountRequest)
+        request._id = RequestId._from_trusted(request_id)
+        request._candidate_info = CandidatInfo._from_trusted(
+            FullName._from_trusted(first_name, last_name),
+            Email._from_trusted(email),
+        )
+        request._skills = skills
+        request._status = RequestStatus._from_trusted(status)
+        request._submission_date = submission_date
+        request._events = ()
+        return request
+
+    def _detached_copy(self) -> 'TrainerAccountRequest':
+        """Same state without the pending events, sharing no mutable part: for in-memory repositories"""
+        request = object.__new__(TrainerAccountRequest)
+        request._id = self._id
+        request._candidate_info = self._candidate_info
+        request._skills = tuple([skill._detached_copy() for skill in self._skills])
+        request._status = self._status
+        request._submission_date = self._submission_date
+        request._events = ()
+        return request
+
+    def approve(self) -> None:
+        if not self._status.can_be_approved():
+            raise InvalidStatusTransitionException(self._status, RequestStatus.approved())
+        self._status = RequestStatus.approved()
+        self._record_event(TrainerAccountRequestApproved(request_id=self.id))
+
+    def reject(self) -> None:
+        if not self._status.can_be_rejected():
+            raise InvalidStatusTransitionException(self._status, RequestStatus.rejected())
+        self._status = RequestStatus.rejected()
+        self._record_event(TrainerAccountRequestRejected(request_id=self.id))
+
+    def upgrade_skill(self, skill_id: SkillId, new_level: SkillLevel) -> None:
+        for skill in self._skills:
+            if skill.id == skill_id:
+                skill.upgrade_level(new_level)
+                self._record_event(SkillLevelUpgraded(
+                    request_id=self.id,
+                    skill_id=skill_id,
+                    new_level=new_level,
+                ))
+                return
+        raise SkillNotFoundException(skill_id)
+
     # gestion des evenements domaine
     def _record_event(self, event) -> None:
-        self._events.append(event)
+        # an aggregate records a handful of events: rebuilding the tuple is cheap
+        self._events += (event,)
 
     def clear_events(self) -> None:
-        self._events.clear()
+        self._events = ()
+
+    def pull_events(self) -> Tuple[Any, ...]:
+        """Hand over the recorded events and forget them, without copying"""
+        events = self._events
+        self._events = ()
+        return events
 
 
     def __repr__(self) -> str:
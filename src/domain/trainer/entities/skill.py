@@ -32,5 +32,21 @@ class Skill(Entity[SkillId]):
     def create(name: SkillName, level: SkillLevel) -> 'Skill':
         return Skill(SkillId.generate(), name, level)
 
+    @staticmethod
+    def _rehydrate(skill_id: str, name: str, level: str) -> 'Skill':
+        """Skill read back by a repository or serializer: the values were validated when it was saved"""
+        skill = object.__new__(Skill)
+        skill._id = SkillId._from_trusted(skill_id)
+        skill._name = SkillName._from_trusted(name)
+        skill._level = SkillLevel._from_trusted(level)
+        return skill
+
+    def _detached_copy(self) -> 'Skill':
+        skill = object.__new__(Skill)
+        skill._id = self._id
+        skill._name = self._name
+        skill._level = self._level
+        return skill
+
     def __repr__(self) -> str:
         return f"Skill(id={self._id!r}, name={self._name!r}, level={self._level!r})"
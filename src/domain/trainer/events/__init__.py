@@ -1,8 +1,14 @@
 """Evenements domaine pour le domaine Formateur"""
 
 from .trainer_account_request_submitted import TrainerAccountRequestSubmitted
+from .trainer_account_request_approved import TrainerAccountRequestApproved
+from .trainer_account_request_rejected import TrainerAccountRequestRejected
+from .skill_level_upgraded import SkillLevelUpgraded
 
 
 __all__ = [
     'TrainerAccountRequestSubmitted',
+    'TrainerAccountRequestApproved',
+    'TrainerAccountRequestRejected',
+    'SkillLevelUpgraded',
 ]
@@ -0,0 +1,28 @@
+"""Event: Le niveau d'une compétence du candidat a été relevé"""
+
+from datetime import datetime
+from domain.trainer.value_objects import RequestId, SkillId, SkillLevel
+
+
+class SkillLevelUpgraded:
+
+    def __init__(
+        self,
+        request_id: RequestId,
+        skill_id: SkillId,
+        new_level: SkillLevel,
+        occurred_on: datetime = None
+    ):
+        self.request_id = request_id
+        self.skill_id = skill_id
+        self.new_level = new_level
+        self.occurred_on = occurred_on or datetime.now()
+
+    def __repr__(self) -> str:
+        return (
+            f"SkillLevelUpgraded("
+            f"request_id={self.request_id}, "
+            f"skill_id={self.skill_id}, "
+            f"new_level={self.new_level}, "
+            f"occurred_on={self.occurred_on})"
+        )
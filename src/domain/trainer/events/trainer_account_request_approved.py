@@ -0,0 +1,22 @@
+"""Event: La demande de compte formateur a été approuvée"""
+
+from datetime import datetime
+from domain.trainer.value_objects import RequestId
+
+
+class TrainerAccountRequestApproved:
+
+    def __init__(
+        self,
+        request_id: RequestId,
+        occurred_on: datetime = None
+    ):
+        self.request_id = request_id
+        self.occurred_on = occurred_on or datetime.now()
+
+    def __repr__(self) -> str:
+        return (
+            f"TrainerAccountRequestApproved("
+            f"request_id={self.request_id}, "
+            f"occurred_on={self.occurred_on})"
+        )
@@ -1,7 +1,18 @@
 """Event: La demande de compte formateur a été soumise"""
 
 from datetime import datetime
-from domain.trainer.value_objects import RequestId, Email
+from typing import Optional, Tuple
+from domain.trainer.value_objects import (
+    RequestId,
+    Email,
+    CandidatInfo,
+    SkillId,
+    SkillName,
+    SkillLevel,
+)
+
+# (id, name, level) of a skill as submitted: entities change later, the event must not
+SubmittedSkill = Tuple[SkillId, SkillName, SkillLevel]
 
 
 class TrainerAccountRequestSubmitted:
@@ -10,11 +21,15 @@ class TrainerAccountRequestSubmitted:
         self,
         request_id: RequestId,
         candidate_email: Email,
-        occurred_on: datetime = None
+        occurred_on: datetime = None,
+        candidate_info: Optional[CandidatInfo] = None,
+        skills: Tuple[SubmittedSkill, ...] = ()
     ):
         self.request_id = request_id
         self.candidate_email = candidate_email
         self.occurred_on = occurred_on or datetime.now()
+        self.candidate_info = candidate_info
+        self.skills = tuple(skills)
 
     def __repr__(self) -> str:
         return (
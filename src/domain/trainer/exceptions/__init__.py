@@ -4,10 +4,16 @@ from .trainer_account_request_exception import TrainerAccountRequestException
 from .required_skills_exception import RequiredSkillsException
 from .email_already_used_exception import EmailAlreadyUsedException
 from .skill_cannot_downgrade_exception import SkillCannotDowngradeException
+from .invalid_status_transition_exception import InvalidStatusTransitionException
+from .skill_not_found_exception import SkillNotFoundException
+from .concurrent_modification_exception import ConcurrentModificationException
 
 __all__ = [
     'TrainerAccountRequestException',
     'RequiredSkillsException',
     'EmailAlreadyUsedException',
     'SkillCannotDowngradeException',
+    'InvalidStatusTransitionException',
+    'SkillNotFoundException',
+    'ConcurrentModificationException',
 ]
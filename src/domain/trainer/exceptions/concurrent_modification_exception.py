@@ -0,0 +1,15 @@
+"""Exception : la demande a été modifiée par ailleurs depuis son chargement"""
+
+from .trainer_account_request_exception import TrainerAccountRequestException
+
+
+class ConcurrentModificationException(TrainerAccountRequestException):
+
+    def __init__(self, request_id: str, expected_version: int, actual_version: int):
+        super().__init__(
+            f"Request {request_id} was modified concurrently: "
+            f"expected version {expected_version}, found {actual_version}"
+        )
+        self.request_id = request_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
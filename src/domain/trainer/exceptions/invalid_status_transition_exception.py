@@ -0,0 +1,14 @@
+"""Exception : transition de statut interdite pour la demande"""
+
+from .trainer_account_request_exception import TrainerAccountRequestException
+from ..value_objects.request_status import RequestStatus
+
+
+class InvalidStatusTransitionException(TrainerAccountRequestException):
+
+    def __init__(self, current: RequestStatus, target: RequestStatus):
+        super().__init__(
+            f"Cannot change request status from {current} to {target}"
+        )
+        self.current = current
+        self.target = target
@@ -0,0 +1,11 @@
+"""Exception : la compétence n'appartient pas à la demande"""
+
+from domain.trainer.exceptions import TrainerAccountRequestException
+from ..value_objects.skill_id import SkillId
+
+
+class SkillNotFoundException(TrainerAccountRequestException):
+
+    def __init__(self, skill_id: SkillId):
+        super().__init__(f"Skill {skill_id} is not part of this request")
+        self.skill_id = skill_id
@@ -1,6 +1,13 @@
 """Interface Repository pour le domaine formateur"""
 
+from .request_page import RequestPage, PageCursor
 from .trainer_account_request_repository import TrainerAccountRequestRepositoryInterface
+from .async_trainer_account_request_repository import AsyncTrainerAccountRequestRepository
 
 
-__all__ = ['TrainerAccountRequestRepositoryInterface']
+__all__ = [
+    'TrainerAccountRequestRepositoryInterface',
+    'AsyncTrainerAccountRequestRepository',
+    'RequestPage',
+    'PageCursor',
+]
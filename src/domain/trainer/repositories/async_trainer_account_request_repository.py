@@ -0,0 +1,103 @@
+"""Interface Repository asynchrone pour l'agrégat du formateur"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterable, List, Optional, Set
+
+from domain.trainer.value_objects import RequestId, Email, RequestStatus
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories.request_page import RequestPage, PageCursor
+
+
+class AsyncTrainerAccountRequestRepository(ABC):
+    """asyncio counterpart of TrainerAccountRequestRepositoryInterface, method for method"""
+
+    @abstractmethod
+    async def save(self, request: TrainerAccountRequest) -> None:
+        pass
+
+    @abstractmethod
+    async def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        pass
+
+    @abstractmethod
+    async def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        pass
+
+    @abstractmethod
+    async def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        pass
+
+    @abstractmethod
+    async def exists_by_email(self, email: Email) -> bool:
+        pass
+
+    @abstractmethod
+    async def delete(self, request: TrainerAccountRequest) -> None:
+        pass
+
+    @abstractmethod
+    async def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        pass
+
+    @abstractmethod
+    async def release_email(self, email: Email, request_id: RequestId) -> None:
+        pass
+
+    # compteurs
+    async def count_by_status(self, status: RequestStatus) -> int:
+        return len(await self.find_by_status(status))
+
+    async def count_all(self) -> int:
+        total = 0
+        for status in RequestStatus.Status:
+            total += await self.count_by_status(RequestStatus(status.value))
+        return total
+
+    # opérations par lot
+    async def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        for request in requests:
+            await self.save(request)
+
+    async def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        """Found requests in input order; unknown ids are skipped"""
+        found = [await self.find(request_id) for request_id in request_ids]
+        return [request for request in found if request is not None]
+
+    async def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        """The given emails that are already used"""
+        return {email for email in set(emails) if await self.exists_by_email(email)}
+
+    # réservation d'email
+    async def save_if_email_unused(self, request: TrainerAccountRequest) -> bool:
+        try:
+            await self.save(request)
+        except EmailAlreadyUsedException:
+            return False
+        return True
+
+    # lecture paginée
+    async def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        requests = sorted(await self.find_by_status(status), key=RequestPage.cursor_of)
+        if after_cursor is not None:
+            requests = [request for request in requests if RequestPage.cursor_of(request) > after_cursor]
+        return RequestPage.of(requests[:limit], limit)
+
+    async def iter_by_status(self, status: RequestStatus, batch_size: int = 500) -> AsyncIterator[TrainerAccountRequest]:
+        cursor = None
+        while True:
+            page = await self.find_by_status_page(status, cursor, batch_size)
+            for request in page:
+                yield request
+            if not page.has_next:
+                return
+            cursor = page.next_cursor
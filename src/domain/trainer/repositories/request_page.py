@@ -0,0 +1,47 @@
+"""Page de demandes pour la pagination par clé (keyset)"""
+
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+
+# position of a request in the (submission_date, request id) order
+PageCursor = Tuple[datetime, str]
+
+
+class RequestPage:
+
+    def __init__(self, requests: List[TrainerAccountRequest], next_cursor: Optional[PageCursor]):
+        self._requests = requests
+        self._next_cursor = next_cursor
+
+    @staticmethod
+    def cursor_of(request: TrainerAccountRequest) -> PageCursor:
+        return (request.submission_date, request.id.value)
+
+    @staticmethod
+    def of(requests: List[TrainerAccountRequest], limit: int) -> 'RequestPage':
+        """A full page gets a cursor to the next one; a short page is the last one"""
+        next_cursor = RequestPage.cursor_of(requests[-1]) if requests and len(requests) >= limit else None
+        return RequestPage(requests, next_cursor)
+
+    @property
+    def requests(self) -> List[TrainerAccountRequest]:
+        return self._requests
+
+    @property
+    def next_cursor(self) -> Optional[PageCursor]:
+        return self._next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self._next_cursor is not None
+
+    def __iter__(self) -> Iterator[TrainerAccountRequest]:
+        return iter(self._requests)
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def __repr__(self) -> str:
+        return f"RequestPage(requests={len(self._requests)}, next_cursor={self._next_cursor!r})"
@@ -1,10 +1,12 @@
 """Interface Repository pour l'agrégat du formateur"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Set
 
 from domain.trainer.value_objects import RequestId, Email, RequestStatus
 from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories.request_page import RequestPage, PageCursor
 
 
 class TrainerAccountRequestRepositoryInterface(ABC):
@@ -37,3 +39,71 @@ class TrainerAccountRequestRepositoryInterface(ABC):
     def delete(self, request: TrainerAccountRequest) -> None:
         pass
 
+    @abstractmethod
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        """Claim the email for `request_id` until its request is saved, the email released or the reservation expired"""
+        pass
+
+    @abstractmethod
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        pass
+
+    # compteurs : les implémentations les maintiennent à l'écriture plutôt que de parcourir
+    def count_by_status(self, status: RequestStatus) -> int:
+        return len(self.find_by_status(status))
+
+    def count_all(self) -> int:
+        return sum(
+            self.count_by_status(RequestStatus(status.value))
+            for status in RequestStatus.Status
+        )
+
+    # opérations par lot : implémentations par défaut, à optimiser par backend
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        for request in requests:
+            self.save(request)
+
+    def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        """Found requests in input order; unknown ids are skipped"""
+        found = (self.find(request_id) for request_id in request_ids)
+        return [request for request in found if request is not None]
+
+    def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        """The given emails that are already used"""
+        return {email for email in set(emails) if self.exists_by_email(email)}
+
+    # réservation d'email : atomique dans les implémentations concurrentes
+    def save_if_email_unused(self, request: TrainerAccountRequest) -> bool:
+        """Save unless another request uses or has reserved the email; False when refused"""
+        try:
+            self.save(request)
+        except EmailAlreadyUsedException:
+            return False
+        return True
+
+    # lecture paginée : ordre (submission_date, id), mémoire bornée par la taille de page
+    def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        requests = sorted(self.find_by_status(status), key=RequestPage.cursor_of)
+        if after_cursor is not None:
+            requests = [request for request in requests if RequestPage.cursor_of(request) > after_cursor]
+        return RequestPage.of(requests[:limit], limit)
+
+    def iter_by_status(self, status: RequestStatus, batch_size: int = 500) -> Iterator[TrainerAccountRequest]:
+        cursor = None
+        while True:
+            page = self.find_by_status_page(status, cursor, batch_size)
+            yield from page
+            if not page.has_next:
+                return
+            cursor = page.next_cursor
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        """Every stored email, in no particular order; implementations read them without building aggregates"""
+        for status in RequestStatus.Status:
+            for request in self.iter_by_status(RequestStatus(status.value), batch_size):
+                yield request.candidate_info.email
@@ -1,6 +1,7 @@
 """Service Domaine pour le domaine Formateur"""
 
 from .verify_email_uniqueness import VerifyEmailUniqueness
+from .async_verify_email_uniqueness import AsyncVerifyEmailUniqueness
 
 
-__all__ = ['VerifyEmailUniqueness']
+__all__ = ['VerifyEmailUniqueness', 'AsyncVerifyEmailUniqueness']
@@ -0,0 +1,39 @@
+"""Domaine service asynchrone : vérifier l'unicité de l'email"""
+
+from typing import Dict, Iterable, List, Sequence
+
+from domain.trainer.exceptions.email_already_used_exception import EmailAlreadyUsedException
+from domain.trainer.value_objects import Email
+from domain.trainer.repositories import AsyncTrainerAccountRequestRepository
+
+
+class AsyncVerifyEmailUniqueness:
+
+    def __init__(
+        self,
+        request_repository: AsyncTrainerAccountRequestRepository
+    ):
+        self._request_repository = request_repository
+
+    async def execute(self, email: Email) -> None:
+        if await self._request_repository.exists_by_email(email):
+            raise EmailAlreadyUsedException(email)
+
+    async def is_available(self, email: Email) -> bool:
+        return not await self._request_repository.exists_by_email(email)
+
+    async def availability_map(self, emails: Iterable[Email]) -> Dict[Email, bool]:
+        """Email -> True when no request uses it yet, in one repository query"""
+        unique = dict.fromkeys(emails)
+        used = await self._request_repository.exists_by_emails(unique)
+        return {email: email not in used for email in unique}
+
+    async def execute_many(self, emails: Sequence[Email]) -> List[bool]:
+        """Availability of each email, in input order; a repeated email is only available once"""
+        availability = await self.availability_map(emails)
+        seen = set()
+        results = []
+        for email in emails:
+            results.append(availability[email] and email not in seen)
+            seen.add(email)
+        return results
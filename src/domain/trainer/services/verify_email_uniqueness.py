@@ -1,5 +1,7 @@
 """Domaine service: Vérifier l'unicité de l'email pour les demandes de compte formateur"""
 
+from typing import Dict, Iterable, List, Sequence
+
 from domain.trainer.exceptions.email_already_used_exception import EmailAlreadyUsedException
 from domain.trainer.value_objects import Email
 from domain.trainer.repositories import TrainerAccountRequestRepositoryInterface
@@ -18,8 +20,23 @@ class VerifyEmailUniqueness:
             raise EmailAlreadyUsedException(email)
 
     def is_available(self, email: Email) -> bool:
-        try:
-            self.execute(email)
-            return True
-        except EmailAlreadyUsedException:
-            return False
+        return not self._request_repository.exists_by_email(email)
+
+    def availability_map(self, emails: Iterable[Email]) -> Dict[Email, bool]:
+        """Email -> True when no request uses it yet, in one repository query"""
+        unique = dict.fromkeys(emails)
+        used = self._request_repository.exists_by_emails(unique)
+        return {email: email not in used for email in unique}
+
+    def execute_many(self, emails: Sequence[Email]) -> List[bool]:
+        """Availability of each email, in input order.
+
+        An email repeated in the batch is only available at its first occurrence.
+        """
+        availability = self.availability_map(emails)
+        seen = set()
+        results = []
+        for email in emails:
+            results.append(availability[email] and email not in seen)
+            seen.add(email)
+        return results
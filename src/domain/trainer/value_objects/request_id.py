@@ -21,7 +21,8 @@ class RequestId(ValueObject):
 
     @staticmethod
     def generate() -> 'RequestId':
-        return RequestId(str(uuid.uuid4()))
+        # uuid4() is valid and canonical by construction: no need to parse it back
+        return RequestId._from_trusted(str(uuid.uuid4()))
 
     @staticmethod
     def from_string(value: str) -> 'RequestId':
@@ -1,10 +1,12 @@
 """RequestStatus Value object - status de la demande"""
 
 from enum import Enum
+from typing import Dict
 from domain.shared import ValueObject
 
 
 class RequestStatus(ValueObject):
+    """Interned: there is exactly one instance per status, so equality is identity."""
 
     __slots__ = ('_status',)
 
@@ -19,13 +21,33 @@ class RequestStatus(ValueObject):
         Status.REJECTED: [],
     }
 
-    def __init__(self, status: str):
+    # accepted spellings -> instance, filled below the class
+    _INSTANCES: Dict[str, 'RequestStatus'] = {}
+
+    def __new__(cls, status: str) -> 'RequestStatus':
+        try:
+            instance = cls._INSTANCES.get(status)
+        except TypeError:  # unhashable, so not a valid status either
+            instance = None
+        if instance is not None:
+            return instance
         try:
-            status_enum = self.Status[status.upper()]
-        except KeyError:
-            valid = [s.name for s in self.Status]
+            status_enum = cls.Status[status.upper()]
+        except (KeyError, AttributeError):
+            valid = [s.name for s in cls.Status]
             raise ValueError(f"'{status}' is invalid. Must be one of {valid}")
-        object.__setattr__(self, '_status', status_enum)
+        return cls._INSTANCES[status_enum.value]
+
+    @classmethod
+    def _intern(cls, status_enum: 'RequestStatus.Status') -> None:
+        instance = super().__new__(cls)
+        object.__setattr__(instance, '_status', status_enum)
+        cls._INSTANCES[status_enum.value] = instance
+        cls._INSTANCES[status_enum.value.lower()] = instance
+
+    @classmethod
+    def _from_trusted(cls, value: str) -> 'RequestStatus':
+        return cls._INSTANCES[value]
 
     @property
     def value(self) -> str:
@@ -33,15 +55,15 @@ class RequestStatus(ValueObject):
 
     @staticmethod
     def pending_validation() -> 'RequestStatus':
-        return RequestStatus('PENDING_VALIDATION')
+        return RequestStatus._INSTANCES['PENDING_VALIDATION']
 
     @staticmethod
     def approved() -> 'RequestStatus':
-        return RequestStatus('APPROVED')
+        return RequestStatus._INSTANCES['APPROVED']
 
     @staticmethod
     def rejected() -> 'RequestStatus':
-        return RequestStatus('REJECTED')
+        return RequestStatus._INSTANCES['REJECTED']
 
     def can_be_approved(self) -> bool:
         return self.Status.APPROVED in self.TRANSITIONS.get(self._status, [])
@@ -53,7 +75,21 @@ class RequestStatus(ValueObject):
         return len(self.TRANSITIONS.get(self._status, [])) == 0
 
     def equals(self, other: 'RequestStatus') -> bool:
-        return self == other
+        return self is other
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    __hash__ = ValueObject.__hash__
+
+    def __reduce__(self):
+        # unpickling and copying go through __new__ and get the interned instance back
+        return (RequestStatus, (self._status.value,))
 
     def __str__(self) -> str:
         return self._status.value
+
+
+for _status in RequestStatus.Status:
+    RequestStatus._intern(_status)
+del _status
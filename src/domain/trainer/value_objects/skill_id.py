@@ -20,7 +20,8 @@ class SkillId(ValueObject):
 
     @staticmethod
     def generate() -> 'SkillId':
-        return SkillId(str(uuid.uuid4()))
+        # uuid4() is valid and canonical by construction: no need to parse it back
+        return SkillId._from_trusted(str(uuid.uuid4()))
 
     def __str__(self) -> str:
         return self._value
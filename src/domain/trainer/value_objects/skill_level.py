@@ -1,24 +1,54 @@
 """SkillLevel Value object - niveau de compétence"""
 
 from enum import Enum
+from typing import Dict
 from domain.shared import ValueObject
 
 
 class SkillLevel(ValueObject):
-    __slots__ = ('_level',)
+    """Interned: there is exactly one instance per level, so equality is identity."""
+
+    __slots__ = ('_level', '_rank')
 
     class Level(Enum):
         BEGINNER = 'BEGINNER'
         INTERMEDIATE = 'INTERMEDIATE'
         EXPERT = 'EXPERT'
 
-    def __init__(self, level: str):
+    RANKS = {
+        Level.BEGINNER: 1,
+        Level.INTERMEDIATE: 2,
+        Level.EXPERT: 3,
+    }
+
+    # accepted spellings -> instance, filled below the class
+    _INSTANCES: Dict[str, 'SkillLevel'] = {}
+
+    def __new__(cls, level: str) -> 'SkillLevel':
         try:
-            level_enum = self.Level[level.upper()]
-        except KeyError:
-            valid = [l.name for l in self.Level]
+            instance = cls._INSTANCES.get(level)
+        except TypeError:  # unhashable, so not a valid level either
+            instance = None
+        if instance is not None:
+            return instance
+        try:
+            level_enum = cls.Level[level.upper()]
+        except (KeyError, AttributeError):
+            valid = [l.name for l in cls.Level]
             raise ValueError(f"'{level}' is invalid. Must be one of {valid}")
-        object.__setattr__(self, '_level', level_enum)
+        return cls._INSTANCES[level_enum.value]
+
+    @classmethod
+    def _intern(cls, level_enum: 'SkillLevel.Level') -> None:
+        instance = super().__new__(cls)
+        object.__setattr__(instance, '_level', level_enum)
+        object.__setattr__(instance, '_rank', cls.RANKS[level_enum])
+        cls._INSTANCES[level_enum.value] = instance
+        cls._INSTANCES[level_enum.value.lower()] = instance
+
+    @classmethod
+    def _from_trusted(cls, value: str) -> 'SkillLevel':
+        return cls._INSTANCES[value]
 
     @property
     def value(self) -> str:
@@ -26,23 +56,32 @@ class SkillLevel(ValueObject):
 
     @staticmethod
     def beginner() -> 'SkillLevel':
-        return SkillLevel('BEGINNER')
+        return SkillLevel._INSTANCES['BEGINNER']
 
     @staticmethod
     def intermediate() -> 'SkillLevel':
-        return SkillLevel('INTERMEDIATE')
+        return SkillLevel._INSTANCES['INTERMEDIATE']
 
     @staticmethod
     def expert() -> 'SkillLevel':
-        return SkillLevel('EXPERT')
+        return SkillLevel._INSTANCES['EXPERT']
 
     def is_at_least(self, other: 'SkillLevel') -> bool:
-        hierarchy = {
-            self.Level.BEGINNER: 1,
-            self.Level.INTERMEDIATE: 2,
-            self.Level.EXPERT: 3,
-        }
-        return hierarchy[self._level] >= hierarchy[other._level]
+        return self._rank >= other._rank
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    __hash__ = ValueObject.__hash__
+
+    def __reduce__(self):
+        # unpickling and copying go through __new__ and get the interned instance back
+        return (SkillLevel, (self._level.value,))
 
     def __str__(self) -> str:
         return self._level.value
+
+
+for _level in SkillLevel.Level:
+    SkillLevel._intern(_level)
+del _level
@@ -0,0 +1,5 @@
+"""Couche infrastructure"""
+
+from . import shared, monitoring, trainer, events
+
+__all__ = ['shared', 'monitoring', 'trainer', 'events']
@@ -0,0 +1,21 @@
+"""Distribution des événements domaine"""
+
+from .event_bus import EventBus
+from .async_event_bus import AsyncEventBus
+from .publish_after_save import save_and_publish, save_and_publish_async
+from .event_serializer import EventSerializer
+from .sqlite_outbox import SqliteOutbox, OutboxMessage
+from .outbox_relay import OutboxRelay
+from .sqlite_event_store import SqliteEventStore
+
+__all__ = [
+    'EventBus',
+    'AsyncEventBus',
+    'save_and_publish',
+    'save_and_publish_async',
+    'EventSerializer',
+    'SqliteOutbox',
+    'OutboxMessage',
+    'OutboxRelay',
+    'SqliteEventStore',
+]
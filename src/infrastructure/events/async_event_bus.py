@@ -0,0 +1,173 @@
+"""Bus d'événements domaine asynchrone, livraison par lots"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
+
+logger = logging.getLogger(__name__)
+
+# receives a batch of events; may be a coroutine function or a plain function
+BatchHandler = Callable[[List[Any]], Any]
+
+
+class _Subscription:
+
+    def __init__(self, event_type: Type, handler: BatchHandler, batch_size: int, max_delay: float, queue_size: int):
+        self.event_type = event_type
+        self.handler = handler
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.queue: 'asyncio.Queue[Any]' = asyncio.Queue(maxsize=queue_size)
+        self.is_coroutine = inspect.iscoroutinefunction(handler)
+        self.task: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.batches = 0
+        self.failed = 0
+
+
+class AsyncEventBus:
+
+    def __init__(self, batch_size: int = 100, max_delay: float = 0.05, queue_size: int = 10_000):
+        if batch_size < 1 or queue_size < 1:
+            raise ValueError("Batch size and queue size must be at least 1")
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._queue_size = queue_size
+        self._subscriptions: List[_Subscription] = []
+        self._subscriptions_by_type: Dict[Type, List[_Subscription]] = {}
+        self._running = False
+        self.published = 0
+
+    def subscribe(
+        self,
+        event_type: Type,
+        handler: BatchHandler,
+        batch_size: Optional[int] = None,
+        max_delay: Optional[float] = None,
+        queue_size: Optional[int] = None,
+    ) -> None:
+        if (batch_size is not None and batch_size < 1) or (queue_size is not None and queue_size < 1):
+            raise ValueError("Batch size and queue size must be at least 1")
+        subscription = _Subscription(
+            event_type,
+            handler,
+            self._batch_size if batch_size is None else batch_size,
+            self._max_delay if max_delay is None else max_delay,
+            self._queue_size if queue_size is None else queue_size,
+        )
+        self._subscriptions.append(subscription)
+        self._subscriptions_by_type.clear()
+        if self._running:
+            subscription.task = asyncio.create_task(self._work(subscription))
+
+    async def start(self) -> None:
+        self._running = True
+        for subscription in self._subscriptions:
+            if subscription.task is None:
+                subscription.task = asyncio.create_task(self._work(subscription))
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+        for subscription in self._subscriptions:
+            await subscription.queue.join()
+        for subscription in self._subscriptions:
+            if subscription.task is not None:
+                subscription.task.cancel()
+        await asyncio.gather(
+            *(s.task for s in self._subscriptions if s.task is not None),
+            return_exceptions=True,
+        )
+        for subscription in self._subscriptions:
+            subscription.task = None
+        self._running = False
+
+    async def __aenter__(self) -> 'AsyncEventBus':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def publish(self, event: Any) -> None:
+        self.published += 1
+        for subscription in self._subscriptions_for(type(event)):
+            queue = subscription.queue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                if not self._running:
+                    raise RuntimeError("Queue full and the bus is not started: nothing would make room") from None
+                await queue.put(event)
+
+    async def publish_all(self, events: Iterable[Any]) -> None:
+        for event in events:
+            await self.publish(event)
+
+    async def drain(self) -> None:
+        if not self._running:
+            if any(not s.queue.empty() for s in self._subscriptions):
+                raise RuntimeError("The bus is not started: queued events would never be handled")
+            return
+        for subscription in self._subscriptions:
+            await subscription.queue.join()
+
+    def stats(self) -> Dict[str, Union[int, List[Dict[str, Any]]]]:
+        return {
+            'published': self.published,
+            'subscriptions': [
+                {
+                    'event_type': s.event_type.__name__,
+                    'handler': getattr(s.handler, '__qualname__', repr(s.handler)),
+                    'queued': s.queue.qsize(),
+                    'delivered': s.delivered,
+                    'batches': s.batches,
+                    'failed': s.failed,
+                }
+                for s in self._subscriptions
+            ],
+        }
+
+    def _subscriptions_for(self, event_type: Type) -> List[_Subscription]:
+        subscriptions = self._subscriptions_by_type.get(event_type)
+        if subscriptions is None:
+            subscriptions = [s for s in self._subscriptions if issubclass(event_type, s.event_type)]
+            self._subscriptions_by_type[event_type] = subscriptions
+        return subscriptions
+
+    async def _work(self, subscription: _Subscription) -> None:
+        queue = subscription.queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + subscription.max_delay
+            while len(batch) < subscription.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._deliver(subscription, batch)
+            for _ in batch:
+                queue.task_done()
+
+    @staticmethod
+    async def _deliver(subscription: _Subscription, batch: List[Any]) -> None:
+        try:
+            if subscription.is_coroutine:
+                await subscription.handler(batch)
+            else:
+                await asyncio.to_thread(subscription.handler, batch)
+            subscription.delivered += len(batch)
+        except Exception:
+            subscription.failed += len(batch)
+            logger.exception("Handler %r failed on a batch of %d events", subscription.handler, len(batch))
+        subscription.batches += 1
@@ -0,0 +1,45 @@
+"""Bus d'événements domaine synchrone"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Type
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Any], None]
+
+
+class EventBus:
+
+    def __init__(self):
+        self._handlers: Dict[Type, List[Handler]] = {}
+        self._handlers_by_type: Dict[Type, List[Handler]] = {}
+        self.published = 0
+        self.failed = 0
+
+    def subscribe(self, event_type: Type, handler: Handler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._handlers_by_type.clear()
+
+    def publish(self, event: Any) -> None:
+        self.published += 1
+        for handler in self._handlers_for(type(event)):
+            try:
+                handler(event)
+            except Exception:
+                self.failed += 1
+                logger.exception("Handler %r failed on %r", handler, event)
+
+    def publish_all(self, events: Iterable[Any]) -> None:
+        for event in events:
+            self.publish(event)
+
+    def _handlers_for(self, event_type: Type) -> List[Handler]:
+        handlers = self._handlers_by_type.get(event_type)
+        if handlers is None:
+            handlers = [
+                handler
+                for klass in event_type.__mro__
+                for handler in self._handlers.get(klass, ())
+            ]
+            self._handlers_by_type[event_type] = handlers
+        return handlers
@@ -0,0 +1,118 @@
+"""Sérialisation JSON des événements domaine"""
+
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple, Type
+
+from domain.trainer.events import (
+    TrainerAccountRequestSubmitted,
+    TrainerAccountRequestApproved,
+    TrainerAccountRequestRejected,
+    SkillLevelUpgraded,
+)
+from domain.trainer.value_objects import (
+    RequestId,
+    Email,
+    FullName,
+    CandidatInfo,
+    SkillId,
+    SkillName,
+    SkillLevel,
+)
+
+ToPayload = Callable[[Any], Dict[str, Any]]
+FromPayload = Callable[[Dict[str, Any]], Any]
+
+
+class EventSerializer:
+
+    def __init__(self):
+        self._by_type: Dict[Type, Tuple[str, ToPayload]] = {}
+        self._by_name: Dict[str, FromPayload] = {}
+
+    @staticmethod
+    def default() -> 'EventSerializer':
+        serializer = EventSerializer()
+        serializer.register(TrainerAccountRequestSubmitted, _submitted_payload, _submitted_event)
+        serializer.register(
+            TrainerAccountRequestApproved,
+            lambda event: {'request_id': event.request_id.value, 'occurred_on': event.occurred_on.isoformat()},
+            lambda payload: TrainerAccountRequestApproved(
+                request_id=RequestId(payload['request_id']),
+                occurred_on=datetime.fromisoformat(payload['occurred_on']),
+            ),
+        )
+        serializer.register(
+            TrainerAccountRequestRejected,
+            lambda event: {'request_id': event.request_id.value, 'occurred_on': event.occurred_on.isoformat()},
+            lambda payload: TrainerAccountRequestRejected(
+                request_id=RequestId(payload['request_id']),
+                occurred_on=datetime.fromisoformat(payload['occurred_on']),
+            ),
+        )
+        serializer.register(
+            SkillLevelUpgraded,
+            lambda event: {
+                'request_id': event.request_id.value,
+                'skill_id': event.skill_id.value,
+                'new_level': event.new_level.value,
+                'occurred_on': event.occurred_on.isoformat(),
+            },
+            lambda payload: SkillLevelUpgraded(
+                request_id=RequestId(payload['request_id']),
+                skill_id=SkillId(payload['skill_id']),
+                new_level=SkillLevel(payload['new_level']),
+                occurred_on=datetime.fromisoformat(payload['occurred_on']),
+            ),
+        )
+        return serializer
+
+    def register(self, event_type: Type, to_payload: ToPayload, from_payload: FromPayload) -> None:
+        name = event_type.__name__
+        self._by_type[event_type] = (name, to_payload)
+        self._by_name[name] = from_payload
+
+    def serialize(self, event: Any) -> Tuple[str, str]:
+        try:
+            name, to_payload = self._by_type[type(event)]
+        except KeyError:
+            raise ValueError(f"No serializer registered for {type(event).__name__}") from None
+        return name, json.dumps(to_payload(event), separators=(',', ':'))
+
+    def deserialize(self, name: str, payload: str) -> Any:
+        try:
+            from_payload = self._by_name[name]
+        except KeyError:
+            raise ValueError(f"No serializer registered for {name}") from None
+        return from_payload(json.loads(payload))
+
+
+def _submitted_payload(event: TrainerAccountRequestSubmitted) -> Dict[str, Any]:
+    payload = {
+        'request_id': event.request_id.value,
+        'candidate_email': event.candidate_email.value,
+        'occurred_on': event.occurred_on.isoformat(),
+    }
+    if event.candidate_info is not None:
+        payload['first_name'] = event.candidate_info.full_name.first_name
+        payload['last_name'] = event.candidate_info.full_name.last_name
+    if event.skills:
+        payload['skills'] = [[skill_id.value, name.value, level.value] for skill_id, name, level in event.skills]
+    return payload
+
+
+def _submitted_event(payload: Dict[str, Any]) -> TrainerAccountRequestSubmitted:
+    email = Email(payload['candidate_email'])
+    candidate_info = None
+    if 'first_name' in payload:
+        candidate_info = CandidatInfo(FullName(payload['first_name'], payload['last_name']), email)
+    return TrainerAccountRequestSubmitted(
+        request_id=RequestId(payload['request_id']),
+        candidate_email=email,
+        occurred_on=datetime.fromisoformat(payload['occurred_on']),
+        candidate_info=candidate_info,
+        skills=tuple(
+            (SkillId(skill_id), SkillName(name), SkillLevel(level))
+            for skill_id, name, level in payload.get('skills', ())
+        ),
+    )
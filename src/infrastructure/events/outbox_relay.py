@@ -0,0 +1,91 @@
+"""Relais de l'outbox : publie les événements enregistrés, par lots"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from infrastructure.events.sqlite_outbox import SqliteOutbox
+
+logger = logging.getLogger(__name__)
+
+Publisher = Callable[[List[Any]], Any]
+
+
+class OutboxRelay:
+
+    def __init__(
+        self,
+        outbox: SqliteOutbox,
+        publish: Publisher,
+        consumer: str = 'relay',
+        batch_size: int = 100,
+    ):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self._outbox = outbox
+        self._publish = publish
+        self._consumer = consumer
+        self._batch_size = batch_size
+        self._position = outbox.offset(consumer)
+        self._delivered = 0
+        self._batches = 0
+        self._failures = 0
+        self._busy_seconds = 0.0
+        self._last_lag_seconds = 0.0
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    def drain_once(self) -> int:
+        messages = self._outbox.read_after(self._position, self._batch_size)
+        if not messages:
+            return 0
+        start = time.perf_counter()
+        try:
+            self._publish([message.event for message in messages])
+        except Exception:
+            self._failures += 1
+            logger.exception("Publishing outbox events after position %d failed", self._position)
+            raise
+        finally:
+            self._busy_seconds += time.perf_counter() - start
+        last = messages[-1].position
+        self._outbox.commit_offset(self._consumer, last)
+        self._position = last
+        self._delivered += len(messages)
+        self._batches += 1
+        self._last_lag_seconds = time.time() - messages[0].recorded_at
+        return len(messages)
+
+    def drain(self) -> int:
+        total = 0
+        while True:
+            published = self.drain_once()
+            if not published:
+                return total
+            total += published
+
+    def run(self, stop: threading.Event, poll_interval: float = 0.1, retry_interval: float = 1.0) -> None:
+        while not stop.is_set():
+            try:
+                published = self.drain_once()
+            except Exception:
+                stop.wait(retry_interval)
+                continue
+            if published < self._batch_size:
+                stop.wait(poll_interval)
+
+    def stats(self) -> Dict[str, Union[int, float, Optional[float]]]:
+        oldest = self._outbox.oldest_pending_recorded_at(self._consumer)
+        return {
+            'position': self._position,
+            'delivered': self._delivered,
+            'batches': self._batches,
+            'failures': self._failures,
+            'events_per_second': self._delivered / self._busy_seconds if self._busy_seconds else 0.0,
+            'lag_events': self._outbox.pending_count(self._consumer),
+            'lag_seconds': time.time() - oldest if oldest is not None else 0.0,
+            'last_batch_lag_seconds': self._last_lag_seconds,
+        }
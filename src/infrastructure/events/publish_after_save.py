@@ -0,0 +1,45 @@
+"""Enregistrer un agrégat puis publier ses événements"""
+
+import asyncio
+from typing import Iterable, Union
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    AsyncTrainerAccountRequestRepository,
+)
+from infrastructure.events.async_event_bus import AsyncEventBus
+from infrastructure.events.event_bus import EventBus
+
+
+def save_and_publish(
+    repository: TrainerAccountRequestRepositoryInterface,
+    requests: Iterable[TrainerAccountRequest],
+    bus: EventBus,
+) -> None:
+    requests = list(requests)
+    if len(requests) == 1:
+        repository.save(requests[0])
+    else:
+        repository.save_many(requests)
+    for request in requests:
+        bus.publish_all(request.pull_events())
+
+
+async def save_and_publish_async(
+    repository: Union[AsyncTrainerAccountRequestRepository, TrainerAccountRequestRepositoryInterface],
+    requests: Iterable[TrainerAccountRequest],
+    bus: AsyncEventBus,
+) -> None:
+    requests = list(requests)
+    if isinstance(repository, AsyncTrainerAccountRequestRepository):
+        if len(requests) == 1:
+            await repository.save(requests[0])
+        else:
+            await repository.save_many(requests)
+    elif len(requests) == 1:
+        await asyncio.to_thread(repository.save, requests[0])
+    else:
+        await asyncio.to_thread(repository.save_many, requests)
+    for request in requests:
+        await bus.publish_all(request.pull_events())
@@ -0,0 +1,123 @@
+"""Event store SQLite : flux d'événements en ajout seul, avec snapshots"""
+
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from infrastructure.events.event_serializer import EventSerializer
+from infrastructure.shared import SqliteConnectionPool
+
+StoredEvent = Tuple[int, Any]
+
+
+class SqliteEventStore:
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS event_store (
+            stream_id TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            event_type TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            recorded_at REAL NOT NULL,
+            PRIMARY KEY (stream_id, version)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS event_store_snapshots (
+            stream_id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            state TEXT NOT NULL
+        )
+        """,
+    )
+
+    _INSERT_EVENT = """
+        INSERT INTO event_store (stream_id, version, event_type, payload, recorded_at)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    _SELECT_VERSION = "SELECT MAX(version) FROM event_store WHERE stream_id = ?"
+    _SELECT_EVENTS = """
+        SELECT version, event_type, payload FROM event_store
+        WHERE stream_id = ? AND version > ? ORDER BY version
+    """
+    _UPSERT_SNAPSHOT = """
+        INSERT INTO event_store_snapshots (stream_id, version, state) VALUES (?, ?, ?)
+        ON CONFLICT (stream_id) DO UPDATE SET version = excluded.version, state = excluded.state
+        WHERE excluded.version > event_store_snapshots.version
+    """
+    _SELECT_SNAPSHOT = "SELECT version, state FROM event_store_snapshots WHERE stream_id = ?"
+
+    def __init__(self, pool: SqliteConnectionPool, serializer: Optional[EventSerializer] = None):
+        self._pool = pool
+        self._serializer = serializer or EventSerializer.default()
+        with self._pool.transaction() as connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+    @property
+    def pool(self) -> SqliteConnectionPool:
+        return self._pool
+
+    def append(
+        self,
+        connection: sqlite3.Connection,
+        stream_id: str,
+        expected_version: int,
+        events: Iterable[Any],
+    ) -> int:
+        recorded_at = time.time()
+        serialize = self._serializer.serialize
+        rows = [
+            (stream_id, version, *serialize(event), recorded_at)
+            for version, event in enumerate(events, start=expected_version + 1)
+        ]
+        connection.executemany(self._INSERT_EVENT, rows)
+        return expected_version + len(rows)
+
+    def version(self, stream_id: str, connection: Optional[sqlite3.Connection] = None) -> int:
+        if connection is None:
+            with self._pool.connection() as connection:
+                return self.version(stream_id, connection)
+        return connection.execute(self._SELECT_VERSION, (stream_id,)).fetchone()[0] or 0
+
+    def read(
+        self,
+        stream_id: str,
+        after_version: int = 0,
+        connection: Optional[sqlite3.Connection] = None,
+    ) -> List[StoredEvent]:
+        if connection is None:
+            with self._pool.connection() as connection:
+                return self.read(stream_id, after_version, connection)
+        deserialize = self._serializer.deserialize
+        return [
+            (version, deserialize(event_type, payload))
+            for version, event_type, payload
+            in connection.execute(self._SELECT_EVENTS, (stream_id, after_version))
+        ]
+
+    def save_snapshot(
+        self,
+        connection: sqlite3.Connection,
+        stream_id: str,
+        version: int,
+        state: Dict[str, Any],
+    ) -> None:
+        connection.execute(self._UPSERT_SNAPSHOT, (stream_id, version, json.dumps(state, separators=(',', ':'))))
+
+    def load_snapshot(
+        self,
+        stream_id: str,
+        connection: Optional[sqlite3.Connection] = None,
+    ) -> Optional[Tuple[int, Dict[str, Any]]]:
+        if connection is None:
+            with self._pool.connection() as connection:
+                return self.load_snapshot(stream_id, connection)
+        row = connection.execute(self._SELECT_SNAPSHOT, (stream_id,)).fetchone()
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    def clear(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM event_store")
+        connection.execute("DELETE FROM event_store_snapshots")
@@ -0,0 +1,111 @@
+"""Outbox transactionnelle SQLite pour les événements domaine"""
+
+import sqlite3
+import time
+from typing import Any, Iterable, List, Optional
+
+from infrastructure.events.event_serializer import EventSerializer
+from infrastructure.shared import SqliteConnectionPool
+
+
+class OutboxMessage:
+
+    __slots__ = ('position', 'aggregate_id', 'event', 'recorded_at')
+
+    def __init__(self, position: int, aggregate_id: str, event: Any, recorded_at: float):
+        self.position = position
+        self.aggregate_id = aggregate_id
+        self.event = event
+        self.recorded_at = recorded_at
+
+    def __repr__(self) -> str:
+        return f"OutboxMessage(position={self.position}, aggregate_id={self.aggregate_id!r}, event={self.event!r})"
+
+
+class SqliteOutbox:
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS outbox_events (
+            position INTEGER PRIMARY KEY AUTOINCREMENT,
+            aggregate_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            recorded_at REAL NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS outbox_offsets (
+            consumer TEXT PRIMARY KEY,
+            position INTEGER NOT NULL
+        )
+        """,
+    )
+
+    _INSERT_EVENT = """
+        INSERT INTO outbox_events (aggregate_id, event_type, payload, recorded_at)
+        VALUES (?, ?, ?, ?)
+    """
+    _SELECT_AFTER = """
+        SELECT position, aggregate_id, event_type, payload, recorded_at
+        FROM outbox_events WHERE position > ? ORDER BY position LIMIT ?
+    """
+    _SELECT_OFFSET = "SELECT position FROM outbox_offsets WHERE consumer = ?"
+    _UPSERT_OFFSET = """
+        INSERT INTO outbox_offsets (consumer, position) VALUES (?, ?)
+        ON CONFLICT (consumer) DO UPDATE SET position = MAX(position, excluded.position)
+    """
+    _COUNT_AFTER = "SELECT COUNT(*) FROM outbox_events WHERE position > ?"
+    _OLDEST_AFTER = "SELECT MIN(recorded_at) FROM outbox_events WHERE position > ?"
+    _PURGE = "DELETE FROM outbox_events WHERE position <= (SELECT MIN(position) FROM outbox_offsets)"
+
+    def __init__(self, pool: SqliteConnectionPool, serializer: Optional[EventSerializer] = None):
+        self._pool = pool
+        self._serializer = serializer or EventSerializer.default()
+        with self._pool.transaction() as connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+    @property
+    def pool(self) -> SqliteConnectionPool:
+        return self._pool
+
+    def append(self, connection: sqlite3.Connection, aggregate_id: str, events: Iterable[Any]) -> None:
+        """À appeler dans la transaction qui enregistre l'agrégat"""
+        recorded_at = time.time()
+        serialize = self._serializer.serialize
+        connection.executemany(self._INSERT_EVENT, [
+            (aggregate_id, *serialize(event), recorded_at) for event in events
+        ])
+
+    def read_after(self, position: int, limit: int = 100) -> List[OutboxMessage]:
+        with self._pool.connection() as connection:
+            rows = connection.execute(self._SELECT_AFTER, (position, limit)).fetchall()
+        deserialize = self._serializer.deserialize
+        return [
+            OutboxMessage(position, aggregate_id, deserialize(event_type, payload), recorded_at)
+            for position, aggregate_id, event_type, payload, recorded_at in rows
+        ]
+
+    def offset(self, consumer: str) -> int:
+        with self._pool.connection() as connection:
+            row = connection.execute(self._SELECT_OFFSET, (consumer,)).fetchone()
+        return row[0] if row is not None else 0
+
+    def commit_offset(self, consumer: str, position: int) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(self._UPSERT_OFFSET, (consumer, position))
+
+    def pending_count(self, consumer: str) -> int:
+        offset = self.offset(consumer)
+        with self._pool.connection() as connection:
+            return connection.execute(self._COUNT_AFTER, (offset,)).fetchone()[0]
+
+    def oldest_pending_recorded_at(self, consumer: str) -> Optional[float]:
+        offset = self.offset(consumer)
+        with self._pool.connection() as connection:
+            return connection.execute(self._OLDEST_AFTER, (offset,)).fetchone()[0]
+
+    def purge(self) -> int:
+        with self._pool.transaction() as connection:
+            return connection.execute(self._PURGE).rowcount
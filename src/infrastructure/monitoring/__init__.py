@@ -0,0 +1,17 @@
+"""Observabilité : métriques et traces"""
+
+from .counter import Counter
+from .histogram import Histogram
+from .instrumented import instrumented
+from .metrics_registry import MetricsRegistry
+from .span import Span
+from .tracer import Tracer
+
+__all__ = [
+    'Counter',
+    'Histogram',
+    'MetricsRegistry',
+    'instrumented',
+    'Span',
+    'Tracer',
+]
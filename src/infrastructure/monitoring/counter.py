@@ -0,0 +1,27 @@
+"""Compteur monotone thread-safe"""
+
+import threading
+
+
+class Counter:
+
+    __slots__ = ('name', '_value', '_lock')
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        if amount < 0:
+            raise ValueError("A counter can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0
@@ -0,0 +1,76 @@
+"""Histogramme de latences : totaux cumulés et percentiles sur une fenêtre récente"""
+
+import math
+import threading
+from typing import Dict, List
+
+
+class Histogram:
+
+    __slots__ = ('name', '_window', '_recent', '_next', '_count', '_sum', '_min', '_max', '_lock')
+
+    QUANTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self, name: str, window: int = 1024):
+        if window < 1:
+            raise ValueError("The window must hold at least one observation")
+        self.name = name
+        self._window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            if len(self._recent) < self._window:
+                self._recent.append(value)
+            else:
+                self._recent[self._next] = value
+                self._next = (self._next + 1) % self._window
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def percentile(self, fraction: float) -> float:
+        if not 0.0 <= fraction <= 1.0:
+            raise ValueError("The fraction must be between 0 and 1")
+        with self._lock:
+            recent = sorted(self._recent)
+        return self._rank(recent, fraction)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            recent = sorted(self._recent)
+            count, total = self._count, self._sum
+            minimum, maximum = self._min, self._max
+        summary = {
+            'count': count,
+            'sum': total,
+            'min': minimum if count else 0.0,
+            'max': maximum if count else 0.0,
+            'mean': total / count if count else 0.0,
+        }
+        for quantile in self.QUANTILES:
+            summary[f'p{quantile * 100:g}'] = self._rank(recent, quantile)
+        return summary
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recent: List[float] = []
+            self._next = 0
+            self._count = 0
+            self._sum = 0.0
+            self._min = float('inf')
+            self._max = float('-inf')
+
+    @staticmethod
+    def _rank(values: List[float], fraction: float) -> float:
+        if not values:
+            return 0.0
+        return values[max(math.ceil(fraction * len(values)) - 1, 0)]
@@ -0,0 +1,30 @@
+"""Décorateur de méthodes : latence et erreurs de chaque appel dans un registre de métriques"""
+
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Type, TypeVar
+
+F = TypeVar('F', bound=Callable)
+
+
+def instrumented(*expected: Type[Exception]) -> Callable[[F], F]:
+    """Mesure chaque appel ; les exceptions hors `expected` comptent comme erreurs"""
+    def decorate(method: F) -> F:
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self._registry.enabled:
+                return method(self, *args, **kwargs)
+            start = perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            except expected:
+                raise
+            except Exception:
+                self._errors[name].inc()
+                raise
+            finally:
+                self._latency[name].observe(perf_counter() - start)
+        return wrapper
+    return decorate
@@ -0,0 +1,98 @@
+"""Registre de métriques : compteurs et histogrammes nommés, export texte et JSON"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .counter import Counter
+from .histogram import Histogram
+
+
+class MetricsRegistry:
+
+    def __init__(self, enabled: bool = True, window: int = 1024):
+        self.enabled = enabled
+        self._window = window
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> Counter:
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, Counter(name))
+        return counter
+
+    def histogram(self, name: str) -> Histogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram(name, self._window))
+        return histogram
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        histogram = self.histogram(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    def timed(self, name: Optional[str] = None) -> Callable[[Callable], Callable]:
+        def decorate(function: Callable) -> Callable:
+            histogram = self.histogram(name or f"{function.__module__}.{function.__qualname__}.seconds")
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'counters': {name: counter.value for name, counter in sorted(self._counters.items())},
+            'histograms': {name: histogram.snapshot() for name, histogram in sorted(self._histograms.items())},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def to_text(self) -> str:
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in snapshot['counters'].items():
+            metric = self._exposed_name(name)
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, summary in snapshot['histograms'].items():
+            metric = self._exposed_name(name)
+            lines.append(f"# TYPE {metric} summary")
+            for quantile in Histogram.QUANTILES:
+                lines.append(f'{metric}{{quantile="{quantile:g}"}} {summary[f"p{quantile * 100:g}"]:.9g}')
+            lines.append(f"{metric}_sum {summary['sum']:.9g}")
+            lines.append(f"{metric}_count {summary['count']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for counter in list(self._counters.values()):
+            counter.reset()
+        for histogram in list(self._histograms.values()):
+            histogram.reset()
+
+    @staticmethod
+    def _exposed_name(name: str) -> str:
+        return ''.join(character if character.isalnum() or character == '_' else '_' for character in name)
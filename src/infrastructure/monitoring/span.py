@@ -0,0 +1,57 @@
+"""Span : une étape chronométrée d'une trace, avec ses sous-étapes"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+
+class Span:
+
+    __slots__ = ('name', 'trace_id', 'parent', 'attributes', 'children', 'error', 'started_at', '_start', '_end')
+
+    def __init__(self, name: str, trace_id: str, parent: Optional['Span'], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.parent = parent
+        self.attributes = attributes
+        self.children: List['Span'] = []
+        self.error: Optional[str] = None
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self._end if self._end is not None else time.perf_counter()) - self._start
+
+    @property
+    def finished(self) -> bool:
+        return self._end is not None
+
+    def finish(self) -> None:
+        self._end = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'started_at': self.started_at,
+            'duration': self.duration,
+            'attributes': dict(self.attributes),
+            'error': self.error,
+            'children': [child.to_dict() for child in self.children],
+        }
+
+    def render(self) -> str:
+        lines: List[str] = []
+        self._render(lines, 0)
+        return "\n".join(lines)
+
+    def _render(self, lines: List[str], depth: int) -> None:
+        details = ''.join(f" {key}={value}" for key, value in self.attributes.items())
+        error = f" error={self.error}" if self.error else ''
+        lines.append(f"{'  ' * depth}{self.name} {self.duration * 1000:.3f} ms{details}{error}")
+        for child in self.children:
+            child._render(lines, depth + 1)
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, trace_id={self.trace_id!r}, duration={self.duration:.6f})"
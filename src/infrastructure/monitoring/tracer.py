@@ -0,0 +1,111 @@
+"""Traceur sans dépendance : spans imbriqués propagés par contextvars"""
+
+import itertools
+import logging
+import random
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, List, Optional
+
+from .span import Span
+
+logger = logging.getLogger(__name__)
+
+# marks the inside of an unsampled trace, so its nested spans are skipped too
+_NOT_SAMPLED = object()
+_SKIPPED = nullcontext()
+
+
+class _SpanScope:
+
+    __slots__ = ('_tracer', '_name', '_attributes', '_span', '_token')
+
+    def __init__(self, tracer: 'Tracer', name: str, attributes: dict):
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._span = None
+        self._token = None
+
+    def __enter__(self) -> Optional[Span]:
+        tracer = self._tracer
+        parent = tracer._current.get()
+        if parent is None:
+            if tracer.sample_rate < 1.0 and tracer._random() >= tracer.sample_rate:
+                self._token = tracer._current.set(_NOT_SAMPLED)
+                return None
+            trace_id = f"{next(tracer._trace_ids):x}-{tracer._random_bits(32):08x}"
+        else:
+            trace_id = parent.trace_id
+        span = Span(self._name, trace_id, parent, self._attributes)
+        if parent is not None:
+            parent.children.append(span)
+        self._span = span
+        self._token = tracer._current.set(span)
+        return span
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self._token is not None:
+            self._tracer._current.reset(self._token)
+        span = self._span
+        if span is None:
+            return
+        span.finish()
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        if span.parent is None:
+            self._tracer._finish_trace(span)
+
+
+class Tracer:
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        capacity: int = 100,
+        slow_threshold: Optional[float] = None,
+        on_slow: Optional[Callable[[Span], Any]] = None,
+        seed: Optional[int] = None,
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("The sample rate must be between 0 and 1")
+        if capacity < 1:
+            raise ValueError("The ring buffer must hold at least one trace")
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self._on_slow = on_slow or self._log_slow_trace
+        self._recent: deque = deque(maxlen=capacity)
+        self._current: ContextVar = ContextVar(f'current_span_{id(self)}', default=None)
+        generator = random.Random(seed)
+        self._random = generator.random
+        self._random_bits = generator.getrandbits
+        self._trace_ids = itertools.count(1)
+        self.traces = 0
+        self.slow_traces = 0
+
+    def span(self, name: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+        if self._current.get() is _NOT_SAMPLED:
+            return _SKIPPED
+        return _SpanScope(self, name, attributes)
+
+    def current_span(self) -> Optional[Span]:
+        span = self._current.get()
+        return None if span is _NOT_SAMPLED else span
+
+    def recent_traces(self) -> List[Span]:
+        return list(self._recent)
+
+    def clear(self) -> None:
+        self._recent.clear()
+
+    def _finish_trace(self, root: Span) -> None:
+        self._recent.append(root)
+        self.traces += 1
+        if self.slow_threshold is not None and root.duration >= self.slow_threshold:
+            self.slow_traces += 1
+            self._on_slow(root)
+
+    @staticmethod
+    def _log_slow_trace(root: Span) -> None:
+        logger.warning("Slow trace %s (%.3f ms):\n%s", root.trace_id, root.duration * 1000, root.render())
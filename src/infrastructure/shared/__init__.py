@@ -0,0 +1,6 @@
+"""Infrastructure partagée"""
+
+from .bloom_filter import BloomFilter
+from .sqlite_connection_pool import SqliteConnectionPool
+
+__all__ = ['BloomFilter', 'SqliteConnectionPool']
@@ -0,0 +1,71 @@
+"""Filtre de Bloom : test d'appartenance probabiliste sans faux négatif"""
+
+import math
+from hashlib import blake2b
+
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+
+        self._capacity = capacity
+        self._false_positive_rate = false_positive_rate
+        self._bit_count = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._bit_count / capacity * math.log(2)))
+        self._bits = bytearray((self._bit_count + 7) // 8)
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def false_positive_rate(self) -> float:
+        return self._false_positive_rate
+
+    @property
+    def bit_count(self) -> int:
+        return self._bit_count
+
+    @property
+    def hash_count(self) -> int:
+        return self._hash_count
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def might_contain(self, key: str) -> bool:
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def estimated_false_positive_rate(self) -> float:
+        exponent = -self._hash_count * self._count / self._bit_count
+        return (1 - math.exp(exponent)) ** self._hash_count
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+    def __contains__(self, key: str) -> bool:
+        return self.might_contain(key)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _positions(self, key: str):
+        # double hashing: k positions from two 64-bit halves of one digest
+        digest = blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        bit_count = self._bit_count
+        return [(first + i * second) % bit_count for i in range(self._hash_count)]
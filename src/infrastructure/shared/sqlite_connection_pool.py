@@ -0,0 +1,92 @@
+"""Pool de connexions SQLite"""
+
+import queue
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator, List
+
+
+class SqliteConnectionPool:
+
+    MEMORY = ':memory:'
+
+    def __init__(
+        self,
+        database: str,
+        size: int = 4,
+        timeout: float = 5.0,
+        cached_statements: int = 256,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        # each ':memory:' connection is its own database: only one can be shared
+        if database == self.MEMORY:
+            size = 1
+
+        self._database = database
+        self._timeout = timeout
+        self._cached_statements = cached_statements
+        self._connections: List[sqlite3.Connection] = []
+        self._idle: 'queue.LifoQueue[sqlite3.Connection]' = queue.LifoQueue(maxsize=size)
+
+        for _ in range(size):
+            connection = self._connect()
+            self._connections.append(connection)
+            self._idle.put(connection)
+
+    @property
+    def database(self) -> str:
+        return self._database
+
+    @property
+    def size(self) -> int:
+        return len(self._connections)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            connection = self._idle.get(timeout=self._timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No SQLite connection available after {self._timeout}s"
+            ) from None
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as connection:
+            with connection:
+                connection.execute('BEGIN IMMEDIATE')
+                yield connection
+
+    @contextmanager
+    def read_transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as connection:
+            # sqlite3 only opens transactions before writes: without one, each SELECT has its own snapshot
+            connection.execute('BEGIN DEFERRED')
+            try:
+                yield connection
+            finally:
+                connection.rollback()
+
+    def close(self) -> None:
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._database,
+            timeout=self._timeout,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+            isolation_level='IMMEDIATE',
+        )
+        if self._database != self.MEMORY:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('PRAGMA foreign_keys=ON')
+        return connection
@@ -0,0 +1,29 @@
+"""Infrastructure pour le domaine Formateur"""
+
+from .repositories import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    SqliteTrainerAccountRequestRepository,
+    BloomFilterTrainerAccountRequestRepository,
+    ColumnarTrainerAccountRequestRepository,
+    EventSourcedTrainerAccountRequestRepository,
+    ConcurrentInMemoryTrainerAccountRequestRepository,
+    ThreadPoolAsyncTrainerAccountRequestRepository,
+    InMemoryAsyncTrainerAccountRequestRepository,
+    InstrumentedTrainerAccountRequestRepository,
+)
+from .services import InstrumentedVerifyEmailUniqueness
+from .serialization import TrainerAccountRequestBinaryCodec
+
+__all__ = [
+    'IndexedInMemoryTrainerAccountRequestRepository',
+    'SqliteTrainerAccountRequestRepository',
+    'BloomFilterTrainerAccountRequestRepository',
+    'ColumnarTrainerAccountRequestRepository',
+    'EventSourcedTrainerAccountRequestRepository',
+    'ConcurrentInMemoryTrainerAccountRequestRepository',
+    'ThreadPoolAsyncTrainerAccountRequestRepository',
+    'InMemoryAsyncTrainerAccountRequestRepository',
+    'InstrumentedTrainerAccountRequestRepository',
+    'InstrumentedVerifyEmailUniqueness',
+    'TrainerAccountRequestBinaryCodec',
+]
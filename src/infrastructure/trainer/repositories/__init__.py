@@ -0,0 +1,41 @@
+"""Implémentations du repository pour le domaine Formateur"""
+
+from .indexed_in_memory_trainer_account_request_repository import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+)
+from .sqlite_trainer_account_request_repository import (
+    SqliteTrainerAccountRequestRepository,
+)
+from .bloom_filter_trainer_account_request_repository import (
+    BloomFilterTrainerAccountRequestRepository,
+)
+from .columnar_trainer_account_request_repository import (
+    ColumnarTrainerAccountRequestRepository,
+)
+from .event_sourced_trainer_account_request_repository import (
+    EventSourcedTrainerAccountRequestRepository,
+)
+from .concurrent_in_memory_trainer_account_request_repository import (
+    ConcurrentInMemoryTrainerAccountRequestRepository,
+)
+from .thread_pool_async_trainer_account_request_repository import (
+    ThreadPoolAsyncTrainerAccountRequestRepository,
+)
+from .in_memory_async_trainer_account_request_repository import (
+    InMemoryAsyncTrainerAccountRequestRepository,
+)
+from .instrumented_trainer_account_request_repository import (
+    InstrumentedTrainerAccountRequestRepository,
+)
+
+__all__ = [
+    'IndexedInMemoryTrainerAccountRequestRepository',
+    'SqliteTrainerAccountRequestRepository',
+    'BloomFilterTrainerAccountRequestRepository',
+    'ColumnarTrainerAccountRequestRepository',
+    'EventSourcedTrainerAccountRequestRepository',
+    'ConcurrentInMemoryTrainerAccountRequestRepository',
+    'ThreadPoolAsyncTrainerAccountRequestRepository',
+    'InMemoryAsyncTrainerAccountRequestRepository',
+    'InstrumentedTrainerAccountRequestRepository',
+]
@@ -0,0 +1,166 @@
+"""Décorateur de repository : cache négatif des emails par filtre de Bloom"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import RequestId, Email, RequestStatus
+from infrastructure.shared import BloomFilter
+
+
+class BloomFilterTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInterface):
+    """Toutes les écritures doivent passer par ce décorateur : un email enregistré ailleurs manque au filtre"""
+
+    def __init__(
+        self,
+        repository: TrainerAccountRequestRepositoryInterface,
+        capacity: int = 100_000,
+        false_positive_rate: float = 0.01,
+        rebuild_ratio: float = 0.1,
+    ):
+        self._repository = repository
+        self._capacity = capacity
+        self._false_positive_rate = false_positive_rate
+        self._rebuild_ratio = rebuild_ratio
+        self._filter = BloomFilter(capacity, false_positive_rate)
+        self._stale = 0
+        self._negatives = 0
+        self._true_positives = 0
+        self._false_positives = 0
+        self._rebuilds = 0
+        self.rebuild()
+
+    def save(self, request: TrainerAccountRequest) -> None:
+        self._repository.save(request)
+        self._add(request.candidate_info.email)
+
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        requests = list(requests)
+        self._repository.save_many(requests)
+        for request in requests:
+            self._add(request.candidate_info.email)
+
+    def save_if_email_unused(self, request: TrainerAccountRequest) -> bool:
+        saved = self._repository.save_if_email_unused(request)
+        if saved:
+            self._add(request.candidate_info.email)
+        return saved
+
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        return self._repository.reserve_email(email, request_id)
+
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        self._repository.release_email(email, request_id)
+
+    def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        return self._repository.find(request_id)
+
+    def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        return self._repository.find_many(request_ids)
+
+    def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        if not self._might_contain(email):
+            return None
+        request = self._repository.find_by_email(email)
+        self._record_lookup(request is not None)
+        return request
+
+    def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self._repository.find_pending_validation()
+
+    def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        return self._repository.find_by_status(status)
+
+    def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        return self._repository.find_by_status_page(status, after_cursor, limit)
+
+    def iter_by_status(self, status: RequestStatus, batch_size: int = 500) -> Iterator[TrainerAccountRequest]:
+        return self._repository.iter_by_status(status, batch_size)
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        return self._repository.iter_emails(batch_size)
+
+    def exists_by_email(self, email: Email) -> bool:
+        if not self._might_contain(email):
+            return False
+        exists = self._repository.exists_by_email(email)
+        self._record_lookup(exists)
+        return exists
+
+    def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        candidates = {email for email in emails if self._might_contain(email)}
+        if not candidates:
+            return set()
+        used = self._repository.exists_by_emails(candidates)
+        for email in candidates:
+            self._record_lookup(email in used)
+        return used
+
+    def count_by_status(self, status: RequestStatus) -> int:
+        return self._repository.count_by_status(status)
+
+    def count_all(self) -> int:
+        return self._repository.count_all()
+
+    def delete(self, request: TrainerAccountRequest) -> None:
+        self._repository.delete(request)
+        self._stale += 1
+        if self._stale > self._rebuild_ratio * max(len(self._filter), 1):
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        emails = [email.value for email in self._repository.iter_emails()]
+        capacity = max(self._capacity, 2 * len(emails))
+        self._filter = BloomFilter(capacity, self._false_positive_rate)
+        for email in emails:
+            self._filter.add(email)
+        self._stale = 0
+        self._rebuilds += 1
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        possible_hits = self._true_positives + self._false_positives
+        lookups = self._negatives + possible_hits
+        return {
+            'lookups': lookups,
+            'negatives': self._negatives,
+            'true_positives': self._true_positives,
+            'false_positives': self._false_positives,
+            'observed_false_positive_rate': (
+                self._false_positives / (self._negatives + self._false_positives)
+                if self._negatives + self._false_positives else 0.0
+            ),
+            'estimated_false_positive_rate': self._filter.estimated_false_positive_rate(),
+            'items': len(self._filter),
+            'capacity': self._filter.capacity,
+            'bits': self._filter.bit_count,
+            'hash_functions': self._filter.hash_count,
+            'stale_items': self._stale,
+            'rebuilds': self._rebuilds,
+        }
+
+    def _add(self, email: Email) -> None:
+        if len(self._filter) >= self._filter.capacity:
+            self.rebuild()
+        if not self._filter.might_contain(email.value):
+            self._filter.add(email.value)
+
+    def _might_contain(self, email: Email) -> bool:
+        if self._filter.might_contain(email.value):
+            return True
+        self._negatives += 1
+        return False
+
+    def _record_lookup(self, exists: bool) -> None:
+        if exists:
+            self._true_positives += 1
+        else:
+            self._false_positives += 1
@@ -0,0 +1,305 @@
+"""Repository en mémoire compact, stocké par colonnes (struct-of-arrays)"""
+
+import heapq
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.entities import Skill
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import (
+    RequestId,
+    Email,
+    RequestStatus,
+    SkillLevel,
+)
+from .email_reservations import EmailReservations, DEFAULT_RESERVATION_TTL
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+STATUSES = [RequestStatus(status.value) for status in RequestStatus.Status]
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+LEVELS = [SkillLevel(level.value) for level in SkillLevel.Level]
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
+DELETED = 255
+
+
+class _StringTable:
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._strings: List[str] = []
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._codes[value] = code
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        return self._strings[code]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def memory_usage(self) -> int:
+        return (
+            sys.getsizeof(self._codes)
+            + sys.getsizeof(self._strings)
+            + sum(sys.getsizeof(value) for value in self._strings)
+        )
+
+
+class ColumnarTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInterface):
+
+    def __init__(self, reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL):
+        self._names = _StringTable()
+        self._skill_names = _StringTable()
+        self._reservations = EmailReservations(reservation_ttl)
+        self._clear_columns()
+
+    def save(self, request: TrainerAccountRequest) -> None:
+        email = request.candidate_info.email
+        owner = self._row_by_email.get(email.value)
+        if owner is not None and owner != self._row_by_id.get(UUID(request.id.value).int):
+            raise EmailAlreadyUsedException(email)
+        if self._reservations.held_by_other(email.value, request.id.value):
+            raise EmailAlreadyUsedException(email)
+        self._store(request)
+
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        requests = list(requests)
+
+        email_by_id = {request.id.value: request.candidate_info.email for request in requests}
+        claimed: Dict[str, str] = {}
+        for request_id, email in email_by_id.items():
+            owner = claimed.setdefault(email.value, request_id)
+            if owner != request_id:
+                raise EmailAlreadyUsedException(email)
+        for email, request_id in claimed.items():
+            owner_row = self._row_by_email.get(email)
+            owner = None if owner_row is None else self._id_at(owner_row)
+            if owner is not None and owner != request_id and owner not in email_by_id:
+                raise EmailAlreadyUsedException(email_by_id[request_id])
+            if self._reservations.held_by_other(email, request_id):
+                raise EmailAlreadyUsedException(email_by_id[request_id])
+
+        for request in requests:
+            self._store(request)
+
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        owner_row = self._row_by_email.get(email.value)
+        if owner_row is not None:
+            return self._id_at(owner_row) == request_id.value
+        return self._reservations.reserve(email.value, request_id.value)
+
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        self._reservations.release(email.value, request_id.value)
+
+    def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        row = self._row_by_id.get(UUID(request_id.value).int)
+        return None if row is None else self._materialize(row)
+
+    def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        rows = (self._row_by_id.get(UUID(request_id.value).int) for request_id in request_ids)
+        return [self._materialize(row) for row in rows if row is not None]
+
+    def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        row = self._row_by_email.get(email.value)
+        return None if row is None else self._materialize(row)
+
+    def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self.find_by_status(RequestStatus.pending_validation())
+
+    def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        rows = sorted(self._rows_with_status(status), key=self._sort_key)
+        return [self._materialize(row) for row in rows]
+
+    def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+        rows = self._rows_with_status(status)
+        if after_cursor is not None:
+            submission_date, request_id = after_cursor
+            after = ((submission_date - EPOCH) // MICROSECOND, UUID(request_id).int)
+            rows = [row for row in rows if self._sort_key(row) > after]
+        page = heapq.nsmallest(limit, rows, key=self._sort_key)
+        return RequestPage.of([self._materialize(row) for row in page], limit)
+
+    def exists_by_email(self, email: Email) -> bool:
+        return email.value in self._row_by_email
+
+    def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        used = self._row_by_email
+        return {email for email in emails if email.value in used}
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        return (Email._from_trusted(email) for email in list(self._row_by_email))
+
+    def delete(self, request: TrainerAccountRequest) -> None:
+        row = self._row_by_id.pop(UUID(request.id.value).int, None)
+        if row is None:
+            return
+        del self._row_by_email[self._emails[row]]
+        self._counts[self._statuses[row]] -= 1
+        self._statuses[row] = DELETED
+        self._emails[row] = ''
+
+    def count_by_status(self, status: RequestStatus) -> int:
+        return self._counts[STATUS_CODES[status]]
+
+    def count_all(self) -> int:
+        return len(self._row_by_id)
+
+    def clear(self) -> None:
+        self._names = _StringTable()
+        self._skill_names = _StringTable()
+        self._reservations.clear()
+        self._clear_columns()
+
+    def compact(self) -> None:
+        rows = sorted(self._row_by_id.values())
+        requests = [self._materialize(row) for row in rows]
+        self._clear_columns()
+        for request in requests:
+            self._store(request)
+
+    def memory_usage(self) -> Dict[str, int]:
+        usage = {
+            'request_columns': sum(sys.getsizeof(column) for column in (
+                self._ids, self._first_names, self._last_names, self._statuses,
+                self._dates, self._skill_start, self._skill_count,
+            )),
+            'emails': sys.getsizeof(self._emails) + sum(sys.getsizeof(email) for email in self._emails),
+            'skill_columns': sum(sys.getsizeof(column) for column in (
+                self._skill_ids, self._skill_name_codes, self._skill_levels,
+            )),
+            'string_tables': self._names.memory_usage() + self._skill_names.memory_usage(),
+            'indexes': (
+                sys.getsizeof(self._row_by_id)
+                + sum(sys.getsizeof(key) for key in self._row_by_id)
+                + sys.getsizeof(self._row_by_email)
+            ),
+        }
+        usage['total'] = sum(usage.values())
+        return usage
+
+    def _clear_columns(self) -> None:
+        self._ids = bytearray()
+        self._first_names = array('I')
+        self._last_names = array('I')
+        self._emails: List[str] = []
+        self._statuses = array('B')
+        self._dates = array('q')
+        self._skill_start = array('I')
+        self._skill_count = array('H')
+
+        self._skill_ids = bytearray()
+        self._skill_name_codes = array('I')
+        self._skill_levels = array('B')
+
+        self._row_by_id: Dict[int, int] = {}
+        self._row_by_email: Dict[str, int] = {}
+        self._counts = [0] * len(STATUSES)
+
+    def _store(self, request: TrainerAccountRequest) -> None:
+        request_uuid = UUID(request.id.value)
+        candidate_info = request.candidate_info
+        full_name = candidate_info.full_name
+        email = candidate_info.email.value
+        status = STATUS_CODES[request.statut]
+        date = (request.submission_date - EPOCH) // MICROSECOND
+        skills = request.skills
+
+        row = self._row_by_id.get(request_uuid.int)
+        if row is None:
+            row = len(self._statuses)
+            self._row_by_id[request_uuid.int] = row
+            self._ids += request_uuid.bytes
+            self._first_names.append(self._names.code(full_name.first_name))
+            self._last_names.append(self._names.code(full_name.last_name))
+            self._emails.append(email)
+            self._statuses.append(status)
+            self._dates.append(date)
+            self._skill_start.append(0)
+            self._skill_count.append(0)
+        else:
+            if self._row_by_email.get(self._emails[row]) == row:
+                del self._row_by_email[self._emails[row]]
+            self._counts[self._statuses[row]] -= 1
+            self._first_names[row] = self._names.code(full_name.first_name)
+            self._last_names[row] = self._names.code(full_name.last_name)
+            self._emails[row] = email
+            self._statuses[row] = status
+            self._dates[row] = date
+        self._row_by_email[email] = row
+        self._reservations.consume(email)
+        self._counts[status] += 1
+        self._store_skills(row, skills)
+
+    def _store_skills(self, row: int, skills: Sequence[Skill]) -> None:
+        count = self._skill_count[row]
+        if count and count == len(skills):
+            start = self._skill_start[row]
+            for offset, skill in enumerate(skills):
+                position = start + offset
+                self._skill_ids[16 * position:16 * position + 16] = UUID(skill.id.value).bytes
+                self._skill_name_codes[position] = self._skill_names.code(skill.name.value)
+                self._skill_levels[position] = LEVEL_CODES[skill.level]
+            return
+
+        self._skill_start[row] = len(self._skill_levels)
+        self._skill_count[row] = len(skills)
+        for skill in skills:
+            self._skill_ids += UUID(skill.id.value).bytes
+            self._skill_name_codes.append(self._skill_names.code(skill.name.value))
+            self._skill_levels.append(LEVEL_CODES[skill.level])
+
+    def _rows_with_status(self, status: RequestStatus) -> List[int]:
+        code = STATUS_CODES[status]
+        return [row for row, row_status in enumerate(self._statuses) if row_status == code]
+
+    def _sort_key(self, row: int) -> Tuple[int, int]:
+        # same order as (submission_date, id): UUID text sorts like its integer
+        return (self._dates[row], int.from_bytes(self._ids[16 * row:16 * row + 16], 'big'))
+
+    def _id_at(self, row: int) -> str:
+        return str(UUID(bytes=bytes(self._ids[16 * row:16 * row + 16])))
+
+    def _materialize(self, row: int) -> TrainerAccountRequest:
+        names = self._names
+        skill_names = self._skill_names
+        skill_ids = self._skill_ids
+        start = self._skill_start[row]
+        return TrainerAccountRequest._rehydrate(
+            self._id_at(row),
+            names[self._first_names[row]],
+            names[self._last_names[row]],
+            self._emails[row],
+            [
+                (
+                    str(UUID(bytes=bytes(skill_ids[16 * position:16 * position + 16]))),
+                    skill_names[self._skill_name_codes[position]],
+                    LEVELS[self._skill_levels[position]].value,
+                )
+                for position in range(start, start + self._skill_count[row])
+            ],
+            STATUSES[self._statuses[row]].value,
+            EPOCH + self._dates[row] * MICROSECOND,
+        )
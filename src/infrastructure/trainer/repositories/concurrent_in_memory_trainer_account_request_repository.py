@@ -0,0 +1,201 @@
+"""Repository en mémoire thread-safe, verrous répartis (lock striping)"""
+
+import threading
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories import TrainerAccountRequestRepositoryInterface, RequestPage
+from domain.trainer.value_objects import RequestId, Email, RequestStatus
+from .email_reservations import EmailReservations, DEFAULT_RESERVATION_TTL
+
+
+class _Stripe:
+
+    __slots__ = ('lock', 'owners', 'reservations', 'counts')
+
+    def __init__(self, reservation_ttl: timedelta):
+        self.lock = threading.Lock()
+        # email -> id of the request saved with it
+        self.owners: Dict[str, str] = {}
+        # emails reserved by a request not saved with them yet
+        self.reservations = EmailReservations(reservation_ttl)
+        # status -> number of requests whose id falls in this stripe
+        self.counts: Dict[str, int] = {}
+
+
+class ConcurrentInMemoryTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInterface):
+
+    def __init__(self, stripes: int = 64, reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL):
+        if stripes < 1:
+            raise ValueError("At least one stripe is required")
+        self._stripes = [_Stripe(reservation_ttl) for _ in range(stripes)]
+        self._requests: Dict[str, TrainerAccountRequest] = {}
+        self._email_by_id: Dict[str, str] = {}
+        self._status_by_id: Dict[str, str] = {}
+
+    def save(self, request: TrainerAccountRequest) -> None:
+        if not self.save_if_email_unused(request):
+            raise EmailAlreadyUsedException(request.candidate_info.email)
+
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        requests = list(requests)
+        latest = {request.id.value: request for request in requests}
+        while True:
+            previous = {request_id: self._email_by_id.get(request_id) for request_id in latest}
+            stripes = self._stripes_of(
+                *latest,
+                *(request.candidate_info.email.value for request in latest.values()),
+                *previous.values(),
+            )
+            for stripe in stripes:
+                stripe.lock.acquire()
+            try:
+                if any(self._email_by_id.get(request_id) != email for request_id, email in previous.items()):
+                    continue
+                claimed: Dict[str, str] = {}
+                for request_id, request in latest.items():
+                    if claimed.setdefault(request.candidate_info.email.value, request_id) != request_id:
+                        raise EmailAlreadyUsedException(request.candidate_info.email)
+                for email, request_id in claimed.items():
+                    stripe = self._stripe(email)
+                    owner = stripe.owners.get(email)
+                    if (owner is not None and owner != request_id and owner not in latest) \
+                            or stripe.reservations.held_by_other(email, request_id):
+                        raise EmailAlreadyUsedException(latest[request_id].candidate_info.email)
+                for request in requests:
+                    request_id = request.id.value
+                    self._store(request_id, request.candidate_info.email.value, previous[request_id], request)
+                return
+            finally:
+                for stripe in reversed(stripes):
+                    stripe.lock.release()
+
+    def save_if_email_unused(self, request: TrainerAccountRequest) -> bool:
+        request_id = request.id.value
+        email = request.candidate_info.email.value
+        while True:
+            previous = self._email_by_id.get(request_id)
+            stripes = self._stripes_of(request_id, email, previous)
+            for stripe in stripes:
+                stripe.lock.acquire()
+            try:
+                # read again under the id's lock: another save may have moved the request meanwhile
+                if self._email_by_id.get(request_id) != previous:
+                    continue
+                stripe = self._stripe(email)
+                owner = stripe.owners.get(email)
+                if (owner is not None and owner != request_id) or stripe.reservations.held_by_other(email, request_id):
+                    return False
+                self._store(request_id, email, previous, request)
+                return True
+            finally:
+                for stripe in reversed(stripes):
+                    stripe.lock.release()
+
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        stripe = self._stripe(email.value)
+        with stripe.lock:
+            owner = stripe.owners.get(email.value)
+            if owner is not None:
+                return owner == request_id.value
+            return stripe.reservations.reserve(email.value, request_id.value)
+
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        stripe = self._stripe(email.value)
+        with stripe.lock:
+            stripe.reservations.release(email.value, request_id.value)
+
+    def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        request = self._requests.get(request_id.value)
+        return None if request is None else request._detached_copy()
+
+    def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        stripe = self._stripe(email.value)
+        owner = stripe.owners.get(email.value)
+        request = None if owner is None else self._requests.get(owner)
+        return None if request is None else request._detached_copy()
+
+    def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self.find_by_status(RequestStatus.pending_validation())
+
+    def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        stored = [request for request in list(self._requests.values()) if request.statut == status]
+        return [request._detached_copy() for request in sorted(stored, key=RequestPage.cursor_of)]
+
+    def exists_by_email(self, email: Email) -> bool:
+        return self.find_by_email(email) is not None
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        return (Email._from_trusted(email) for email in list(self._email_by_id.values()))
+
+    def delete(self, request: TrainerAccountRequest) -> None:
+        request_id = request.id.value
+        while True:
+            email = self._email_by_id.get(request_id)
+            if email is None:
+                return
+            stripes = self._stripes_of(request_id, email)
+            for stripe in stripes:
+                stripe.lock.acquire()
+            try:
+                if self._email_by_id.get(request_id) != email:
+                    continue
+                stripe = self._stripe(email)
+                if stripe.owners.get(email) == request_id:
+                    del stripe.owners[email]
+                self._stripe(request_id).counts[self._status_by_id.pop(request_id)] -= 1
+                del self._email_by_id[request_id]
+                self._requests.pop(request_id, None)
+                return
+            finally:
+                for stripe in reversed(stripes):
+                    stripe.lock.release()
+
+    def count_by_status(self, status: RequestStatus) -> int:
+        return sum(stripe.counts.get(status.value, 0) for stripe in self._stripes)
+
+    def count_all(self) -> int:
+        return len(self._requests)
+
+    def clear(self) -> None:
+        for stripe in self._stripes:
+            stripe.lock.acquire()
+        try:
+            for stripe in self._stripes:
+                stripe.owners.clear()
+                stripe.reservations.clear()
+                stripe.counts.clear()
+            self._requests.clear()
+            self._email_by_id.clear()
+            self._status_by_id.clear()
+        finally:
+            for stripe in reversed(self._stripes):
+                stripe.lock.release()
+
+    def _store(self, request_id: str, email: str, previous: Optional[str], request: TrainerAccountRequest) -> None:
+        stripe = self._stripe(email)
+        stripe.owners[email] = request_id
+        stripe.reservations.consume(email)
+        if previous is not None and previous != email:
+            previous_stripe = self._stripe(previous)
+            if previous_stripe.owners.get(previous) == request_id:
+                del previous_stripe.owners[previous]
+        counts = self._stripe(request_id).counts
+        old_status = self._status_by_id.get(request_id)
+        if old_status is not None:
+            counts[old_status] -= 1
+        status = request.statut.value
+        counts[status] = counts.get(status, 0) + 1
+        self._status_by_id[request_id] = status
+        self._email_by_id[request_id] = email
+        self._requests[request_id] = request._detached_copy()
+
+    def _stripe(self, key: str) -> _Stripe:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _stripes_of(self, *keys: Optional[str]) -> Sequence[_Stripe]:
+        # several locks are always taken in stripe order, so two saves cannot deadlock
+        indexes = {hash(key) % len(self._stripes) for key in keys if key is not None}
+        return [self._stripes[index] for index in sorted(indexes)]
@@ -0,0 +1,65 @@
+"""Réservations d'email en mémoire, avec expiration"""
+
+import time
+from datetime import timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+DEFAULT_RESERVATION_TTL = timedelta(minutes=15)
+
+_SWEEP_MIN_SIZE = 1024
+
+
+class EmailReservations:
+
+    def __init__(self, ttl: timedelta = DEFAULT_RESERVATION_TTL, clock: Callable[[], float] = time.monotonic):
+        if ttl < timedelta(0):
+            raise ValueError("Reservation TTL cannot be negative")
+        self._ttl = ttl.total_seconds()
+        self._clock = clock
+        # email -> (request id, time on `clock` when the reservation expires)
+        self._held: Dict[str, Tuple[str, float]] = {}
+        self._sweep_at = _SWEEP_MIN_SIZE
+
+    def __len__(self) -> int:
+        return len(self._held)
+
+    def holder(self, email: str) -> Optional[str]:
+        held = self._held.get(email)
+        if held is None:
+            return None
+        if held[1] <= self._clock():
+            del self._held[email]
+            return None
+        return held[0]
+
+    def held_by_other(self, email: str, request_id: str) -> bool:
+        if not self._held:
+            return False
+        holder = self.holder(email)
+        return holder is not None and holder != request_id
+
+    def reserve(self, email: str, request_id: str) -> bool:
+        """Réserve l'email, ou prolonge la réservation de `request_id` ; False si une autre demande le détient"""
+        if self.held_by_other(email, request_id):
+            return False
+        self._held[email] = (request_id, self._clock() + self._ttl)
+        if len(self._held) >= self._sweep_at:
+            self._sweep()
+        return True
+
+    def release(self, email: str, request_id: str) -> None:
+        held = self._held.get(email)
+        if held is not None and held[0] == request_id:
+            del self._held[email]
+
+    def consume(self, email: str) -> None:
+        self._held.pop(email, None)
+
+    def clear(self) -> None:
+        self._held.clear()
+        self._sweep_at = _SWEEP_MIN_SIZE
+
+    def _sweep(self) -> None:
+        now = self._clock()
+        self._held = {email: held for email, held in self._held.items() if held[1] > now}
+        self._sweep_at = max(_SWEEP_MIN_SIZE, 2 * len(self._held))
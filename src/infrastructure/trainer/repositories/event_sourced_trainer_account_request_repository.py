@@ -0,0 +1,414 @@
+"""Repository event-sourcé pour les demandes de compte formateur"""
+
+import sqlite3
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.events import (
+    TrainerAccountRequestSubmitted,
+    TrainerAccountRequestApproved,
+    TrainerAccountRequestRejected,
+    SkillLevelUpgraded,
+)
+from domain.trainer.exceptions import EmailAlreadyUsedException, ConcurrentModificationException
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import (
+    RequestId,
+    Email,
+    RequestStatus,
+)
+from infrastructure.events import SqliteEventStore
+from infrastructure.shared import SqliteConnectionPool
+from .email_reservations import DEFAULT_RESERVATION_TTL
+
+State = Dict[str, Any]
+
+
+def _submitted(state: Optional[State], event: TrainerAccountRequestSubmitted) -> State:
+    full_name = event.candidate_info.full_name
+    return {
+        'id': event.request_id.value,
+        'first_name': full_name.first_name,
+        'last_name': full_name.last_name,
+        'email': event.candidate_email.value,
+        'status': RequestStatus.Status.PENDING_VALIDATION.value,
+        'submission_date': event.occurred_on.isoformat(timespec='microseconds'),
+        'skills': [[skill_id.value, name.value, level.value] for skill_id, name, level in event.skills],
+    }
+
+
+def _approved(state: State, event: TrainerAccountRequestApproved) -> State:
+    state['status'] = RequestStatus.Status.APPROVED.value
+    return state
+
+
+def _rejected(state: State, event: TrainerAccountRequestRejected) -> State:
+    state['status'] = RequestStatus.Status.REJECTED.value
+    return state
+
+
+def _skill_upgraded(state: State, event: SkillLevelUpgraded) -> State:
+    for skill in state['skills']:
+        if skill[0] == event.skill_id.value:
+            skill[2] = event.new_level.value
+    return state
+
+
+class EventSourcedTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInterface):
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS es_trainer_requests (
+            id TEXT PRIMARY KEY,
+            email TEXT NOT NULL UNIQUE,
+            status TEXT NOT NULL,
+            submission_date TEXT NOT NULL,
+            version INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_es_trainer_requests_status
+            ON es_trainer_requests (status, submission_date, id)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS es_trainer_request_counts (
+            status TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        )
+        """,
+        """
+        INSERT INTO es_trainer_request_counts (status, count)
+        SELECT status, COUNT(*) FROM es_trainer_requests
+        WHERE NOT EXISTS (SELECT 1 FROM es_trainer_request_counts)
+        GROUP BY status
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_es_trainer_request_counts_insert
+        AFTER INSERT ON es_trainer_requests
+        BEGIN
+            INSERT INTO es_trainer_request_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_es_trainer_request_counts_update
+        AFTER UPDATE OF status ON es_trainer_requests
+        WHEN OLD.status <> NEW.status
+        BEGIN
+            UPDATE es_trainer_request_counts SET count = count - 1 WHERE status = OLD.status;
+            INSERT INTO es_trainer_request_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_es_trainer_request_counts_delete
+        AFTER DELETE ON es_trainer_requests
+        BEGIN
+            UPDATE es_trainer_request_counts SET count = count - 1 WHERE status = OLD.status;
+        END
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS es_trainer_email_reservations (
+            email TEXT PRIMARY KEY,
+            request_id TEXT NOT NULL,
+            reserved_at TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_es_trainer_email_reservations_reserved_at
+            ON es_trainer_email_reservations (reserved_at)
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_es_trainer_requests_reserved_email
+        BEFORE INSERT ON es_trainer_requests
+        WHEN EXISTS (
+            SELECT 1 FROM es_trainer_email_reservations WHERE email = NEW.email AND request_id <> NEW.id
+        )
+        BEGIN
+            SELECT RAISE(ABORT, 'email reserved by another request');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_es_trainer_requests_consume_reservation
+        AFTER INSERT ON es_trainer_requests
+        BEGIN
+            DELETE FROM es_trainer_email_reservations WHERE email = NEW.email;
+        END
+        """,
+    )
+
+    APPLIERS: Dict[type, Callable[[Optional[State], Any], State]] = {
+        TrainerAccountRequestSubmitted: _submitted,
+        TrainerAccountRequestApproved: _approved,
+        TrainerAccountRequestRejected: _rejected,
+        SkillLevelUpgraded: _skill_upgraded,
+    }
+
+    _SELECT_VERSION = "SELECT version FROM es_trainer_requests WHERE id = ?"
+    _INSERT_INDEX = """
+        INSERT INTO es_trainer_requests (id, email, status, submission_date, version)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    _UPDATE_INDEX = "UPDATE es_trainer_requests SET status = ?, version = ? WHERE id = ?"
+    _SELECT_ID_BY_EMAIL = "SELECT id, version FROM es_trainer_requests WHERE email = ?"
+    _SELECT_BY_STATUS = """
+        SELECT id, version FROM es_trainer_requests WHERE status = ? ORDER BY submission_date, id
+    """
+    _SELECT_STATUS_PAGE = """
+        SELECT id, version FROM es_trainer_requests
+        WHERE status = ? ORDER BY submission_date, id LIMIT ?
+    """
+    _SELECT_STATUS_PAGE_AFTER = """
+        SELECT id, version FROM es_trainer_requests
+        WHERE status = ? AND (submission_date, id) > (?, ?)
+        ORDER BY submission_date, id LIMIT ?
+    """
+    _SELECT_EMAILS = "SELECT email FROM es_trainer_requests ORDER BY email LIMIT ?"
+    _SELECT_EMAILS_AFTER = "SELECT email FROM es_trainer_requests WHERE email > ? ORDER BY email LIMIT ?"
+    _EXISTS_BY_EMAIL = "SELECT 1 FROM es_trainer_requests WHERE email = ? LIMIT 1"
+    _DELETE_INDEX = "DELETE FROM es_trainer_requests WHERE id = ?"
+    _COUNT_BY_STATUS = "SELECT count FROM es_trainer_request_counts WHERE status = ?"
+    _COUNT_ALL = "SELECT COALESCE(SUM(count), 0) FROM es_trainer_request_counts"
+    _RESERVE_EMAIL = """
+        INSERT INTO es_trainer_email_reservations (email, request_id, reserved_at)
+        SELECT ?, ?, ?
+        WHERE NOT EXISTS (SELECT 1 FROM es_trainer_requests WHERE email = ?)
+        ON CONFLICT (email) DO UPDATE SET reserved_at = excluded.reserved_at
+        WHERE request_id = excluded.request_id
+    """
+    _SELECT_EMAIL_HOLDER = """
+        SELECT id FROM es_trainer_requests WHERE email = ?
+        UNION ALL
+        SELECT request_id FROM es_trainer_email_reservations WHERE email = ?
+    """
+    _RELEASE_EMAIL = "DELETE FROM es_trainer_email_reservations WHERE email = ? AND request_id = ?"
+    _EXPIRE_RESERVATIONS = "DELETE FROM es_trainer_email_reservations WHERE reserved_at <= ?"
+
+    def __init__(
+        self,
+        pool: SqliteConnectionPool,
+        snapshot_every: Optional[int] = 100,
+        event_store: Optional[SqliteEventStore] = None,
+        reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL,
+    ):
+        """`snapshot_every=None` désactive les snapshots"""
+        if snapshot_every is not None and snapshot_every < 1:
+            raise ValueError("Snapshot interval must be at least 1")
+        if event_store is not None and event_store.pool is not pool:
+            raise ValueError("The event store must use the repository's connection pool")
+        if reservation_ttl < timedelta(0):
+            raise ValueError("Reservation TTL cannot be negative")
+        self._pool = pool
+        self._snapshot_every = snapshot_every
+        self._reservation_ttl = reservation_ttl
+        self._event_store = event_store or SqliteEventStore(pool)
+        # id(aggregate) -> stream version it was loaded or saved at, dropped with the aggregate
+        self._versions: Dict[int, int] = {}
+        with self._pool.transaction() as connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+    @property
+    def event_store(self) -> SqliteEventStore:
+        return self._event_store
+
+    def save(self, request: TrainerAccountRequest) -> None:
+        self.save_many([request])
+
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        requests = list(requests)
+        with self._pool.transaction() as connection:
+            self._expire_reservations(connection)
+            versions = [self._append(connection, request) for request in requests]
+        for request, version in zip(requests, versions):
+            request.clear_events()
+            self._track(request, version)
+
+    def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        with self._pool.read_transaction() as connection:
+            row = connection.execute(self._SELECT_VERSION, (request_id.value,)).fetchone()
+            return None if row is None else self._load(connection, request_id.value)
+
+    def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        with self._pool.read_transaction() as connection:
+            row = connection.execute(self._SELECT_ID_BY_EMAIL, (email.value,)).fetchone()
+            return None if row is None else self._load(connection, row[0])
+
+    def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self.find_by_status(RequestStatus.pending_validation())
+
+    def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        with self._pool.read_transaction() as connection:
+            rows = connection.execute(self._SELECT_BY_STATUS, (status.value,)).fetchall()
+            return [self._load(connection, request_id) for request_id, _ in rows]
+
+    def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+        with self._pool.read_transaction() as connection:
+            if after_cursor is None:
+                rows = connection.execute(self._SELECT_STATUS_PAGE, (status.value, limit)).fetchall()
+            else:
+                submission_date, request_id = after_cursor
+                rows = connection.execute(self._SELECT_STATUS_PAGE_AFTER, (
+                    status.value, submission_date.isoformat(timespec='microseconds'), request_id, limit,
+                )).fetchall()
+            requests = [self._load(connection, request_id) for request_id, _ in rows]
+        return RequestPage.of(requests, limit)
+
+    def exists_by_email(self, email: Email) -> bool:
+        with self._pool.connection() as connection:
+            return connection.execute(self._EXISTS_BY_EMAIL, (email.value,)).fetchone() is not None
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        last = None
+        while True:
+            with self._pool.connection() as connection:
+                if last is None:
+                    rows = connection.execute(self._SELECT_EMAILS, (batch_size,)).fetchall()
+                else:
+                    rows = connection.execute(self._SELECT_EMAILS_AFTER, (last, batch_size)).fetchall()
+            for (email,) in rows:
+                yield Email._from_trusted(email)
+            if len(rows) < batch_size:
+                return
+            last = rows[-1][0]
+
+    def delete(self, request: TrainerAccountRequest) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(self._DELETE_INDEX, (request.id.value,))
+
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        with self._pool.transaction() as connection:
+            self._expire_reservations(connection)
+            connection.execute(self._RESERVE_EMAIL, (
+                email.value, request_id.value, self._format_date(datetime.now()), email.value,
+            ))
+            holder = connection.execute(self._SELECT_EMAIL_HOLDER, (email.value, email.value)).fetchone()
+        return holder is not None and holder[0] == request_id.value
+
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(self._RELEASE_EMAIL, (email.value, request_id.value))
+
+    def count_by_status(self, status: RequestStatus) -> int:
+        with self._pool.connection() as connection:
+            return connection.execute(self._COUNT_BY_STATUS, (status.value,)).fetchone()[0]
+
+    def count_all(self) -> int:
+        with self._pool.connection() as connection:
+            return connection.execute(self._COUNT_ALL).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute("DELETE FROM es_trainer_requests")
+            connection.execute("DELETE FROM es_trainer_email_reservations")
+            self._event_store.clear(connection)
+
+    def _expire_reservations(self, connection: sqlite3.Connection) -> None:
+        expired = datetime.now() - self._reservation_ttl
+        connection.execute(self._EXPIRE_RESERVATIONS, (self._format_date(expired),))
+
+    def _append(self, connection: sqlite3.Connection, request: TrainerAccountRequest) -> int:
+        events = request.events
+        request_id = request.id.value
+        row = connection.execute(self._SELECT_VERSION, (request_id,)).fetchone()
+        if row is None:
+            version = self._event_store.version(request_id, connection)
+            if version == 0 and not (
+                events and isinstance(events[0], TrainerAccountRequestSubmitted) and events[0].candidate_info is not None
+            ):
+                raise ValueError(f"The stream of request {request_id} must start with a complete submission event")
+        else:
+            version = row[0]
+        expected = self._versions.get(id(request))
+        if expected is not None and expected != version:
+            raise ConcurrentModificationException(request_id, expected, version)
+
+        new_version = version
+        if events:
+            try:
+                new_version = self._event_store.append(connection, request_id, version, events)
+            except sqlite3.IntegrityError:
+                actual = self._event_store.version(request_id, connection)
+                raise ConcurrentModificationException(request_id, version, actual) from None
+        elif self._replay(connection, request_id)[1] != self._state_of(request):
+            raise ValueError(f"Request {request_id} has changes that were not recorded as events")
+        try:
+            if row is None:
+                connection.execute(self._INSERT_INDEX, (
+                    request_id,
+                    request.candidate_info.email.value,
+                    request.statut.value,
+                    request.submission_date.isoformat(timespec='microseconds'),
+                    new_version,
+                ))
+            elif events:
+                connection.execute(self._UPDATE_INDEX, (request.statut.value, new_version, request_id))
+        except sqlite3.IntegrityError:
+            raise EmailAlreadyUsedException(request.candidate_info.email) from None
+
+        every = self._snapshot_every
+        if every is not None and new_version // every > version // every:
+            self._event_store.save_snapshot(connection, request_id, new_version, self._state_of(request))
+        return new_version
+
+    def _track(self, request: TrainerAccountRequest, version: int) -> None:
+        key = id(request)
+        if key not in self._versions:
+            weakref.finalize(request, self._versions.pop, key, None)
+        self._versions[key] = version
+
+    def _load(self, connection: sqlite3.Connection, request_id: str) -> TrainerAccountRequest:
+        version, state = self._replay(connection, request_id)
+        request = self._to_aggregate(state)
+        self._track(request, version)
+        return request
+
+    def _replay(self, connection: sqlite3.Connection, request_id: str) -> Tuple[int, State]:
+        snapshot = self._event_store.load_snapshot(request_id, connection) if self._snapshot_every else None
+        version, state = snapshot if snapshot is not None else (0, None)
+        appliers = self.APPLIERS
+        for version, event in self._event_store.read(request_id, version, connection):
+            state = appliers[type(event)](state, event)
+        return version, state
+
+    @staticmethod
+    def _format_date(date: datetime) -> str:
+        return date.isoformat(timespec='microseconds')
+
+    @staticmethod
+    def _state_of(request: TrainerAccountRequest) -> State:
+        full_name = request.candidate_info.full_name
+        return {
+            'id': request.id.value,
+            'first_name': full_name.first_name,
+            'last_name': full_name.last_name,
+            'email': request.candidate_info.email.value,
+            'status': request.statut.value,
+            'submission_date': request.submission_date.isoformat(timespec='microseconds'),
+            'skills': [[skill.id.value, skill.name.value, skill.level.value] for skill in request.skills],
+        }
+
+    @staticmethod
+    def _to_aggregate(state: State) -> TrainerAccountRequest:
+        return TrainerAccountRequest._rehydrate(
+            state['id'],
+            state['first_name'],
+            state['last_name'],
+            state['email'],
+            state['skills'],
+            state['status'],
+            datetime.fromisoformat(state['submission_date']),
+        )
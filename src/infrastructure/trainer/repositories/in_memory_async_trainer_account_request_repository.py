@@ -0,0 +1,78 @@
+"""Repository asynchrone en mémoire, pour les tests et les boucles mono-thread"""
+
+from datetime import timedelta
+from typing import Iterable, List, Optional, Set
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.repositories import (
+    AsyncTrainerAccountRequestRepository,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import RequestId, Email, RequestStatus
+from .indexed_in_memory_trainer_account_request_repository import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+)
+from .email_reservations import DEFAULT_RESERVATION_TTL
+
+
+class InMemoryAsyncTrainerAccountRequestRepository(AsyncTrainerAccountRequestRepository):
+
+    def __init__(self, reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL):
+        self._repository = IndexedInMemoryTrainerAccountRequestRepository(reservation_ttl)
+
+    async def save(self, request: TrainerAccountRequest) -> None:
+        self._repository.save(request)
+
+    async def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        self._repository.save_many(requests)
+
+    async def save_if_email_unused(self, request: TrainerAccountRequest) -> bool:
+        return self._repository.save_if_email_unused(request)
+
+    async def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        return self._repository.reserve_email(email, request_id)
+
+    async def release_email(self, email: Email, request_id: RequestId) -> None:
+        self._repository.release_email(email, request_id)
+
+    async def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        return self._repository.find(request_id)
+
+    async def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        return self._repository.find_many(request_ids)
+
+    async def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        return self._repository.find_by_email(email)
+
+    async def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self._repository.find_pending_validation()
+
+    async def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        return self._repository.find_by_status(status)
+
+    async def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        return self._repository.find_by_status_page(status, after_cursor, limit)
+
+    async def exists_by_email(self, email: Email) -> bool:
+        return self._repository.exists_by_email(email)
+
+    async def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        return self._repository.exists_by_emails(emails)
+
+    async def delete(self, request: TrainerAccountRequest) -> None:
+        self._repository.delete(request)
+
+    async def count_by_status(self, status: RequestStatus) -> int:
+        return self._repository.count_by_status(status)
+
+    async def count_all(self) -> int:
+        return self._repository.count_all()
+
+    async def clear(self) -> None:
+        self._repository.clear()
@@ -0,0 +1,227 @@
+"""Repository en mémoire indexé par email et par statut"""
+
+from bisect import bisect_right
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import RequestId, Email, RequestStatus
+from .email_reservations import EmailReservations, DEFAULT_RESERVATION_TTL
+
+# (email, status, position in the status index)
+IndexKeys = Tuple[str, str, PageCursor]
+
+
+class _StatusIndex:
+
+    def __init__(self):
+        self.members: Dict[str, PageCursor] = {}
+        # may still hold cursors of removed requests: readers skip those not in `members`
+        self._sorted: List[PageCursor] = []
+        self._stale = 0
+        self._unsorted = False
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def add(self, request_id: str, cursor: PageCursor) -> None:
+        self.members[request_id] = cursor
+        if not self._unsorted and (not self._sorted or self._sorted[-1] < cursor):
+            self._sorted.append(cursor)
+        else:
+            self._unsorted = True
+
+    def remove(self, request_id: str) -> None:
+        if self.members.pop(request_id, None) is not None:
+            self._stale += 1
+            if self._stale > max(len(self.members), 64):
+                self._rebuild()
+
+    def ordered(self) -> List[PageCursor]:
+        if self._unsorted or self._stale > len(self.members):
+            self._rebuild()
+        return self._sorted
+
+    def ordered_members(self) -> List[PageCursor]:
+        if self._stale:
+            self._rebuild()
+        return self.ordered()
+
+    def _rebuild(self) -> None:
+        if self._unsorted:
+            self._sorted = sorted(self.members.values())
+        else:
+            self._sorted = list(self.current(self._sorted))
+        self._stale = 0
+        self._unsorted = False
+
+    def current(self, cursors: Iterable[PageCursor]) -> Iterator[PageCursor]:
+        members = self.members
+        return (cursor for cursor in cursors if members.get(cursor[1]) == cursor)
+
+
+class IndexedInMemoryTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInterface):
+    """Garde une copie de chaque demande à son dernier `save` ; les lectures renvoient des copies"""
+
+    def __init__(self, reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL):
+        self._requests: Dict[str, TrainerAccountRequest] = {}
+        self._id_by_email: Dict[str, str] = {}
+        self._by_status: Dict[str, _StatusIndex] = {}
+        self._index_keys: Dict[str, IndexKeys] = {}
+        self._reservations = EmailReservations(reservation_ttl)
+
+    def save(self, request: TrainerAccountRequest) -> None:
+        email = request.candidate_info.email.value
+        request_id = request.id.value
+        owner = self._id_by_email.get(email)
+        if (owner is not None and owner != request_id) or self._reservations.held_by_other(email, request_id):
+            raise EmailAlreadyUsedException(request.candidate_info.email)
+        self._store(request)
+
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        requests = list(requests)
+
+        email_by_id = {request.id.value: request.candidate_info.email for request in requests}
+        claimed: Dict[str, str] = {}
+        for request_id, email in email_by_id.items():
+            owner = claimed.setdefault(email.value, request_id)
+            if owner != request_id:
+                raise EmailAlreadyUsedException(email)
+        for email, request_id in claimed.items():
+            owner = self._id_by_email.get(email)
+            if owner is not None and owner != request_id and owner not in email_by_id:
+                raise EmailAlreadyUsedException(email_by_id[request_id])
+            if self._reservations.held_by_other(email, request_id):
+                raise EmailAlreadyUsedException(email_by_id[request_id])
+
+        for request in requests:
+            self._store(request)
+
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        owner = self._id_by_email.get(email.value)
+        if owner is not None:
+            return owner == request_id.value
+        return self._reservations.reserve(email.value, request_id.value)
+
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        self._reservations.release(email.value, request_id.value)
+
+    def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        request = self._requests.get(request_id.value)
+        return None if request is None else request._detached_copy()
+
+    def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        request_id = self._id_by_email.get(email.value)
+        if request_id is None:
+            return None
+        return self._requests[request_id]._detached_copy()
+
+    def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self._find_by_status_value(RequestStatus.Status.PENDING_VALIDATION.value)
+
+    def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        return self._find_by_status_value(status.value)
+
+    def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+        index = self._by_status.get(status.value)
+        if index is None:
+            return RequestPage.of([], limit)
+        cursors = index.ordered()
+        start = 0 if after_cursor is None else bisect_right(cursors, after_cursor)
+        requests = self._requests
+        page = []
+        for _, request_id in index.current(cursors[position] for position in range(start, len(cursors))):
+            page.append(requests[request_id]._detached_copy())
+            if len(page) == limit:
+                break
+        return RequestPage.of(page, limit)
+
+    def exists_by_email(self, email: Email) -> bool:
+        return email.value in self._id_by_email
+
+    def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        requests = self._requests
+        found = (requests.get(request_id.value) for request_id in request_ids)
+        return [request._detached_copy() for request in found if request is not None]
+
+    def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        used = self._id_by_email
+        return {email for email in emails if email.value in used}
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        return (Email._from_trusted(email) for email in list(self._id_by_email))
+
+    def delete(self, request: TrainerAccountRequest) -> None:
+        request_id = request.id.value
+        keys = self._index_keys.get(request_id)
+        if keys is None:
+            return
+        self._unindex(request_id, keys)
+        del self._requests[request_id]
+
+    def count_by_status(self, status: RequestStatus) -> int:
+        index = self._by_status.get(status.value)
+        return 0 if index is None else len(index)
+
+    def count_all(self) -> int:
+        return len(self._requests)
+
+    def clear(self) -> None:
+        self._requests.clear()
+        self._id_by_email.clear()
+        self._by_status.clear()
+        self._index_keys.clear()
+        self._reservations.clear()
+
+    def _store(self, request: TrainerAccountRequest) -> None:
+        request_id = request.id.value
+        keys = (
+            request.candidate_info.email.value,
+            request.statut.value,
+            RequestPage.cursor_of(request),
+        )
+        previous = self._index_keys.get(request_id)
+        if previous != keys:
+            if previous is not None:
+                self._unindex(request_id, previous)
+            self._index(request_id, keys)
+        self._requests[request_id] = request._detached_copy()
+
+    def _find_by_status_value(self, status: str) -> List[TrainerAccountRequest]:
+        index = self._by_status.get(status)
+        if index is None:
+            return []
+        requests = self._requests
+        return [requests[request_id]._detached_copy() for _, request_id in index.ordered_members()]
+
+    def _index(self, request_id: str, keys: IndexKeys) -> None:
+        email, status, cursor = keys
+        self._id_by_email[email] = request_id
+        self._reservations.consume(email)
+        index = self._by_status.get(status)
+        if index is None:
+            index = self._by_status[status] = _StatusIndex()
+        index.add(request_id, cursor)
+        self._index_keys[request_id] = keys
+
+    def _unindex(self, request_id: str, keys: IndexKeys) -> None:
+        email, status, _ = keys
+        if self._id_by_email.get(email) == request_id:
+            del self._id_by_email[email]
+        index = self._by_status.get(status)
+        if index is not None:
+            index.remove(request_id)
+        del self._index_keys[request_id]
@@ -0,0 +1,112 @@
+"""Décorateur de repository : latence et erreurs de chaque méthode dans un registre de métriques"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import RequestId, Email, RequestStatus
+from infrastructure.monitoring import Counter, Histogram, MetricsRegistry, instrumented
+
+
+class InstrumentedTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInterface):
+
+    METHODS = (
+        'save', 'save_many', 'save_if_email_unused', 'reserve_email', 'release_email',
+        'find', 'find_many', 'find_by_email', 'find_pending_validation', 'find_by_status',
+        'find_by_status_page', 'exists_by_email', 'exists_by_emails', 'delete',
+        'count_by_status', 'count_all',
+    )
+
+    def __init__(
+        self,
+        repository: TrainerAccountRequestRepositoryInterface,
+        registry: MetricsRegistry,
+        prefix: str = 'trainer_repository',
+    ):
+        self._repository = repository
+        self._registry = registry
+        self._latency: Dict[str, Histogram] = {
+            method: registry.histogram(f"{prefix}.{method}.seconds") for method in self.METHODS
+        }
+        self._errors: Dict[str, Counter] = {
+            method: registry.counter(f"{prefix}.{method}.errors") for method in self.METHODS
+        }
+
+    @instrumented()
+    def save(self, request: TrainerAccountRequest) -> None:
+        self._repository.save(request)
+
+    @instrumented()
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        self._repository.save_many(requests)
+
+    @instrumented()
+    def save_if_email_unused(self, request: TrainerAccountRequest) -> bool:
+        return self._repository.save_if_email_unused(request)
+
+    @instrumented()
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        return self._repository.reserve_email(email, request_id)
+
+    @instrumented()
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        self._repository.release_email(email, request_id)
+
+    @instrumented()
+    def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        return self._repository.find(request_id)
+
+    @instrumented()
+    def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        return self._repository.find_many(request_ids)
+
+    @instrumented()
+    def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        return self._repository.find_by_email(email)
+
+    @instrumented()
+    def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self._repository.find_pending_validation()
+
+    @instrumented()
+    def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        return self._repository.find_by_status(status)
+
+    @instrumented()
+    def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        return self._repository.find_by_status_page(status, after_cursor, limit)
+
+    def iter_by_status(self, status: RequestStatus, batch_size: int = 500) -> Iterator[TrainerAccountRequest]:
+        return self._repository.iter_by_status(status, batch_size)
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        return self._repository.iter_emails(batch_size)
+
+    @instrumented()
+    def exists_by_email(self, email: Email) -> bool:
+        return self._repository.exists_by_email(email)
+
+    @instrumented()
+    def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        return self._repository.exists_by_emails(emails)
+
+    @instrumented()
+    def delete(self, request: TrainerAccountRequest) -> None:
+        self._repository.delete(request)
+
+    @instrumented()
+    def count_by_status(self, status: RequestStatus) -> int:
+        return self._repository.count_by_status(status)
+
+    @instrumented()
+    def count_all(self) -> int:
+        return self._repository.count_all()
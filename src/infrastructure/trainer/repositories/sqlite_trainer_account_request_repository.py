@@ -0,0 +1,512 @@
+"""Repository SQLite pour les demandes de compte formateur"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, TypeVar
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import (
+    RequestId,
+    Email,
+    RequestStatus,
+)
+from infrastructure.events import SqliteOutbox
+from infrastructure.shared import SqliteConnectionPool
+from .email_reservations import DEFAULT_RESERVATION_TTL
+
+T = TypeVar('T')
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class SqliteTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInterface):
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS trainer_account_requests (
+            id TEXT PRIMARY KEY,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            status TEXT NOT NULL,
+            submission_date TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_trainer_account_requests_email
+            ON trainer_account_requests (email)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_trainer_account_requests_status
+            ON trainer_account_requests (status, submission_date, id)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS trainer_skills (
+            id TEXT PRIMARY KEY,
+            request_id TEXT NOT NULL
+                REFERENCES trainer_account_requests (id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            level TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_trainer_skills_request
+            ON trainer_skills (request_id, position)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS trainer_request_counts (
+            status TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        )
+        """,
+        """
+        INSERT INTO trainer_request_counts (status, count)
+        SELECT status, COUNT(*) FROM trainer_account_requests
+        WHERE NOT EXISTS (SELECT 1 FROM trainer_request_counts)
+        GROUP BY status
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_trainer_request_counts_insert
+        AFTER INSERT ON trainer_account_requests
+        BEGIN
+            INSERT INTO trainer_request_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_trainer_request_counts_update
+        AFTER UPDATE OF status ON trainer_account_requests
+        WHEN OLD.status <> NEW.status
+        BEGIN
+            UPDATE trainer_request_counts SET count = count - 1 WHERE status = OLD.status;
+            INSERT INTO trainer_request_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_trainer_request_counts_delete
+        AFTER DELETE ON trainer_account_requests
+        BEGIN
+            UPDATE trainer_request_counts SET count = count - 1 WHERE status = OLD.status;
+        END
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS trainer_email_reservations (
+            email TEXT PRIMARY KEY,
+            request_id TEXT NOT NULL,
+            reserved_at TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_trainer_email_reservations_reserved_at
+            ON trainer_email_reservations (reserved_at)
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_trainer_requests_reserved_email_insert
+        BEFORE INSERT ON trainer_account_requests
+        WHEN EXISTS (
+            SELECT 1 FROM trainer_email_reservations WHERE email = NEW.email AND request_id <> NEW.id
+        )
+        BEGIN
+            SELECT RAISE(ABORT, 'email reserved by another request');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_trainer_requests_reserved_email_update
+        BEFORE UPDATE OF email ON trainer_account_requests
+        WHEN EXISTS (
+            SELECT 1 FROM trainer_email_reservations WHERE email = NEW.email AND request_id <> NEW.id
+        )
+        BEGIN
+            SELECT RAISE(ABORT, 'email reserved by another request');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_trainer_requests_consume_reservation
+        AFTER INSERT ON trainer_account_requests
+        BEGIN
+            DELETE FROM trainer_email_reservations WHERE email = NEW.email;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_trainer_requests_consume_reservation_update
+        AFTER UPDATE OF email ON trainer_account_requests
+        WHEN OLD.email <> NEW.email
+        BEGIN
+            DELETE FROM trainer_email_reservations WHERE email = NEW.email;
+        END
+        """,
+    )
+
+    BATCH_SIZE = 500
+
+    _UPSERT_REQUEST = """
+        INSERT INTO trainer_account_requests
+            (id, first_name, last_name, email, status, submission_date)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            first_name = excluded.first_name,
+            last_name = excluded.last_name,
+            email = excluded.email,
+            status = excluded.status,
+            submission_date = excluded.submission_date
+    """
+    _DELETE_SKILLS = "DELETE FROM trainer_skills WHERE request_id = ?"
+    _INSERT_SKILL = """
+        INSERT INTO trainer_skills (id, request_id, position, name, level)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    _SELECT_COLUMNS = """
+        SELECT id, first_name, last_name, email, status, submission_date
+        FROM trainer_account_requests
+    """
+    _SELECT_BY_ID = _SELECT_COLUMNS + " WHERE id = ?"
+    _SELECT_BY_EMAIL = _SELECT_COLUMNS + " WHERE email = ?"
+    _SELECT_BY_STATUS = _SELECT_COLUMNS + " WHERE status = ? ORDER BY submission_date, id"
+    _SELECT_SKILLS = """
+        SELECT request_id, id, name, level FROM trainer_skills
+        WHERE request_id = ? ORDER BY position
+    """
+    _SELECT_STATUS_PAGE = _SELECT_COLUMNS + """
+        WHERE status = ? ORDER BY submission_date, id LIMIT ?
+    """
+    _SELECT_STATUS_PAGE_AFTER = _SELECT_COLUMNS + """
+        WHERE status = ? AND (submission_date, id) > (?, ?)
+        ORDER BY submission_date, id LIMIT ?
+    """
+    _SELECT_SKILLS_BY_STATUS = """
+        SELECT s.request_id, s.id, s.name, s.level
+        FROM trainer_skills s
+        JOIN trainer_account_requests r ON r.id = s.request_id
+        WHERE r.status = ?
+        ORDER BY s.request_id, s.position
+    """
+    _SELECT_BY_IDS = _SELECT_COLUMNS + " WHERE id IN ({})"
+    _SELECT_SKILLS_BY_IDS = """
+        SELECT request_id, id, name, level FROM trainer_skills
+        WHERE request_id IN ({}) ORDER BY request_id, position
+    """
+    _SELECT_EMAIL_OWNERS = "SELECT email, id FROM trainer_account_requests WHERE email IN ({})"
+    _SELECT_EMAIL_HOLDERS = """
+        SELECT email, id, 1 FROM trainer_account_requests WHERE email IN ({})
+        UNION ALL
+        SELECT email, request_id, 0 FROM trainer_email_reservations WHERE email IN ({})
+    """
+    # an id never looks like an email: a free placeholder until the batch upsert
+    _RELEASE_STORED_EMAILS = "UPDATE trainer_account_requests SET email = id WHERE id IN ({})"
+    _SELECT_EMAILS = "SELECT email FROM trainer_account_requests ORDER BY email LIMIT ?"
+    _SELECT_EMAILS_AFTER = "SELECT email FROM trainer_account_requests WHERE email > ? ORDER BY email LIMIT ?"
+    _EXISTS_BY_EMAIL = "SELECT 1 FROM trainer_account_requests WHERE email = ? LIMIT 1"
+    _DELETE_REQUEST = "DELETE FROM trainer_account_requests WHERE id = ?"
+    _COUNT_BY_STATUS = "SELECT count FROM trainer_request_counts WHERE status = ?"
+    _COUNT_ALL = "SELECT COALESCE(SUM(count), 0) FROM trainer_request_counts"
+    _RESERVE_EMAIL = """
+        INSERT INTO trainer_email_reservations (email, request_id, reserved_at)
+        SELECT ?, ?, ?
+        WHERE NOT EXISTS (SELECT 1 FROM trainer_account_requests WHERE email = ?)
+        ON CONFLICT (email) DO UPDATE SET reserved_at = excluded.reserved_at
+        WHERE request_id = excluded.request_id
+    """
+    _SELECT_EMAIL_HOLDER = """
+        SELECT id FROM trainer_account_requests WHERE email = ?
+        UNION ALL
+        SELECT request_id FROM trainer_email_reservations WHERE email = ?
+    """
+    _RELEASE_EMAIL = "DELETE FROM trainer_email_reservations WHERE email = ? AND request_id = ?"
+    _EXPIRE_RESERVATIONS = "DELETE FROM trainer_email_reservations WHERE reserved_at <= ?"
+
+    def __init__(
+        self,
+        pool: SqliteConnectionPool,
+        outbox: Optional[SqliteOutbox] = None,
+        reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL,
+    ):
+        if outbox is not None and outbox.pool is not pool:
+            raise ValueError("The outbox must use the repository's connection pool")
+        if reservation_ttl < timedelta(0):
+            raise ValueError("Reservation TTL cannot be negative")
+        self._pool = pool
+        self._outbox = outbox
+        self._reservation_ttl = reservation_ttl
+        with self._pool.transaction() as connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+    @staticmethod
+    def connect(database: str, pool_size: int = 4) -> 'SqliteTrainerAccountRequestRepository':
+        return SqliteTrainerAccountRequestRepository(SqliteConnectionPool(database, size=pool_size))
+
+    def save(self, request: TrainerAccountRequest) -> None:
+        with self._pool.transaction() as connection:
+            self._expire_reservations(connection)
+            self._write(connection, request)
+            self._append_events(connection, [request])
+        self._clear_events([request])
+
+    def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        batch = list({id(request): request for request in requests}.values())
+        requests = list({request.id.value: request for request in batch}.values())
+        if not requests:
+            return
+        with self._pool.transaction() as connection:
+            self._expire_reservations(connection)
+            released = self._check_email_owners(connection, requests)
+            for chunk in _chunks(released, self.BATCH_SIZE):
+                connection.execute(self._RELEASE_STORED_EMAILS.format(', '.join('?' * len(chunk))), chunk)
+            try:
+                connection.executemany(self._UPSERT_REQUEST, map(self._request_row, requests))
+            except sqlite3.IntegrityError:
+                # executemany does not say which row failed: replay them one by one
+                for request in requests:
+                    self._write_request_row(connection, request)
+                raise
+            connection.executemany(self._DELETE_SKILLS, [(request.id.value,) for request in requests])
+            connection.executemany(self._INSERT_SKILL, [
+                row for request in requests for row in self._skill_rows(request)
+            ])
+            self._append_events(connection, batch)
+        self._clear_events(batch)
+
+    def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        return self._find_one(self._SELECT_BY_ID, request_id.value)
+
+    def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        return self._find_one(self._SELECT_BY_EMAIL, email.value)
+
+    def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return self.find_by_status(RequestStatus.pending_validation())
+
+    def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        with self._pool.read_transaction() as connection:
+            rows = connection.execute(self._SELECT_BY_STATUS, (status.value,)).fetchall()
+            skill_rows = connection.execute(self._SELECT_SKILLS_BY_STATUS, (status.value,)).fetchall()
+        return self._to_aggregates(rows, skill_rows)
+
+    def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+        with self._pool.read_transaction() as connection:
+            if after_cursor is None:
+                rows = connection.execute(self._SELECT_STATUS_PAGE, (status.value, limit)).fetchall()
+            else:
+                submission_date, request_id = after_cursor
+                rows = connection.execute(self._SELECT_STATUS_PAGE_AFTER, (
+                    status.value, self._format_date(submission_date), request_id, limit,
+                )).fetchall()
+            ids = [row[0] for row in rows]
+            skill_rows = connection.execute(
+                self._SELECT_SKILLS_BY_IDS.format(', '.join('?' * len(ids))), ids
+            ).fetchall() if ids else []
+        return RequestPage.of(self._to_aggregates(rows, skill_rows), limit)
+
+    def exists_by_email(self, email: Email) -> bool:
+        with self._pool.connection() as connection:
+            row = connection.execute(self._EXISTS_BY_EMAIL, (email.value,)).fetchone()
+        return row is not None
+
+    def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        keys = [request_id.value for request_id in request_ids]
+        found: Dict[str, TrainerAccountRequest] = {}
+        with self._pool.read_transaction() as connection:
+            for chunk in _chunks(list(dict.fromkeys(keys)), self.BATCH_SIZE):
+                placeholders = ', '.join('?' * len(chunk))
+                rows = connection.execute(self._SELECT_BY_IDS.format(placeholders), chunk).fetchall()
+                skill_rows = connection.execute(
+                    self._SELECT_SKILLS_BY_IDS.format(placeholders), chunk
+                ).fetchall()
+                for request in self._to_aggregates(rows, skill_rows):
+                    found[request.id.value] = request
+        return [found[key] for key in keys if key in found]
+
+    def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        emails = set(emails)
+        owners = self._email_owners([email.value for email in emails])
+        return {email for email in emails if email.value in owners}
+
+    def iter_emails(self, batch_size: int = 500) -> Iterator[Email]:
+        last = None
+        while True:
+            with self._pool.connection() as connection:
+                if last is None:
+                    rows = connection.execute(self._SELECT_EMAILS, (batch_size,)).fetchall()
+                else:
+                    rows = connection.execute(self._SELECT_EMAILS_AFTER, (last, batch_size)).fetchall()
+            for (email,) in rows:
+                yield Email._from_trusted(email)
+            if len(rows) < batch_size:
+                return
+            last = rows[-1][0]
+
+    def delete(self, request: TrainerAccountRequest) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(self._DELETE_REQUEST, (request.id.value,))
+
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        with self._pool.transaction() as connection:
+            self._expire_reservations(connection)
+            try:
+                connection.execute(self._RESERVE_EMAIL, (
+                    email.value, request_id.value, self._format_date(datetime.now()), email.value,
+                ))
+            except sqlite3.IntegrityError:
+                return False
+            holder = connection.execute(self._SELECT_EMAIL_HOLDER, (email.value, email.value)).fetchone()
+        return holder is not None and holder[0] == request_id.value
+
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(self._RELEASE_EMAIL, (email.value, request_id.value))
+
+    def count_by_status(self, status: RequestStatus) -> int:
+        with self._pool.connection() as connection:
+            row = connection.execute(self._COUNT_BY_STATUS, (status.value,)).fetchone()
+        return row[0] if row is not None else 0
+
+    def count_all(self) -> int:
+        with self._pool.connection() as connection:
+            return connection.execute(self._COUNT_ALL).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute("DELETE FROM trainer_skills")
+            connection.execute("DELETE FROM trainer_account_requests")
+            connection.execute("DELETE FROM trainer_email_reservations")
+
+    def _expire_reservations(self, connection: sqlite3.Connection) -> None:
+        expired = datetime.now() - self._reservation_ttl
+        connection.execute(self._EXPIRE_RESERVATIONS, (self._format_date(expired),))
+
+    def _write(self, connection: sqlite3.Connection, request: TrainerAccountRequest) -> None:
+        self._write_request_row(connection, request)
+        connection.execute(self._DELETE_SKILLS, (request.id.value,))
+        connection.executemany(self._INSERT_SKILL, self._skill_rows(request))
+
+    def _write_request_row(self, connection: sqlite3.Connection, request: TrainerAccountRequest) -> None:
+        try:
+            connection.execute(self._UPSERT_REQUEST, self._request_row(request))
+        except sqlite3.IntegrityError:
+            raise EmailAlreadyUsedException(request.candidate_info.email) from None
+
+    def _append_events(self, connection: sqlite3.Connection, requests: Iterable[TrainerAccountRequest]) -> None:
+        if self._outbox is None:
+            return
+        for request in requests:
+            events = request.events
+            if events:
+                self._outbox.append(connection, request.id.value, events)
+
+    def _clear_events(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        if self._outbox is None:
+            return
+        for request in requests:
+            request.clear_events()
+
+    def _check_email_owners(
+        self,
+        connection: sqlite3.Connection,
+        requests: Sequence[TrainerAccountRequest],
+    ) -> List[str]:
+        claimed: Dict[str, str] = {}
+        for request in requests:
+            email = request.candidate_info.email
+            owner = claimed.setdefault(email.value, request.id.value)
+            if owner != request.id.value:
+                raise EmailAlreadyUsedException(email)
+
+        batch_ids = set(claimed.values())
+        released = []
+        for chunk in _chunks(list(claimed), self.BATCH_SIZE):
+            placeholders = ', '.join('?' * len(chunk))
+            query = self._SELECT_EMAIL_HOLDERS.format(placeholders, placeholders)
+            for email, holder, stored in connection.execute(query, chunk + chunk):
+                if holder == claimed[email]:
+                    continue
+                if not (stored and holder in batch_ids):
+                    raise EmailAlreadyUsedException(Email(email))
+                released.append(holder)
+        return released
+
+    def _email_owners(
+        self,
+        emails: Sequence[str],
+        connection: Optional[sqlite3.Connection] = None,
+    ) -> Dict[str, str]:
+        if connection is None:
+            with self._pool.connection() as connection:
+                return self._email_owners(emails, connection)
+        owners: Dict[str, str] = {}
+        for chunk in _chunks(emails, self.BATCH_SIZE):
+            placeholders = ', '.join('?' * len(chunk))
+            owners.update(connection.execute(self._SELECT_EMAIL_OWNERS.format(placeholders), chunk))
+        return owners
+
+    @staticmethod
+    def _request_row(request: TrainerAccountRequest) -> tuple:
+        candidate_info = request.candidate_info
+        return (
+            request.id.value,
+            candidate_info.full_name.first_name,
+            candidate_info.full_name.last_name,
+            candidate_info.email.value,
+            request.statut.value,
+            SqliteTrainerAccountRequestRepository._format_date(request.submission_date),
+        )
+
+    @staticmethod
+    def _format_date(date: datetime) -> str:
+        # fixed width, so text order is chronological order in indexes and cursors
+        return date.isoformat(timespec='microseconds')
+
+    @staticmethod
+    def _skill_rows(request: TrainerAccountRequest) -> List[tuple]:
+        request_id = request.id.value
+        return [
+            (skill.id.value, request_id, position, skill.name.value, skill.level.value)
+            for position, skill in enumerate(request.skills)
+        ]
+
+    def _find_one(self, query: str, key: str) -> Optional[TrainerAccountRequest]:
+        with self._pool.read_transaction() as connection:
+            row = connection.execute(query, (key,)).fetchone()
+            if row is None:
+                return None
+            skill_rows = connection.execute(self._SELECT_SKILLS, (row[0],)).fetchall()
+        return self._to_aggregate(row, skill_rows)
+
+    def _to_aggregates(
+        self,
+        rows: Iterable[Sequence],
+        skill_rows: Iterable[Sequence],
+    ) -> List[TrainerAccountRequest]:
+        skills_by_request: Dict[str, List[Sequence]] = {}
+        for skill_row in skill_rows:
+            skills_by_request.setdefault(skill_row[0], []).append(skill_row)
+        return [self._to_aggregate(row, skills_by_request.get(row[0], [])) for row in rows]
+
+    @staticmethod
+    def _to_aggregate(row: Sequence, skill_rows: Iterable[Sequence]) -> TrainerAccountRequest:
+        request_id, first_name, last_name, email, status, submission_date = row
+        return TrainerAccountRequest._rehydrate(
+            request_id,
+            first_name,
+            last_name,
+            email,
+            [(skill_id, name, level) for _, skill_id, name, level in skill_rows],
+            status,
+            datetime.fromisoformat(submission_date),
+        )
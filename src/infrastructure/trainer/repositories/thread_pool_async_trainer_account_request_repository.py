@@ -0,0 +1,91 @@
+"""Adaptateur asynchrone : un repository synchrone exécuté dans un pool de threads borné"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Set, TypeVar
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    AsyncTrainerAccountRequestRepository,
+    RequestPage,
+    PageCursor,
+)
+from domain.trainer.value_objects import RequestId, Email, RequestStatus
+
+T = TypeVar('T')
+
+
+class ThreadPoolAsyncTrainerAccountRequestRepository(AsyncTrainerAccountRequestRepository):
+    """`max_workers` se dimensionne comme le pool de connexions du repository enveloppé"""
+
+    def __init__(self, repository: TrainerAccountRequestRepositoryInterface, max_workers: int = 4):
+        if max_workers < 1:
+            raise ValueError("At least one worker thread is required")
+        self._repository = repository
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='trainer-repository')
+
+    @property
+    def repository(self) -> TrainerAccountRequestRepositoryInterface:
+        return self._repository
+
+    async def save(self, request: TrainerAccountRequest) -> None:
+        await self._run(self._repository.save, request)
+
+    async def save_many(self, requests: Iterable[TrainerAccountRequest]) -> None:
+        await self._run(self._repository.save_many, list(requests))
+
+    async def save_if_email_unused(self, request: TrainerAccountRequest) -> bool:
+        return await self._run(self._repository.save_if_email_unused, request)
+
+    async def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        return await self._run(self._repository.reserve_email, email, request_id)
+
+    async def release_email(self, email: Email, request_id: RequestId) -> None:
+        await self._run(self._repository.release_email, email, request_id)
+
+    async def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
+        return await self._run(self._repository.find, request_id)
+
+    async def find_many(self, request_ids: Iterable[RequestId]) -> List[TrainerAccountRequest]:
+        return await self._run(self._repository.find_many, list(request_ids))
+
+    async def find_by_email(self, email: Email) -> Optional[TrainerAccountRequest]:
+        return await self._run(self._repository.find_by_email, email)
+
+    async def find_pending_validation(self) -> List[TrainerAccountRequest]:
+        return await self._run(self._repository.find_pending_validation)
+
+    async def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
+        return await self._run(self._repository.find_by_status, status)
+
+    async def find_by_status_page(
+        self,
+        status: RequestStatus,
+        after_cursor: Optional[PageCursor] = None,
+        limit: int = 50,
+    ) -> RequestPage:
+        return await self._run(self._repository.find_by_status_page, status, after_cursor, limit)
+
+    async def exists_by_email(self, email: Email) -> bool:
+        return await self._run(self._repository.exists_by_email, email)
+
+    async def exists_by_emails(self, emails: Iterable[Email]) -> Set[Email]:
+        return await self._run(self._repository.exists_by_emails, list(emails))
+
+    async def delete(self, request: TrainerAccountRequest) -> None:
+        await self._run(self._repository.delete, request)
+
+    async def count_by_status(self, status: RequestStatus) -> int:
+        return await self._run(self._repository.count_by_status, status)
+
+    async def count_all(self) -> int:
+        return await self._run(self._repository.count_all)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args))
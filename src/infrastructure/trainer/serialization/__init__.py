@@ -0,0 +1,5 @@
+"""Sérialisation des objets du domaine Formateur"""
+
+from .trainer_account_request_binary_codec import TrainerAccountRequestBinaryCodec
+
+__all__ = ['TrainerAccountRequestBinaryCodec']
@@ -0,0 +1,316 @@
+"""Codec binaire compact pour les demandes de compte formateur"""
+
+import struct
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+from domain.trainer.aggregates import TrainerAccountRequest
+from domain.trainer.entities import Skill
+from domain.trainer.events import TrainerAccountRequestSubmitted
+from domain.trainer.value_objects import (
+    RequestId,
+    Email,
+    FullName,
+    CandidatInfo,
+    RequestStatus,
+    SkillId,
+    SkillName,
+    SkillLevel,
+)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+VERSION = 1
+
+REQUEST = 1
+CANDIDATE_INFO = 2
+SKILL = 3
+SUBMITTED = 4
+
+# explicit codes: the format must not change when an enum is reordered
+STATUS_CODES = {'PENDING_VALIDATION': 0, 'APPROVED': 1, 'REJECTED': 2}
+LEVEL_CODES = {'BEGINNER': 0, 'INTERMEDIATE': 1, 'EXPERT': 2}
+STATUSES = {code: status for status, code in STATUS_CODES.items()}
+LEVELS = {code: level for level, code in LEVEL_CODES.items()}
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+_HEADER = struct.Struct('<BB')
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_BYTE = struct.Struct('<B')
+_STATUS_DATE = struct.Struct('<Bq')
+_DATE_FLAGS = struct.Struct('<qB')
+
+
+def _uuid_bytes(value: str) -> bytes:
+    return bytes.fromhex(value.replace('-', ''))
+
+
+def _uuid_text(view: memoryview, offset: int) -> str:
+    digits = view[offset:offset + 16].hex()
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+def _write_str(out: bytearray, value: str) -> None:
+    data = value.encode('utf-8')
+    if len(data) > 0xFFFF:
+        raise ValueError(f"String of {len(data)} bytes is too long to encode")
+    out += _U16.pack(len(data))
+    out += data
+
+
+def _read_str(view: memoryview, offset: int) -> Tuple[str, int]:
+    (length,) = _U16.unpack_from(view, offset)
+    end = offset + 2 + length
+    if end > len(view):
+        raise ValueError("Truncated record")
+    return str(view[offset + 2:end], 'utf-8'), end
+
+
+def _microseconds(value: datetime) -> int:
+    if value.tzinfo is not None:
+        raise ValueError("Only naive datetimes can be encoded")
+    return (value - EPOCH) // MICROSECOND
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    # raw streams and pipes may return fewer bytes than asked before the end
+    data = bytearray()
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return bytes(data)
+
+
+def _write_skills(out: bytearray, skills: Iterable[Tuple[SkillId, SkillName, SkillLevel]]) -> None:
+    skills = list(skills)
+    out += _U16.pack(len(skills))
+    for skill_id, name, level in skills:
+        out += _uuid_bytes(skill_id.value)
+        _write_str(out, name.value)
+        out += _BYTE.pack(LEVEL_CODES[level.value])
+
+
+def _read_skills(view: memoryview, offset: int) -> Tuple[List[Tuple[str, str, str]], int]:
+    (count,) = _U16.unpack_from(view, offset)
+    offset += 2
+    skills = []
+    for _ in range(count):
+        skill_id = _uuid_text(view, offset)
+        name, offset = _read_str(view, offset + 16)
+        skills.append((skill_id, name, LEVELS[view[offset]]))
+        offset += 1
+    return skills, offset
+
+
+class TrainerAccountRequestBinaryCodec:
+
+    def __init__(self):
+        self._encoders: Dict[type, Tuple[int, Callable[[bytearray, Any], None]]] = {
+            TrainerAccountRequest: (REQUEST, self._encode_request),
+            CandidatInfo: (CANDIDATE_INFO, self._encode_candidate_info),
+            Skill: (SKILL, self._encode_skill),
+            TrainerAccountRequestSubmitted: (SUBMITTED, self._encode_submitted),
+        }
+        self._decoders: Dict[int, Callable[[memoryview, int, bool], Tuple[Any, int]]] = {
+            REQUEST: self._decode_request,
+            CANDIDATE_INFO: self._decode_candidate_info,
+            SKILL: self._decode_skill,
+            SUBMITTED: self._decode_submitted,
+        }
+
+    def encode(self, value: Any) -> bytes:
+        out = bytearray()
+        self._encode_into(out, value)
+        return bytes(out)
+
+    def decode(self, data: Buffer, validate: bool = True) -> Any:
+        view = memoryview(data)
+        value, end = self._decode_from(view, 0, validate)
+        if end != len(view):
+            raise ValueError(f"{len(view) - end} unexpected bytes after the record")
+        return value
+
+    def encode_many(self, values: Iterable[Any]) -> Iterator[bytes]:
+        for value in values:
+            out = bytearray(4)
+            self._encode_into(out, value)
+            _U32.pack_into(out, 0, len(out) - 4)
+            yield bytes(out)
+
+    def write_many(self, values: Iterable[Any], stream: BinaryIO) -> int:
+        count = 0
+        for frame in self.encode_many(values):
+            stream.write(frame)
+            count += 1
+        return count
+
+    def decode_many(self, data: Buffer, validate: bool = True) -> Iterator[Any]:
+        view = memoryview(data)
+        offset = 0
+        while offset < len(view):
+            if offset + 4 > len(view):
+                raise ValueError("Truncated frame header")
+            (length,) = _U32.unpack_from(view, offset)
+            start = offset + 4
+            end = start + length
+            if end > len(view):
+                raise ValueError("Truncated frame")
+            value, stop = self._decode_from(view[:end], start, validate)
+            if stop != end:
+                raise ValueError("Frame length does not match its record")
+            yield value
+            offset = end
+
+    def read_many(self, stream: BinaryIO, validate: bool = True) -> Iterator[Any]:
+        while True:
+            header = _read_exact(stream, 4)
+            if not header:
+                return
+            if len(header) < 4:
+                raise ValueError(f"Truncated frame header: {len(header)} of 4 bytes")
+            (length,) = _U32.unpack(header)
+            record = _read_exact(stream, length)
+            if len(record) < length:
+                raise ValueError(f"Truncated frame: {len(record)} of {length} bytes")
+            yield self.decode(record, validate)
+
+    def _encode_into(self, out: bytearray, value: Any) -> None:
+        try:
+            record_type, encode = self._encoders[type(value)]
+        except KeyError:
+            raise ValueError(f"Cannot encode {type(value).__name__}") from None
+        out += _HEADER.pack(VERSION, record_type)
+        encode(out, value)
+
+    def _decode_from(self, view: memoryview, offset: int, validate: bool) -> Tuple[Any, int]:
+        try:
+            version, record_type = _HEADER.unpack_from(view, offset)
+            if version != VERSION:
+                raise ValueError(f"Unsupported format version {version}")
+            decode = self._decoders.get(record_type)
+            if decode is None:
+                raise ValueError(f"Unknown record type {record_type}")
+            return decode(view, offset + 2, validate)
+        except (struct.error, IndexError):
+            raise ValueError("Truncated record") from None
+        except KeyError as error:
+            raise ValueError(f"Unknown status or level code {error}") from None
+
+    @staticmethod
+    def _encode_request(out: bytearray, request: TrainerAccountRequest) -> None:
+        candidate_info = request.candidate_info
+        full_name = candidate_info.full_name
+        out += _uuid_bytes(request.id.value)
+        _write_str(out, full_name.first_name)
+        _write_str(out, full_name.last_name)
+        _write_str(out, candidate_info.email.value)
+        out += _STATUS_DATE.pack(STATUS_CODES[request.statut.value], _microseconds(request.submission_date))
+        _write_skills(out, ((skill.id, skill.name, skill.level) for skill in request.skills))
+
+    @staticmethod
+    def _decode_request(view: memoryview, offset: int, validate: bool) -> Tuple[TrainerAccountRequest, int]:
+        request_id = _uuid_text(view, offset)
+        first_name, offset = _read_str(view, offset + 16)
+        last_name, offset = _read_str(view, offset)
+        email, offset = _read_str(view, offset)
+        status, microseconds = _STATUS_DATE.unpack_from(view, offset)
+        skills, offset = _read_skills(view, offset + _STATUS_DATE.size)
+        submission_date = EPOCH + microseconds * MICROSECOND
+        if not validate:
+            return TrainerAccountRequest._rehydrate(
+                request_id, first_name, last_name, email, skills, STATUSES[status], submission_date,
+            ), offset
+        return TrainerAccountRequest(
+            request_id=RequestId(request_id),
+            candidate_info=CandidatInfo(FullName(first_name, last_name), Email(email)),
+            skills=[Skill(SkillId(skill_id), SkillName(name), SkillLevel(level)) for skill_id, name, level in skills],
+            status=RequestStatus(STATUSES[status]),
+            submission_date=submission_date,
+        ), offset
+
+    @staticmethod
+    def _encode_candidate_info(out: bytearray, candidate_info: CandidatInfo) -> None:
+        _write_str(out, candidate_info.full_name.first_name)
+        _write_str(out, candidate_info.full_name.last_name)
+        _write_str(out, candidate_info.email.value)
+
+    @staticmethod
+    def _decode_candidate_info(view: memoryview, offset: int, validate: bool) -> Tuple[CandidatInfo, int]:
+        first_name, offset = _read_str(view, offset)
+        last_name, offset = _read_str(view, offset)
+        email, offset = _read_str(view, offset)
+        if validate:
+            return CandidatInfo(FullName(first_name, last_name), Email(email)), offset
+        return CandidatInfo._from_trusted(FullName._from_trusted(first_name, last_name), Email._from_trusted(email)), offset
+
+    @staticmethod
+    def _encode_skill(out: bytearray, skill: Skill) -> None:
+        out += _uuid_bytes(skill.id.value)
+        _write_str(out, skill.name.value)
+        out += _BYTE.pack(LEVEL_CODES[skill.level.value])
+
+    @staticmethod
+    def _decode_skill(view: memoryview, offset: int, validate: bool) -> Tuple[Skill, int]:
+        skill_id = _uuid_text(view, offset)
+        name, offset = _read_str(view, offset + 16)
+        level = LEVELS[view[offset]]
+        if validate:
+            return Skill(SkillId(skill_id), SkillName(name), SkillLevel(level)), offset + 1
+        return Skill._rehydrate(skill_id, name, level), offset + 1
+
+    @staticmethod
+    def _encode_submitted(out: bytearray, event: TrainerAccountRequestSubmitted) -> None:
+        out += _uuid_bytes(event.request_id.value)
+        _write_str(out, event.candidate_email.value)
+        candidate_info = event.candidate_info
+        out += _DATE_FLAGS.pack(_microseconds(event.occurred_on), 0 if candidate_info is None else 1)
+        if candidate_info is not None:
+            _write_str(out, candidate_info.full_name.first_name)
+            _write_str(out, candidate_info.full_name.last_name)
+        _write_skills(out, event.skills)
+
+    @staticmethod
+    def _decode_submitted(view: memoryview, offset: int, validate: bool) -> Tuple[TrainerAccountRequestSubmitted, int]:
+        request_id = _uuid_text(view, offset)
+        email, offset = _read_str(view, offset + 16)
+        microseconds, flags = _DATE_FLAGS.unpack_from(view, offset)
+        offset += _DATE_FLAGS.size
+        names = None
+        if flags & 1:
+            first_name, offset = _read_str(view, offset)
+            last_name, offset = _read_str(view, offset)
+            names = (first_name, last_name)
+        skills, offset = _read_skills(view, offset)
+
+        if validate:
+            candidate_email = Email(email)
+            full_name = None if names is None else FullName(*names)
+            event_skills = tuple((SkillId(skill_id), SkillName(name), SkillLevel(level)) for skill_id, name, level in skills)
+            event_id = RequestId(request_id)
+        else:
+            candidate_email = Email._from_trusted(email)
+            full_name = None if names is None else FullName._from_trusted(*names)
+            event_skills = tuple(
+                (SkillId._from_trusted(skill_id), SkillName._from_trusted(name), SkillLevel._from_trusted(level))
+                for skill_id, name, level in skills
+            )
+            event_id = RequestId._from_trusted(request_id)
+        candidate_info = None
+        if full_name is not None:
+            candidate_info = (
+                CandidatInfo(full_name, candidate_email) if validate
+                else CandidatInfo._from_trusted(full_name, candidate_email)
+            )
+        return TrainerAccountRequestSubmitted(
+            request_id=event_id,
+            candidate_email=candidate_email,
+            occurred_on=EPOCH + microseconds * MICROSECOND,
+            candidate_info=candidate_info,
+            skills=event_skills,
+        ), offset
@@ -0,0 +1,5 @@
+"""Services instrumentés pour le domaine Formateur"""
+
+from .instrumented_verify_email_uniqueness import InstrumentedVerifyEmailUniqueness
+
+__all__ = ['InstrumentedVerifyEmailUniqueness']
@@ -0,0 +1,51 @@
+"""VerifyEmailUniqueness instrumenté : latence, refus et erreurs dans un registre de métriques"""
+
+from typing import Dict, Iterable, List, Sequence
+
+from domain.trainer.exceptions import EmailAlreadyUsedException
+from domain.trainer.repositories import TrainerAccountRequestRepositoryInterface
+from domain.trainer.services import VerifyEmailUniqueness
+from domain.trainer.value_objects import Email
+from infrastructure.monitoring import Counter, Histogram, MetricsRegistry, instrumented
+
+
+class InstrumentedVerifyEmailUniqueness(VerifyEmailUniqueness):
+
+    METHODS = ('execute', 'is_available', 'availability_map', 'execute_many')
+
+    def __init__(
+        self,
+        request_repository: TrainerAccountRequestRepositoryInterface,
+        registry: MetricsRegistry,
+        prefix: str = 'verify_email_uniqueness',
+    ):
+        super().__init__(request_repository)
+        self._registry = registry
+        self._latency: Dict[str, Histogram] = {
+            method: registry.histogram(f"{prefix}.{method}.seconds") for method in self.METHODS
+        }
+        self._errors: Dict[str, Counter] = {
+            method: registry.counter(f"{prefix}.{method}.errors") for method in self.METHODS
+        }
+        self._already_used = registry.counter(f"{prefix}.email_already_used")
+
+    @instrumented(EmailAlreadyUsedException)
+    def execute(self, email: Email) -> None:
+        try:
+            super().execute(email)
+        except EmailAlreadyUsedException:
+            if self._registry.enabled:
+                self._already_used.inc()
+            raise
+
+    @instrumented()
+    def is_available(self, email: Email) -> bool:
+        return super().is_available(email)
+
+    @instrumented()
+    def availability_map(self, emails: Iterable[Email]) -> Dict[Email, bool]:
+        return super().availability_map(emails)
+
+    @instrumented()
+    def execute_many(self, emails: Sequence[Email]) -> List[bool]:
+        return super().execute_many(emails)
@@ -0,0 +1,78 @@
+"""Tests pour la soumission asynchrone d'une demande de compte formateur"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from domain.trainer import (
+    EmailAlreadyUsedException,
+    RequiredSkillsException,
+    TrainerAccountRequestSubmitted,
+    SkillLevel,
+)
+from application.trainer import AsyncSubmitTrainerAccountRequest
+from infrastructure.events import AsyncEventBus
+from infrastructure.trainer import InMemoryAsyncTrainerAccountRequestRepository
+
+
+def test_submit():
+    async def scenario():
+        repo = InMemoryAsyncTrainerAccountRequestRepository()
+        request = await AsyncSubmitTrainerAccountRequest(repo).execute(
+            "Jean", "Dupont", "jean@example.com", [("Python", "EXPERT")]
+        )
+        assert await repo.find(request.id) == request
+        assert request.skills[0].level == SkillLevel.expert()
+
+        with pytest.raises(EmailAlreadyUsedException):
+            await AsyncSubmitTrainerAccountRequest(repo).execute(
+                "Marie", "Curie", "jean@example.com", [("Java", "BEGINNER")]
+            )
+        with pytest.raises(RequiredSkillsException):
+            await AsyncSubmitTrainerAccountRequest(repo).execute("Marie", "Curie", "marie@example.com", [])
+
+    asyncio.run(scenario())
+
+    print("Async submit test passed")
+
+
+def test_many_concurrent_submissions_on_one_loop():
+    received = []
+
+    async def scenario():
+        repo = InMemoryAsyncTrainerAccountRequestRepository()
+        async with AsyncEventBus() as bus:
+            bus.subscribe(TrainerAccountRequestSubmitted, received.extend)
+            use_case = AsyncSubmitTrainerAccountRequest(repo, publish=bus.publish_all)
+            # 2000 distinct emails, each submitted twice
+            results = await asyncio.gather(
+                *(
+                    use_case.execute("Jean", "Dupont", f"user{i % 2000}@example.com", [("Python", "EXPERT")])
+                    for i in range(4000)
+                ),
+                return_exceptions=True,
+            )
+        return repo, results
+
+    repo, results = asyncio.run(scenario())
+
+    refused = [result for result in results if isinstance(result, EmailAlreadyUsedException)]
+    assert len(refused) == 2000
+    assert asyncio.run(repo.count_all()) == 2000
+    assert len(received) == 2000
+
+    print("Concurrent submissions test passed")
+
+
+if __name__ == '__main__':
+    test_submit()
+    test_many_concurrent_submissions_on_one_loop()
+
+    print("\nAll async submission tests passed!")
@@ -0,0 +1,172 @@
+"""Tests pour l'import en masse des candidatures formateur"""
+
+import io
+import json
+import sys
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+)
+from application.trainer import ImportTrainerApplications, read_csv, read_jsonl
+from infrastructure.trainer import IndexedInMemoryTrainerAccountRequestRepository
+
+
+CSV_FILE = """first_name,last_name,email,skills
+Jean,Dupont,jean@example.com,Python:EXPERT;Java:BEGINNER
+Marie,Curie,not-an-email,Python:EXPERT
+J,Doe,short@example.com,Python:EXPERT
+Paul,Martin,paul@example.com,
+Anne,Durand,taken@example.com,Go:INTERMEDIATE
+Luc,Petit,JEAN@example.com,Rust:EXPERT
+Eva,Moreau,eva@example.com,Python:GURU
+"""
+
+
+def create_repository_with_taken_email():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    repo.save(TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", "taken@example.com"),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    ))
+    return repo
+
+
+def test_import_csv_with_error_report():
+    repo = create_repository_with_taken_email()
+    use_case = ImportTrainerApplications(repo, chunk_size=3)
+
+    report = use_case.execute(read_csv(io.StringIO(CSV_FILE)))
+
+    assert report.rows_read == 7
+    assert report.imported == 1
+    assert report.rejected == 6
+    assert report.chunks == 3
+    assert [error.record_number for error in report.errors] == [2, 3, 4, 5, 6, 7]
+    reasons = {error.record_number: error.reason for error in report.errors}
+    assert "not a valid email" in reasons[2]
+    assert "First name" in reasons[3]
+    assert "skill is required" in reasons[4]
+    assert "already used" in reasons[5]
+    assert "already used" in reasons[6]
+    assert "invalid" in reasons[7]
+
+    imported = repo.find_by_email(Email("jean@example.com"))
+    assert [skill.level for skill in imported.skills] == [SkillLevel.expert(), SkillLevel.beginner()]
+    # read back like from a database: the pending events stay on the saved aggregate
+    assert imported.events == ()
+    assert report.rows_per_second > 0
+
+    print("CSV import test passed")
+
+
+def test_import_jsonl(tmp_path):
+    path = tmp_path / "applications.jsonl"
+    lines = [
+        json.dumps({"first_name": "Jean", "last_name": "Dupont", "email": "jean@example.com",
+                    "skills": [{"name": "Python", "level": "EXPERT"}]}),
+        "{not json",
+        "",
+        json.dumps({"first_name": "Marie", "email": "marie@example.com", "skills": "Python:EXPERT"}),
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"first_name": "Paul", "last_name": "Martin", "email": "paul@example.com",
+                    "skills": "Python:EXPERT"}),
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+
+    report = ImportTrainerApplications(repo).execute(read_jsonl(path))
+
+    assert report.rows_read == 5
+    assert report.imported == 2
+    reasons = [error.reason for error in report.errors]
+    assert "not valid JSON" in reasons[0]
+    assert reasons[1] == "Missing field 'last_name'"
+    assert "not a JSON object" in reasons[2]
+    assert repo.count_all() == 2
+
+    print("JSONL import test passed")
+
+
+def test_import_streams_rows():
+    consumed = []
+
+    def rows():
+        for i in range(10):
+            consumed.append(i)
+            yield {"first_name": "Jean", "last_name": "Dupont",
+                   "email": f"user{i}@example.com", "skills": "Python:EXPERT"}
+
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    saved_batches = []
+    save_many = repo.save_many
+
+    def recording_save_many(requests):
+        requests = list(requests)
+        saved_batches.append((len(requests), len(consumed)))
+        save_many(requests)
+
+    repo.save_many = recording_save_many
+
+    report = ImportTrainerApplications(repo, chunk_size=4).execute(rows())
+
+    assert report.imported == 10
+    assert saved_batches == [(4, 4), (4, 8), (2, 10)]
+
+    print("Streaming import test passed")
+
+
+def test_badly_typed_fields_are_rejected_and_bugs_are_not():
+    base = {"first_name": "Jean", "last_name": "Dupont", "email": "jean@example.com", "skills": "Python:EXPERT"}
+    rows = [
+        {**base, "first_name": 42},
+        {**base, "skills": 3},
+        {**base, "skills": ["Python:EXPERT"]},
+        {**base, "skills": [{"name": "Python", "level": None}]},
+        base,
+    ]
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+
+    report = ImportTrainerApplications(repo).execute(rows)
+
+    assert [error.record_number for error in report.errors] == [1, 2, 3, 4]
+    assert [error.reason for error in report.errors] == [
+        "Field 'first_name' must be text, not int",
+        "Skills must be a 'name:LEVEL;...' string or a list of skills",
+        "Each skill must be an object with a name and a level",
+        "Missing skill field 'level'",
+    ]
+    assert report.imported == 1
+
+    class BrokenRow(dict):
+        def get(self, key, default=None):
+            raise TypeError("a programming error")
+
+    # a bug stops the import instead of being reported as an invalid row
+    with pytest.raises(TypeError):
+        ImportTrainerApplications(repo).execute([BrokenRow(base)])
+
+    print("Badly typed fields test passed")
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    test_import_csv_with_error_report()
+    with tempfile.TemporaryDirectory() as directory:
+        test_import_jsonl(Path(directory))
+    test_import_streams_rows()
+    test_badly_typed_fields_are_rejected_and_bugs_are_not()
+
+    print("\nAll import tests passed!")
@@ -0,0 +1,161 @@
+"""Tests pour la validation parallèle des candidatures"""
+
+import pickle
+import sys
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    FullName,
+    CandidatInfo,
+    SkillLevel,
+    TrainerAccountRequestSubmitted,
+)
+from application.trainer import InvalidRow, ImportTrainerApplications, ParallelCandidateValidator
+from application.trainer.validation import validate_rows, rebuild_request
+from infrastructure.trainer import IndexedInMemoryTrainerAccountRequestRepository
+
+
+ROWS = [
+    {'first_name': ' jean ', 'last_name': 'dupont', 'email': ' Jean@Example.com', 'skills': 'python:expert;Java:BEGINNER'},
+    {'first_name': 'Marie', 'last_name': 'Curie', 'email': 'not-an-email', 'skills': 'Python:EXPERT'},
+    InvalidRow("Malformed JSON"),
+    {'first_name': 'Paul', 'last_name': 'Martin', 'email': 'paul@example.com', 'skills': ''},
+    {'first_name': 'Anne', 'last_name': 'Durand', 'email': 'anne@example.com', 'skills': 'Go:INTERMEDIATE'},
+]
+
+
+class FailingRow(dict):
+    # module level, so the workers can unpickle it
+    def get(self, key, default=None):
+        raise RuntimeError("a programming error")
+
+
+def test_validate_rows_returns_compact_normalized_results():
+    valid, rejected = validate_rows(list(enumerate(ROWS, start=1)))
+
+    assert [candidate[0] for candidate in valid] == [1, 5]
+    record_number, request_id, first_name, last_name, email, skills = valid[0]
+    assert (first_name, last_name, email) == ("Jean", "Dupont", "jean@example.com")
+    assert [(name, level) for _, name, level in skills] == [("Python", "EXPERT"), ("Java", "BEGINNER")]
+    assert [error[0] for error in rejected] == [2, 3, 4]
+    assert rejected[1] == (3, None, "Malformed JSON")
+
+    # plain tuples of strings: cheap to send back from a worker
+    assert pickle.loads(pickle.dumps((valid, rejected))) == (valid, rejected)
+
+    print("Compact results test passed")
+
+
+def test_rebuild_request_matches_validated_construction():
+    valid, _ = validate_rows([(1, ROWS[0])])
+
+    request = rebuild_request(valid[0])
+
+    assert request.candidate_info == CandidatInfo(FullName("jean", "dupont"), Email("Jean@Example.com"))
+    assert request.skills[0].level is SkillLevel.expert()
+    assert request.id.value == valid[0][1]
+    assert request.skills[0].id.value == valid[0][5][0][0]
+    assert isinstance(request.events[0], TrainerAccountRequestSubmitted)
+
+    print("Rebuild test passed")
+
+
+def test_build_requests_in_worker_processes():
+    rows = ROWS * 50
+    with ParallelCandidateValidator(max_workers=2, chunk_size=7) as validator:
+        chunks = list(validator.build_requests(rows))
+
+    # one result per chunk of rows, so each can be saved as it arrives
+    assert len(chunks) == 36
+    requests = [request for chunk_requests, _ in chunks for request in chunk_requests]
+    errors = [error for _, chunk_errors in chunks for error in chunk_errors]
+
+    assert [record_number for record_number, _ in requests] == [
+        number for number, row in enumerate(rows, start=1) if (number - 1) % 5 in (0, 4)
+    ]
+    assert len(errors) == 150
+    assert errors[0].record_number == 2
+
+    print("Worker processes test passed")
+
+
+def test_inline_validation_gives_the_same_results():
+    with ParallelCandidateValidator(max_workers=0, chunk_size=2) as validator:
+        inline = list(validator.validate(ROWS))
+    with ParallelCandidateValidator(max_workers=2, chunk_size=2) as validator:
+        parallel = list(validator.validate(ROWS))
+
+    def without_ids(chunks):
+        return [
+            ([(candidate[0], *candidate[2:5]) for candidate in valid], rejected)
+            for valid, rejected in chunks
+        ]
+
+    assert without_ids(inline) == without_ids(parallel)
+
+    print("Inline validation test passed")
+
+
+def test_import_saves_each_validated_chunk():
+    saved_batches = []
+
+    class RecordingRepository(IndexedInMemoryTrainerAccountRequestRepository):
+        def save_many(self, requests):
+            requests = list(requests)
+            saved_batches.append(len(requests))
+            super().save_many(requests)
+
+    rows = ROWS + [dict(ROWS[0], email="other@example.com"), ROWS[0]]
+    repository = RecordingRepository()
+    with ParallelCandidateValidator(max_workers=2, chunk_size=2) as validator:
+        report = ImportTrainerApplications(repository, build_requests=validator.build_requests).execute(rows)
+
+    assert saved_batches == [1, 0, 2, 0]
+    assert report.rows_read == 7
+    assert report.imported == 3
+    assert report.chunks == 4
+    assert [error.record_number for error in report.errors] == [2, 3, 4, 7]
+    assert "already used" in report.errors[-1].reason
+
+    print("Import of validated chunks test passed")
+
+
+def test_failed_chunk_leaves_no_work_behind():
+    submitted = []
+    with ParallelCandidateValidator(max_workers=2, chunk_size=1) as validator:
+        executor = validator._get_executor()
+        submit = executor.submit
+
+        def recording_submit(*args):
+            future = submit(*args)
+            submitted.append(future)
+            return future
+
+        executor.submit = recording_submit
+        rows = [FailingRow(ROWS[0])] + [ROWS[0]] * 6
+        with pytest.raises(RuntimeError):
+            list(validator.validate(rows))
+
+        # the chunks after the failed one were cancelled or ran to the end before the call returned
+        assert len(submitted) == 4
+        assert all(future.done() for future in submitted)
+
+    print("Failed chunk test passed")
+
+
+if __name__ == '__main__':
+    test_validate_rows_returns_compact_normalized_results()
+    test_rebuild_request_matches_validated_construction()
+    test_build_requests_in_worker_processes()
+    test_inline_validation_gives_the_same_results()
+    test_import_saves_each_validated_chunk()
+    test_failed_chunk_leaves_no_work_behind()
+
+    print("\nAll parallel validation tests passed!")
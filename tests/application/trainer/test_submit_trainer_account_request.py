@@ -0,0 +1,95 @@
+"""Tests pour la soumission d'une demande de compte formateur"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from domain.trainer import EmailAlreadyUsedException, TrainerAccountRequestSubmitted
+from application.trainer import SubmitTrainerAccountRequest, AsyncSubmitTrainerAccountRequest
+from infrastructure.monitoring import Tracer
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    InMemoryAsyncTrainerAccountRequestRepository,
+)
+
+STEPS = [
+    "submit.candidate_info",
+    "submit.skills",
+    "submit.email_uniqueness",
+    "submit.aggregate",
+    "submit.save",
+    "submit.publish",
+]
+
+
+def test_submit():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    published = []
+    use_case = SubmitTrainerAccountRequest(repo, publish=published.extend)
+
+    request = use_case.execute("Jean", "Dupont", "jean@example.com", [("Python", "EXPERT")])
+
+    assert repo.find(request.id) == request
+    assert isinstance(published[0], TrainerAccountRequestSubmitted)
+    with pytest.raises(EmailAlreadyUsedException):
+        use_case.execute("Marie", "Curie", "jean@example.com", [("Java", "BEGINNER")])
+
+    print("Submit test passed")
+
+
+def test_each_step_is_traced():
+    tracer = Tracer()
+    use_case = SubmitTrainerAccountRequest(
+        IndexedInMemoryTrainerAccountRequestRepository(), publish=lambda events: None, trace=tracer.span,
+    )
+
+    use_case.execute("Jean", "Dupont", "jean@example.com", [("Python", "EXPERT")])
+    with pytest.raises(EmailAlreadyUsedException):
+        use_case.execute("Marie", "Curie", "jean@example.com", [("Java", "BEGINNER")])
+
+    succeeded, refused = tracer.recent_traces()
+    assert succeeded.name == "submit"
+    assert [span.name for span in succeeded.children] == STEPS
+    assert refused.error == "EmailAlreadyUsedException"
+    assert refused.children[-1].name == "submit.email_uniqueness"
+
+    print("Submit tracing test passed")
+
+
+def test_async_steps_are_traced_per_submission():
+    tracer = Tracer()
+
+    async def publish(events):
+        await asyncio.sleep(0)
+
+    async def scenario():
+        use_case = AsyncSubmitTrainerAccountRequest(
+            InMemoryAsyncTrainerAccountRequestRepository(), publish=publish, trace=tracer.span,
+        )
+        await asyncio.gather(*(
+            use_case.execute("Jean", "Dupont", f"user{i}@example.com", [("Python", "EXPERT")])
+            for i in range(20)
+        ))
+
+    asyncio.run(scenario())
+
+    traces = tracer.recent_traces()
+    assert len(traces) == 20
+    assert all([span.name for span in root.children] == STEPS for root in traces)
+
+    print("Async submit tracing test passed")
+
+
+if __name__ == '__main__':
+    test_submit()
+    test_each_step_is_traced()
+    test_async_steps_are_traced_per_submission()
+
+    print("\nAll submit tests passed!")
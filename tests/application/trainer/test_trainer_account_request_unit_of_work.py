@@ -0,0 +1,175 @@
+"""Tests pour la Unit of Work des demandes de compte formateur"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    TrainerAccountRequestSubmitted,
+    RequestStatus,
+)
+from application.trainer import TrainerAccountRequestUnitOfWork
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import SqliteTrainerAccountRequestRepository
+
+
+class CountingRepository(SqliteTrainerAccountRequestRepository):
+
+    def __init__(self, pool):
+        super().__init__(pool)
+        self.saved = []
+        self.reads = 0
+
+    def save_many(self, requests):
+        requests = list(requests)
+        self.saved.append([request.id for request in requests])
+        super().save_many(requests)
+
+    def find(self, request_id):
+        self.reads += 1
+        return super().find(request_id)
+
+
+def create_request(email: str = "jean.dupont@example.com") -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.beginner())],
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "uow.db"))
+    yield CountingRepository(pool)
+    pool.close()
+
+
+def stored(repo, *requests):
+    for request in requests:
+        request.clear_events()
+    SqliteTrainerAccountRequestRepository.save_many(repo, requests)
+
+
+def test_identity_map(repo):
+    request = create_request()
+    stored(repo, request)
+
+    uow = TrainerAccountRequestUnitOfWork(repo)
+    first = uow.get(request.id)
+
+    assert first is uow.get(request.id)
+    assert first is uow.get_by_email(request.candidate_info.email)
+    assert uow.get_many([request.id]) == [first]
+    assert uow.get_many([request.id])[0] is first
+    assert repo.reads == 1
+
+    print("Identity map test passed")
+
+
+def test_commit_flushes_only_changed_aggregates(repo):
+    unchanged, approved, upgraded = (create_request(f"user{i}@example.com") for i in range(3))
+    stored(repo, unchanged, approved, upgraded)
+
+    with TrainerAccountRequestUnitOfWork(repo) as uow:
+        for request in (unchanged, approved, upgraded):
+            uow.get(request.id)
+        uow.get(approved.id).approve()
+        uow.get(upgraded.id).skills[0].upgrade_level(SkillLevel.expert())
+
+    assert repo.saved == [[approved.id, upgraded.id]]
+    assert repo.find(approved.id).statut == RequestStatus.approved()
+    assert repo.find(upgraded.id).skills[0].level == SkillLevel.expert()
+
+    print("Dirty tracking test passed")
+
+
+def test_nothing_to_flush(repo):
+    request = create_request()
+    stored(repo, request)
+
+    uow = TrainerAccountRequestUnitOfWork(repo)
+    uow.get(request.id)
+
+    assert uow.commit() == []
+    assert repo.saved == []
+
+    print("Nothing to flush test passed")
+
+
+def test_new_aggregates_and_events(repo):
+    published = []
+    uow = TrainerAccountRequestUnitOfWork(repo, publish=published.extend)
+    requests = [create_request(f"user{i}@example.com") for i in range(2)]
+    for request in requests:
+        uow.add(request)
+
+    events = uow.commit()
+
+    assert len(repo.saved) == 1
+    assert [event.request_id for event in events] == [request.id for request in requests]
+    assert all(isinstance(event, TrainerAccountRequestSubmitted) for event in events)
+    assert published == events
+    assert uow.collected_events == events
+    assert all(request.events == () for request in requests)
+    assert not uow.dirty()
+
+    # committed: a second commit has nothing to do
+    assert uow.commit() == []
+    assert len(repo.saved) == 1
+
+    print("New aggregates test passed")
+
+
+def test_remove(repo):
+    request = create_request()
+    stored(repo, request)
+
+    with TrainerAccountRequestUnitOfWork(repo) as uow:
+        uow.remove(uow.get(request.id))
+        assert uow.get(request.id) is None
+
+    assert repo.find(request.id) is None
+
+    print("Remove test passed")
+
+
+def test_rollback_on_error(repo):
+    with pytest.raises(RuntimeError):
+        with TrainerAccountRequestUnitOfWork(repo) as uow:
+            uow.add(create_request())
+            raise RuntimeError("abort")
+
+    assert repo.saved == []
+    assert repo.count_all() == 0
+
+    print("Rollback test passed")
+
+
+if __name__ == '__main__':
+    tests = [
+        test_identity_map,
+        test_commit_flushes_only_changed_aggregates,
+        test_nothing_to_flush,
+        test_new_aggregates_and_events,
+        test_remove,
+        test_rollback_on_error,
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for index, test in enumerate(tests):
+            pool = SqliteConnectionPool(str(Path(directory) / f"uow{index}.db"))
+            test(CountingRepository(pool))
+            pool.close()
+
+    print("\nAll Unit of Work tests passed!")
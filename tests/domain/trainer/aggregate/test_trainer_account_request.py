@@ -18,6 +18,12 @@ from domain.trainer import (
     TrainerAccountRequest,
     RequiredSkillsException,
     TrainerAccountRequestSubmitted,
+    TrainerAccountRequestApproved,
+    TrainerAccountRequestRejected,
+    SkillLevelUpgraded,
+    SkillId,
+    InvalidStatusTransitionException,
+    SkillNotFoundException,
 )
 
 def create_candidat_info(email: str = "jean.dupont@example.com") -> CandidatInfo:
@@ -95,10 +101,14 @@ def test_skills_encapsulation():
     request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
 
     skills = request.skills
-    initial_count = len(skills)
-    skills.append(Skill.create(SkillName("Ruby"), SkillLevel.beginner()))
+    with pytest.raises(AttributeError):
+        skills.append(Skill.create(SkillName("Ruby"), SkillLevel.beginner()))
 
-    assert len(request.skills) == initial_count
+    # read-only, so handed out without a copy
+    assert request.skills is skills
+    assert request.events is request.events
+    assert list(request.iter_skills()) == list(skills)
+    assert request.skill_count == len(skills)
 
     print("Skills encapsulation test passed")
 
@@ -114,6 +124,47 @@ def test_clear_events():
     print("Clear events test passed")
 
 
+def test_pull_events():
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+
+    events = request.pull_events()
+
+    assert len(events) == 1
+    assert isinstance(events[0], TrainerAccountRequestSubmitted)
+    assert request.events == ()
+    assert request.pull_events() == ()
+
+    print("Pull events test passed")
+
+
+def test_rehydrate_rebuilds_a_stored_request():
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    request.approve()
+    skill = request.skills[0]
+
+    rehydrated = TrainerAccountRequest._rehydrate(
+        request.id.value,
+        request.candidate_info.full_name.first_name,
+        request.candidate_info.full_name.last_name,
+        request.candidate_info.email.value,
+        [(skill.id.value, skill.name.value, skill.level.value) for skill in request.skills],
+        request.statut.value,
+        request.submission_date,
+    )
+
+    assert rehydrated == request
+    assert rehydrated.candidate_info == request.candidate_info
+    assert hash(rehydrated.candidate_info) == hash(request.candidate_info)
+    assert rehydrated.statut is RequestStatus.approved()
+    assert rehydrated.skills[0].id == skill.id and rehydrated.skills[0].level is skill.level
+    assert rehydrated.submission_date == request.submission_date
+    assert rehydrated.events == ()
+    with pytest.raises(RequiredSkillsException):
+        TrainerAccountRequest._rehydrate(request.id.value, "Jean", "Dupont", "jean@example.com", [], "APPROVED", datetime.now())
+
+    print("Rehydrate test passed")
+
+
 def test_constructor_validates_skills():
     candidat_info = create_candidat_info()
 
@@ -129,6 +180,56 @@ def test_constructor_validates_skills():
     print("Constructor validates skills test passed")
 
 
+def test_approve_and_reject():
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    request.approve()
+    assert request.statut == RequestStatus.approved()
+
+    other = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    other.reject()
+    assert other.statut == RequestStatus.rejected()
+
+    assert isinstance(request.events[-1], TrainerAccountRequestApproved)
+    assert isinstance(other.events[-1], TrainerAccountRequestRejected)
+    assert request.events[-1].request_id == request.id
+
+    print("Approve and reject test passed")
+
+
+def test_upgrade_skill():
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    skill = request.skills[0]
+
+    request.upgrade_skill(skill.id, SkillLevel.expert())
+
+    assert request.skills[0].level == SkillLevel.expert()
+    event = request.events[-1]
+    assert isinstance(event, SkillLevelUpgraded)
+    assert event.skill_id == skill.id
+    assert event.new_level == SkillLevel.expert()
+
+    with pytest.raises(SkillNotFoundException):
+        request.upgrade_skill(SkillId.generate(), SkillLevel.expert())
+
+    print("Upgrade skill test passed")
+
+
+def test_final_status_cannot_change():
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    request.reject()
+
+    with pytest.raises(InvalidStatusTransitionException) as error:
+        request.approve()
+    assert error.value.current == RequestStatus.rejected()
+    assert error.value.target == RequestStatus.approved()
+
+    with pytest.raises(InvalidStatusTransitionException):
+        request.reject()
+    assert request.statut == RequestStatus.rejected()
+
+    print("Final status test passed")
+
+
 if __name__ == '__main__':
     from datetime import datetime
 
@@ -138,6 +239,11 @@ if __name__ == '__main__':
     test_aggregate_has_global_identity()
     test_skills_encapsulation()
     test_clear_events()
+    test_pull_events()
+    test_rehydrate_rebuilds_a_stored_request()
     test_constructor_validates_skills()
+    test_approve_and_reject()
+    test_upgrade_skill()
+    test_final_status_cannot_change()
 
     print("\nAll TrainerAccountRequest Aggregate tests passed!")
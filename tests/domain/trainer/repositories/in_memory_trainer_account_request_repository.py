@@ -12,6 +12,7 @@ sys.path.insert(0, str(src_path))
 sys.path.insert(0, str(project_root))
 
 from domain.trainer.value_objects import RequestId, Email, RequestStatus
+from domain.trainer.exceptions import EmailAlreadyUsedException
 from domain.trainer.repositories import TrainerAccountRequestRepositoryInterface
 
 
@@ -20,9 +21,14 @@ class InMemoryTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInt
     def __init__(self):
         """Initialize empty storage"""
         self._requests: Dict[str, TrainerAccountRequest] = {}
+        self._reservations: Dict[str, str] = {}
 
     def save(self, request: TrainerAccountRequest) -> None:
         """Save in memory"""
+        email = request.candidate_info.email.value
+        if self._reservations.get(email, request.id.value) != request.id.value:
+            raise EmailAlreadyUsedException(request.candidate_info.email)
+        self._reservations.pop(email, None)
         self._requests[request.id.value] = request
 
     def find(self, request_id: RequestId) -> Optional[TrainerAccountRequest]:
@@ -36,10 +42,7 @@ class InMemoryTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInt
         return None
 
     def find_pending_validation(self) -> List[TrainerAccountRequest]:
-        return [
-            request for request in self._requests.values()
-            if request.statut == RequestStatus.pending_validation()
-        ]
+        return self.find_by_status(RequestStatus.pending_validation())
 
     def find_by_status(self, status: RequestStatus) -> List[TrainerAccountRequest]:
         return [
@@ -50,15 +53,26 @@ class InMemoryTrainerAccountRequestRepository(TrainerAccountRequestRepositoryInt
     def exists_by_email(self, email: Email) -> bool:
         return self.find_by_email(email) is not None
 
+    def reserve_email(self, email: Email, request_id: RequestId) -> bool:
+        owner = self.find_by_email(email)
+        if owner is not None:
+            return owner.id == request_id
+        return self._reservations.setdefault(email.value, request_id.value) == request_id.value
+
+    def release_email(self, email: Email, request_id: RequestId) -> None:
+        if self._reservations.get(email.value) == request_id.value:
+            del self._reservations[email.value]
+
     def delete(self, request: TrainerAccountRequest) -> None:
         if request.id.value in self._requests:
             del self._requests[request.id.value]
 
     def count_by_status(self, status: RequestStatus) -> int:
-        return len(self.find_by_status(status))
+        return sum(1 for request in self._requests.values() if request.statut == status)
 
     def count_all(self) -> int:
         return len(self._requests)
 
     def clear(self) -> None:
         self._requests.clear()
+        self._reservations.clear()
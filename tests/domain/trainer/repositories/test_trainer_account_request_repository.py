@@ -1,6 +1,7 @@
 """Tests pour le repository de demande de compte formateur"""
 
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent.parent.parent.parent
@@ -8,6 +9,11 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 sys.path.insert(0, str(project_root))
 
+from domain.trainer.repositories import (
+    TrainerAccountRequestRepositoryInterface,
+    AsyncTrainerAccountRequestRepository,
+)
+from domain.trainer.exceptions import EmailAlreadyUsedException
 from domain.trainer import (
     Email,
     CandidatInfo,
@@ -16,6 +22,8 @@ from domain.trainer import (
     SkillLevel,
     TrainerAccountRequest,
     RequestStatus,
+    RequestId,
+    RequestPage,
 )
 
 from tests.domain.trainer.repositories.in_memory_trainer_account_request_repository import (
@@ -31,6 +39,21 @@ def create_skills():
     return [Skill.create(SkillName("Python"), SkillLevel.expert())]
 
 
+def create_dated_requests(count: int):
+    # pairs of requests share a submission date: the id breaks the tie
+    base = datetime(2024, 1, 1, 9, 0)
+    return [
+        TrainerAccountRequest(
+            request_id=RequestId.generate(),
+            candidate_info=create_candidat_info(f"dated{i}@example.com"),
+            skills=create_skills(),
+            status=RequestStatus.pending_validation(),
+            submission_date=base + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+
+
 def test_save_and_find():
     repo = InMemoryTrainerAccountRequestRepository()
     request = TrainerAccountRequest.submit(
@@ -153,6 +176,69 @@ def test_find_by_status():
     print("Find by status test passed")
 
 
+def test_batch_operations_default_implementations():
+    repo = InMemoryTrainerAccountRequestRepository()
+    requests = [
+        TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills())
+        for i in range(3)
+    ]
+
+    repo.save_many(requests)
+
+    assert repo.count_all() == 3
+    found = repo.find_many([requests[2].id, requests[0].id])
+    assert [r.id for r in found] == [requests[2].id, requests[0].id]
+    used = repo.exists_by_emails([Email("user1@example.com"), Email("new@example.com")])
+    assert used == {Email("user1@example.com")}
+
+    print("Batch operations test passed")
+
+
+def test_status_pagination():
+    repo = InMemoryTrainerAccountRequestRepository()
+    requests = create_dated_requests(7)
+    for request in reversed(requests):
+        repo.save(request)
+    expected = sorted(requests, key=RequestPage.cursor_of)
+
+    first = repo.find_by_status_page(RequestStatus.pending_validation(), limit=3)
+    second = repo.find_by_status_page(RequestStatus.pending_validation(), first.next_cursor, 3)
+    last = repo.find_by_status_page(RequestStatus.pending_validation(), second.next_cursor, 3)
+
+    assert [r.id for r in first] == [r.id for r in expected[:3]]
+    assert [r.id for r in second] == [r.id for r in expected[3:6]]
+    assert [r.id for r in last] == [expected[6].id]
+    assert not last.has_next
+    assert len(repo.find_by_status_page(RequestStatus.approved())) == 0
+
+    iterated = list(repo.iter_by_status(RequestStatus.pending_validation(), batch_size=2))
+    assert [r.id for r in iterated] == [r.id for r in expected]
+
+    print("Status pagination test passed")
+
+
+def test_email_reservation_is_part_of_the_contract():
+    for interface in (TrainerAccountRequestRepositoryInterface, AsyncTrainerAccountRequestRepository):
+        assert {'reserve_email', 'release_email'} <= interface.__abstractmethods__
+
+    repo = InMemoryTrainerAccountRequestRepository()
+    request = TrainerAccountRequest.submit(create_candidat_info("held@example.com"), create_skills())
+    other = TrainerAccountRequest.submit(create_candidat_info("held@example.com"), create_skills())
+
+    assert repo.reserve_email(Email("held@example.com"), request.id)
+    assert not repo.reserve_email(Email("held@example.com"), other.id)
+    try:
+        repo.save(other)
+        assert False, "a reserved email must refuse another request"
+    except EmailAlreadyUsedException:
+        pass
+    repo.save(request)
+    assert not repo.reserve_email(Email("held@example.com"), other.id)
+    assert repo.reserve_email(Email("held@example.com"), request.id)
+
+    print("Email reservation contract test passed")
+
+
 if __name__ == '__main__':
     test_save_and_find()
     test_find_by_email()
@@ -161,5 +247,8 @@ if __name__ == '__main__':
     test_delete()
     test_clear()
     test_find_by_status()
+    test_batch_operations_default_implementations()
+    test_status_pagination()
+    test_email_reservation_is_part_of_the_contract()
 
     print("\nAll Repository tests passed!")
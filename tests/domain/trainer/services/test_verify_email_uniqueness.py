@@ -136,6 +136,58 @@ def test_case_insensitive_email_check():
     print("Case-insensitive email check test passed")
 
 
+class CountingRepository(InMemoryTrainerAccountRequestRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.bulk_queries = 0
+        self.single_queries = 0
+
+    def exists_by_email(self, email):
+        self.single_queries += 1
+        return super().exists_by_email(email)
+
+    def exists_by_emails(self, emails):
+        self.bulk_queries += 1
+        return {email for email in emails if self.find_by_email(email) is not None}
+
+
+def test_availability_map():
+    repo = CountingRepository()
+    repo.save(TrainerAccountRequest.submit(create_candidat_info("taken@example.com"), create_skills()))
+    verifier = VerifyEmailUniqueness(repo)
+
+    availability = verifier.availability_map([
+        Email("taken@example.com"),
+        Email("free@example.com"),
+        Email("TAKEN@example.com"),
+    ])
+
+    assert availability == {Email("taken@example.com"): False, Email("free@example.com"): True}
+    assert repo.bulk_queries == 1
+
+    print("Availability map test passed")
+
+
+def test_execute_many_detects_duplicates_in_batch():
+    repo = CountingRepository()
+    repo.save(TrainerAccountRequest.submit(create_candidat_info("taken@example.com"), create_skills()))
+    verifier = VerifyEmailUniqueness(repo)
+
+    results = verifier.execute_many([
+        Email("free@example.com"),
+        Email("taken@example.com"),
+        Email("FREE@example.com"),
+        Email("other@example.com"),
+    ])
+
+    assert results == [True, False, False, True]
+    assert repo.bulk_queries == 1
+    assert repo.single_queries == 0
+
+    print("Execute many test passed")
+
+
 if __name__ == '__main__':
     test_email_available()
     test_email_already_used()
@@ -143,5 +195,7 @@ if __name__ == '__main__':
     test_is_available_false()
     test_different_emails_dont_conflict()
     test_case_insensitive_email_check()
+    test_availability_map()
+    test_execute_many_detects_duplicates_in_batch()
 
     print("\nAll VerifyEmailUniqueness tests passed!")
@@ -1,5 +1,6 @@
 """Tests pour les value objects du domaine Formateur"""
 
+import pickle
 import sys
 from pathlib import Path
 
@@ -122,6 +123,87 @@ def test_candidat_info():
     print("CandidatInfo tests passed")
 
 
+def test_equal_value_objects_have_equal_hashes():
+    assert hash(Email('john@example.com')) == hash(Email('JOHN@example.com'))
+    assert hash(FullName('john', 'doe')) == hash(FullName('John', 'Doe'))
+
+    request_id = RequestId.generate()
+    assert hash(RequestId.from_string(str(request_id))) == hash(request_id)
+
+    index = {Email('john@example.com'): 1, RequestStatus.approved(): 2}
+    assert index[Email('JOHN@EXAMPLE.COM')] == 1
+    assert index[RequestStatus('approved')] == 2
+    assert len({SkillLevel('EXPERT'), SkillLevel.expert(), SkillLevel.beginner()}) == 2
+
+    candidat_info = CandidatInfo.create('john', 'doe', 'john@example.com')
+    assert candidat_info in {CandidatInfo.create('John', 'Doe', 'JOHN@example.com')}
+
+    print("Value object hash tests passed")
+
+
+def test_value_objects_survive_pickle():
+    candidat_info = CandidatInfo.create('john', 'doe', 'john@example.com')
+    hash(candidat_info)
+
+    restored = pickle.loads(pickle.dumps(candidat_info))
+
+    assert restored == candidat_info
+    assert hash(restored) == hash(candidat_info)
+    assert restored.email.value == 'john@example.com'
+
+    print("Value object pickle tests passed")
+
+
+def test_status_and_level_are_interned():
+    assert RequestStatus('approved') is RequestStatus.approved()
+    assert RequestStatus('Pending_Validation') is RequestStatus.pending_validation()
+    assert SkillLevel('expert') is SkillLevel.expert()
+    assert SkillLevel('INTERMEDIATE') is SkillLevel.intermediate()
+
+    assert pickle.loads(pickle.dumps(RequestStatus.rejected())) is RequestStatus.rejected()
+    assert pickle.loads(pickle.dumps(SkillLevel.beginner())) is SkillLevel.beginner()
+
+    invalid_values = (
+        lambda: RequestStatus('DONE'),
+        lambda: SkillLevel('GURU'),
+        # unhashable or not text: still the domain's invalid-value error
+        lambda: RequestStatus(['APPROVED']),
+        lambda: SkillLevel({'level': 'EXPERT'}),
+        lambda: RequestStatus(None),
+        lambda: SkillLevel(3),
+    )
+    for invalid in invalid_values:
+        try:
+            invalid()
+            assert False
+        except ValueError:
+            pass
+
+    assert SkillLevel.intermediate().is_at_least(SkillLevel.intermediate())
+    assert not SkillLevel.intermediate().is_at_least(SkillLevel.expert())
+
+    print("Interning tests passed")
+
+
+def test_from_trusted_skips_validation_only():
+    full_name = FullName._from_trusted("Jean", "Dupont")
+    email = Email._from_trusted("jean@example.com")
+
+    assert full_name == FullName("jean", "dupont")
+    assert hash(email) == hash(Email("jean@example.com"))
+    assert CandidatInfo._from_trusted(full_name, email) == CandidatInfo(full_name, email)
+    assert SkillLevel._from_trusted("EXPERT") is SkillLevel.expert()
+    assert RequestStatus._from_trusted("APPROVED") is RequestStatus.approved()
+
+    try:
+        email._value = "other@example.com"
+        assert False
+    except AttributeError:
+        pass
+
+    print("Trusted construction tests passed")
+
+
 if __name__ == '__main__':
     test_email()
     test_full_name()
@@ -131,4 +213,8 @@ if __name__ == '__main__':
     test_request_id()
     test_request_status()
     test_candidat_info()
+    test_equal_value_objects_have_equal_hashes()
+    test_value_objects_survive_pickle()
+    test_status_and_level_are_interned()
+    test_from_trusted_skips_validation_only()
     print("\nAll tests passed!")
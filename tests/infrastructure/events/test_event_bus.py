@@ -0,0 +1,300 @@
+"""Tests pour les bus d'événements domaine"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    TrainerAccountRequestSubmitted,
+    EmailAlreadyUsedException,
+)
+from infrastructure.events import (
+    EventBus,
+    AsyncEventBus,
+    save_and_publish,
+    save_and_publish_async,
+)
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    InMemoryAsyncTrainerAccountRequestRepository,
+)
+
+
+def create_request(email: str = "jean.dupont@example.com") -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+
+
+def test_sync_bus_dispatches_by_type():
+    bus = EventBus()
+    submitted, everything = [], []
+    bus.subscribe(TrainerAccountRequestSubmitted, submitted.append)
+    bus.subscribe(object, everything.append)
+
+    event = create_request().pull_events()[0]
+    bus.publish(event)
+    bus.publish("other event")
+
+    assert submitted == [event]
+    assert everything == [event, "other event"]
+
+    print("Sync bus dispatch test passed")
+
+
+def test_sync_bus_isolates_failing_handler():
+    bus = EventBus()
+    received = []
+
+    def failing(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(object, failing)
+    bus.subscribe(object, received.append)
+    bus.publish("event")
+
+    assert received == ["event"]
+    assert bus.failed == 1
+
+    print("Sync bus failing handler test passed")
+
+
+def test_save_and_publish():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    bus = EventBus()
+    received = []
+    bus.subscribe(TrainerAccountRequestSubmitted, received.append)
+
+    requests = [create_request(f"user{i}@example.com") for i in range(3)]
+    save_and_publish(repo, requests, bus)
+
+    assert [event.request_id for event in received] == [request.id for request in requests]
+    assert all(request.events == () for request in requests)
+    assert repo.count_all() == 3
+
+    print("Save and publish test passed")
+
+
+def test_save_and_publish_keeps_events_when_save_fails():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    repo.save(create_request())
+    bus = EventBus()
+    received = []
+    bus.subscribe(object, received.append)
+
+    duplicate = create_request()
+    with pytest.raises(EmailAlreadyUsedException):
+        save_and_publish(repo, [duplicate], bus)
+
+    assert received == []
+    assert len(duplicate.events) == 1
+
+    print("Save and publish failure test passed")
+
+
+def test_async_bus_delivers_in_batches():
+    batches = []
+
+    async def handler(events):
+        batches.append(list(events))
+
+    async def scenario():
+        bus = AsyncEventBus(batch_size=10, max_delay=0.01)
+        bus.subscribe(int, handler)
+        async with bus:
+            await bus.publish_all(range(25))
+        return bus
+
+    bus = asyncio.run(scenario())
+
+    assert [event for batch in batches for event in batch] == list(range(25))
+    assert all(len(batch) <= 10 for batch in batches)
+    assert bus.stats()['subscriptions'][0]['delivered'] == 25
+
+    print("Async bus batching test passed")
+
+
+def test_async_bus_runs_sync_handlers_off_the_loop():
+    threads = []
+
+    def handler(events):
+        threads.append(threading.get_ident())
+
+    async def scenario():
+        async with AsyncEventBus() as bus:
+            bus.subscribe(object, handler)
+            await bus.publish("event")
+
+    asyncio.run(scenario())
+
+    assert threads and threads[0] != threading.get_ident()
+
+    print("Async bus sync handler test passed")
+
+
+def test_async_bus_slow_subscriber_does_not_block_publisher():
+    fast, slow = [], []
+
+    def slow_handler(events):
+        time.sleep(0.05)
+        slow.extend(events)
+
+    async def scenario():
+        bus = AsyncEventBus(batch_size=5, max_delay=0)
+        bus.subscribe(int, slow_handler)
+        bus.subscribe(int, fast.extend)
+        async with bus:
+            start = time.perf_counter()
+            await bus.publish_all(range(20))
+            publish_seconds = time.perf_counter() - start
+        return publish_seconds
+
+    publish_seconds = asyncio.run(scenario())
+
+    assert publish_seconds < 0.05
+    assert slow == list(range(20))
+    assert fast == list(range(20))
+
+    print("Async bus slow subscriber test passed")
+
+
+def test_async_bus_applies_backpressure():
+    released = None
+    received = []
+
+    async def blocked(events):
+        await released.wait()
+        received.extend(events)
+
+    async def scenario():
+        nonlocal released
+        released = asyncio.Event()
+        bus = AsyncEventBus(batch_size=1, queue_size=2)
+        bus.subscribe(int, blocked)
+        async with bus:
+            # one event in the handler, two in the queue: the fourth must wait
+            await bus.publish_all(range(3))
+            await asyncio.sleep(0)
+            publishing = asyncio.create_task(bus.publish(3))
+            await asyncio.sleep(0.01)
+            was_waiting = not publishing.done()
+            released.set()
+            await publishing
+        return was_waiting
+
+    assert asyncio.run(scenario())
+    assert received == [0, 1, 2, 3]
+
+    print("Async bus backpressure test passed")
+
+
+def test_async_bus_isolates_failing_handler():
+    async def failing(events):
+        raise RuntimeError("boom")
+
+    async def scenario():
+        bus = AsyncEventBus(max_delay=0)
+        bus.subscribe(object, failing)
+        async with bus:
+            await bus.publish("event")
+        return bus.stats()
+
+    stats = asyncio.run(scenario())
+
+    assert stats['subscriptions'][0]['failed'] == 1
+    assert stats['published'] == 1
+
+    print("Async bus failing handler test passed")
+
+
+def test_async_bus_never_waits_without_workers():
+    async def scenario():
+        bus = AsyncEventBus(queue_size=1)
+        bus.subscribe(int, lambda events: None)
+        await bus.drain()
+        await bus.publish(1)
+        with pytest.raises(RuntimeError, match="not started"):
+            await asyncio.wait_for(bus.publish(2), 1)
+        with pytest.raises(RuntimeError, match="not started"):
+            await asyncio.wait_for(bus.drain(), 1)
+        await asyncio.wait_for(bus.stop(), 1)
+        # the event queued before start is delivered once workers run
+        async with bus:
+            await asyncio.wait_for(bus.drain(), 1)
+        return bus.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats['subscriptions'][0]['delivered'] == 1
+
+    with pytest.raises(ValueError):
+        AsyncEventBus().subscribe(int, print, batch_size=0)
+    with pytest.raises(ValueError):
+        AsyncEventBus().subscribe(int, print, queue_size=0)
+
+    print("Async bus without workers test passed")
+
+
+class ThreadRecordingRepository(IndexedInMemoryTrainerAccountRequestRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def save(self, request):
+        self.threads.add(threading.current_thread())
+        super().save(request)
+
+    def save_many(self, requests):
+        self.threads.add(threading.current_thread())
+        super().save_many(requests)
+
+
+def test_save_and_publish_async():
+    received = []
+    sync_repo = ThreadRecordingRepository()
+    async_repo = InMemoryAsyncTrainerAccountRequestRepository()
+
+    async def scenario():
+        async with AsyncEventBus() as bus:
+            bus.subscribe(TrainerAccountRequestSubmitted, received.extend)
+            await save_and_publish_async(sync_repo, [create_request()], bus)
+            await save_and_publish_async(sync_repo, [create_request(f"user{i}@example.com") for i in range(2)], bus)
+            await save_and_publish_async(async_repo, [create_request()], bus)
+
+    asyncio.run(scenario())
+
+    assert len(received) == 4
+    # the synchronous repository was never called on the event loop's thread
+    assert threading.main_thread() not in sync_repo.threads
+    assert sync_repo.count_all() == 3
+
+    print("Save and publish async test passed")
+
+
+if __name__ == '__main__':
+    test_sync_bus_dispatches_by_type()
+    test_sync_bus_isolates_failing_handler()
+    test_save_and_publish()
+    test_save_and_publish_keeps_events_when_save_fails()
+    test_async_bus_delivers_in_batches()
+    test_async_bus_runs_sync_handlers_off_the_loop()
+    test_async_bus_slow_subscriber_does_not_block_publisher()
+    test_async_bus_applies_backpressure()
+    test_async_bus_isolates_failing_handler()
+    test_async_bus_never_waits_without_workers()
+    test_save_and_publish_async()
+
+    print("\nAll event bus tests passed!")
@@ -0,0 +1,213 @@
+"""Tests pour l'outbox SQLite et son relais"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    TrainerAccountRequestSubmitted,
+    EmailAlreadyUsedException,
+)
+from infrastructure.events import EventSerializer, SqliteOutbox, OutboxRelay
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import SqliteTrainerAccountRequestRepository
+
+
+def create_request(email: str = "jean.dupont@example.com") -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "outbox.db"), size=2)
+    yield pool
+    pool.close()
+
+
+def test_serializer_round_trip():
+    serializer = EventSerializer.default()
+    event = create_request().pull_events()[0]
+
+    name, payload = serializer.serialize(event)
+    restored = serializer.deserialize(name, payload)
+
+    assert name == 'TrainerAccountRequestSubmitted'
+    assert restored.request_id == event.request_id
+    assert restored.candidate_email == event.candidate_email
+    assert restored.occurred_on == event.occurred_on
+
+    with pytest.raises(ValueError):
+        serializer.serialize(object())
+
+    print("Serializer round trip test passed")
+
+
+def test_events_are_stored_with_the_aggregate(pool):
+    outbox = SqliteOutbox(pool)
+    repo = SqliteTrainerAccountRequestRepository(pool, outbox)
+    request = create_request()
+
+    repo.save(request)
+
+    messages = outbox.read_after(0)
+    assert len(messages) == 1
+    assert messages[0].aggregate_id == request.id.value
+    assert isinstance(messages[0].event, TrainerAccountRequestSubmitted)
+    assert request.events == ()
+
+    # saving again has nothing new to record
+    repo.save(request)
+    assert len(outbox.read_after(0)) == 1
+
+    print("Events stored with aggregate test passed")
+
+
+def test_failed_save_records_no_event(pool):
+    outbox = SqliteOutbox(pool)
+    repo = SqliteTrainerAccountRequestRepository(pool, outbox)
+    repo.save(create_request())
+
+    duplicates = [create_request("other@example.com"), create_request()]
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save_many(duplicates)
+
+    assert len(outbox.read_after(0)) == 1
+    assert all(len(request.events) == 1 for request in duplicates)
+
+    print("Failed save test passed")
+
+
+def test_outbox_requires_the_repository_pool(pool, tmp_path):
+    other_pool = SqliteConnectionPool(str(tmp_path / "other.db"))
+    with pytest.raises(ValueError):
+        SqliteTrainerAccountRequestRepository(pool, SqliteOutbox(other_pool))
+    other_pool.close()
+
+    print("Outbox pool test passed")
+
+
+def test_relay_drains_in_batches_and_in_order(pool):
+    outbox = SqliteOutbox(pool)
+    repo = SqliteTrainerAccountRequestRepository(pool, outbox)
+    requests = [create_request(f"user{i}@example.com") for i in range(25)]
+    repo.save_many(requests)
+
+    batches = []
+    relay = OutboxRelay(outbox, batches.append, batch_size=10)
+
+    assert relay.drain() == 25
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    published = [event.request_id for batch in batches for event in batch]
+    assert published == [request.id for request in requests]
+
+    stats = relay.stats()
+    assert stats['delivered'] == 25
+    assert stats['batches'] == 3
+    assert stats['lag_events'] == 0
+    assert outbox.offset('relay') == relay.position
+
+    print("Relay batching test passed")
+
+
+def test_relay_redelivers_failed_batch(pool):
+    outbox = SqliteOutbox(pool)
+    repo = SqliteTrainerAccountRequestRepository(pool, outbox)
+    repo.save_many([create_request(f"user{i}@example.com") for i in range(3)])
+
+    attempts = []
+
+    def flaky(events):
+        attempts.append(len(events))
+        if len(attempts) == 1:
+            raise RuntimeError("broker down")
+
+    relay = OutboxRelay(outbox, flaky)
+    with pytest.raises(RuntimeError):
+        relay.drain_once()
+    assert outbox.pending_count('relay') == 3
+
+    assert relay.drain() == 3
+    assert attempts == [3, 3]
+    assert relay.stats()['failures'] == 1
+
+    print("Relay redelivery test passed")
+
+
+def test_relay_resumes_from_committed_offset(pool):
+    outbox = SqliteOutbox(pool)
+    repo = SqliteTrainerAccountRequestRepository(pool, outbox)
+    repo.save_many([create_request(f"user{i}@example.com") for i in range(5)])
+    OutboxRelay(outbox, lambda events: None, batch_size=2).drain_once()
+
+    received = []
+    OutboxRelay(outbox, received.extend).drain()
+
+    assert len(received) == 3
+    assert outbox.purge() == 5
+    assert outbox.read_after(0) == []
+
+    print("Relay resume test passed")
+
+
+def test_relay_worker_thread(pool):
+    outbox = SqliteOutbox(pool)
+    repo = SqliteTrainerAccountRequestRepository(pool, outbox)
+    received = []
+    done = threading.Event()
+
+    def publish(events):
+        received.extend(events)
+        if len(received) == 4:
+            done.set()
+
+    stop = threading.Event()
+    relay = OutboxRelay(outbox, publish, batch_size=2)
+    worker = threading.Thread(target=relay.run, args=(stop, 0.01))
+    worker.start()
+    repo.save_many([create_request(f"user{i}@example.com") for i in range(4)])
+
+    assert done.wait(5)
+    stop.set()
+    worker.join(5)
+
+    assert len(received) == 4
+
+    print("Relay worker thread test passed")
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        tests = [
+            test_events_are_stored_with_the_aggregate,
+            test_failed_save_records_no_event,
+            test_relay_drains_in_batches_and_in_order,
+            test_relay_redelivers_failed_batch,
+            test_relay_resumes_from_committed_offset,
+            test_relay_worker_thread,
+        ]
+        test_serializer_round_trip()
+        for index, test in enumerate(tests):
+            test_pool = SqliteConnectionPool(str(directory / f"outbox{index}.db"), size=2)
+            test(test_pool)
+            test_pool.close()
+        test_pool = SqliteConnectionPool(str(directory / "main.db"))
+        (directory / "other").mkdir()
+        test_outbox_requires_the_repository_pool(test_pool, directory / "other")
+        test_pool.close()
+
+    print("\nAll outbox tests passed!")
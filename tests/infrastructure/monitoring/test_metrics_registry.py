@@ -0,0 +1,109 @@
+"""Tests pour le registre de métriques"""
+
+import json
+import sys
+from pathlib import Path
+import pytest
+
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from infrastructure.monitoring import Histogram, MetricsRegistry
+
+
+def test_counters_and_histograms_are_registered_once():
+    registry = MetricsRegistry()
+
+    registry.counter("saves").inc()
+    registry.counter("saves").inc(2)
+
+    assert registry.counter("saves").value == 3
+    assert registry.histogram("latency") is registry.histogram("latency")
+    with pytest.raises(ValueError):
+        registry.counter("saves").inc(-1)
+
+    print("Registration test passed")
+
+
+def test_histogram_percentiles_follow_the_recent_window():
+    histogram = Histogram("latency", window=100)
+    for value in range(1, 101):
+        histogram.observe(float(value))
+
+    assert histogram.percentile(0.5) == 50.0
+    assert histogram.percentile(0.99) == 99.0
+
+    for _ in range(100):
+        histogram.observe(1000.0)
+    summary = histogram.snapshot()
+
+    assert summary['p50'] == 1000.0
+    assert summary['count'] == 200
+    assert summary['min'] == 1.0
+    assert summary['max'] == 1000.0
+
+    print("Histogram window test passed")
+
+
+def test_timer_and_decorator_record_durations():
+    registry = MetricsRegistry()
+
+    @registry.timed("work.seconds")
+    def work():
+        return 42
+
+    assert work() == 42
+    with registry.timer("block.seconds"):
+        pass
+
+    assert registry.histogram("work.seconds").count == 1
+    assert registry.histogram("block.seconds").count == 1
+
+    print("Timer test passed")
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+
+    @registry.timed("work.seconds")
+    def work():
+        return 42
+
+    assert work() == 42
+    with registry.timer("block.seconds"):
+        pass
+
+    assert registry.histogram("work.seconds").count == 0
+    assert registry.snapshot()['histograms']['work.seconds']['p99'] == 0.0
+
+    print("Disabled registry test passed")
+
+
+def test_exports():
+    registry = MetricsRegistry()
+    registry.counter("trainer_repository.save.errors").inc()
+    registry.histogram("trainer_repository.save.seconds").observe(0.5)
+
+    snapshot = json.loads(registry.to_json())
+    text = registry.to_text()
+
+    assert snapshot['counters'] == {"trainer_repository.save.errors": 1}
+    assert snapshot['histograms']["trainer_repository.save.seconds"]['count'] == 1
+    assert "trainer_repository_save_errors 1" in text
+    assert 'trainer_repository_save_seconds{quantile="0.99"} 0.5' in text
+    assert "trainer_repository_save_seconds_count 1" in text
+
+    registry.reset()
+    assert registry.counter("trainer_repository.save.errors").value == 0
+
+    print("Export test passed")
+
+
+if __name__ == '__main__':
+    test_counters_and_histograms_are_registered_once()
+    test_histogram_percentiles_follow_the_recent_window()
+    test_timer_and_decorator_record_durations()
+    test_disabled_registry_records_nothing()
+    test_exports()
+
+    print("\nAll metrics registry tests passed!")
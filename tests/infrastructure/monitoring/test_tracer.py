@@ -0,0 +1,139 @@
+"""Tests pour le traceur"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+import pytest
+
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from infrastructure.monitoring import Tracer
+
+
+def test_nested_spans_form_a_tree():
+    tracer = Tracer()
+
+    with tracer.span("submit", email="john@example.com") as root:
+        with tracer.span("submit.validation"):
+            pass
+        with tracer.span("submit.save") as save:
+            assert tracer.current_span() is save
+
+    assert tracer.current_span() is None
+    assert tracer.recent_traces() == [root]
+    assert [child.name for child in root.children] == ["submit.validation", "submit.save"]
+    assert root.children[1].trace_id == root.trace_id
+    assert root.duration >= save.duration
+    assert "  submit.save" in root.render()
+    assert root.to_dict()['attributes'] == {'email': "john@example.com"}
+
+    print("Span tree test passed")
+
+
+def test_error_is_recorded_and_raised():
+    tracer = Tracer()
+
+    with pytest.raises(ValueError):
+        with tracer.span("submit"):
+            with tracer.span("submit.validation"):
+                raise ValueError("invalid email")
+
+    root = tracer.recent_traces()[0]
+    assert root.error == "ValueError"
+    assert root.children[0].error == "ValueError"
+    assert root.finished and root.children[0].finished
+
+    print("Span error test passed")
+
+
+def test_sampling_is_decided_per_trace():
+    tracer = Tracer(sample_rate=0.0)
+
+    with tracer.span("submit") as root:
+        with tracer.span("submit.save") as child:
+            pass
+
+    assert root is None and child is None
+    assert tracer.recent_traces() == []
+
+    tracer = Tracer(sample_rate=0.5, seed=1)
+    for _ in range(1000):
+        with tracer.span("submit"):
+            with tracer.span("submit.save"):
+                pass
+
+    assert 400 < tracer.traces < 600
+    assert all(len(root.children) == 1 for root in tracer.recent_traces())
+
+    print("Sampling test passed")
+
+
+def test_ring_buffer_keeps_recent_traces():
+    tracer = Tracer(capacity=3)
+    for i in range(5):
+        with tracer.span(f"trace{i}"):
+            pass
+
+    assert [root.name for root in tracer.recent_traces()] == ["trace2", "trace3", "trace4"]
+
+    print("Ring buffer test passed")
+
+
+def test_slow_traces_are_dumped():
+    dumped = []
+    tracer = Tracer(slow_threshold=0.0, on_slow=dumped.append)
+
+    with tracer.span("submit"):
+        with tracer.span("submit.save"):
+            pass
+
+    assert len(dumped) == 1 and dumped[0].children[0].name == "submit.save"
+    assert tracer.slow_traces == 1
+
+    print("Slow trace test passed")
+
+
+def test_threads_and_tasks_have_their_own_traces():
+    tracer = Tracer()
+
+    def work(name):
+        with tracer.span(name):
+            with tracer.span(f"{name}.step"):
+                pass
+
+    threads = [threading.Thread(target=work, args=(f"thread{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    async def task(name):
+        with tracer.span(name):
+            await asyncio.sleep(0)
+            with tracer.span(f"{name}.step"):
+                await asyncio.sleep(0)
+
+    async def scenario():
+        await asyncio.gather(*(task(f"task{i}") for i in range(4)))
+
+    asyncio.run(scenario())
+
+    traces = tracer.recent_traces()
+    assert len(traces) == 8
+    assert len({root.trace_id for root in traces}) == 8
+    assert all([child.name for child in root.children] == [f"{root.name}.step"] for root in traces)
+
+    print("Thread and task isolation test passed")
+
+
+if __name__ == '__main__':
+    test_nested_spans_form_a_tree()
+    test_error_is_recorded_and_raised()
+    test_sampling_is_decided_per_trace()
+    test_ring_buffer_keeps_recent_traces()
+    test_slow_traces_are_dumped()
+    test_threads_and_tasks_have_their_own_traces()
+
+    print("\nAll tracer tests passed!")
@@ -0,0 +1,70 @@
+"""Tests pour le filtre de Bloom"""
+
+import sys
+from pathlib import Path
+import pytest
+
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from infrastructure.shared import BloomFilter
+
+
+def test_no_false_negative():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"user{i}@example.com" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    assert len(bloom) == 1000
+
+    print("No false negative test passed")
+
+
+def test_false_positive_rate_close_to_target():
+    bloom = BloomFilter(5000, 0.01)
+    for i in range(5000):
+        bloom.add(f"user{i}@example.com")
+
+    false_positives = sum(bloom.might_contain(f"other{i}@example.com") for i in range(20000))
+
+    assert false_positives / 20000 < 0.02
+    assert bloom.estimated_false_positive_rate() == pytest.approx(0.01, rel=0.2)
+
+    print("False positive rate test passed")
+
+
+def test_sizing():
+    bloom = BloomFilter(1000, 0.01)
+
+    assert bloom.bit_count == 9586
+    assert bloom.hash_count == 7
+
+    with pytest.raises(ValueError):
+        BloomFilter(0)
+    with pytest.raises(ValueError):
+        BloomFilter(10, 1.5)
+
+    print("Sizing test passed")
+
+
+def test_clear():
+    bloom = BloomFilter(10)
+    bloom.add("a@example.com")
+
+    bloom.clear()
+
+    assert "a@example.com" not in bloom
+    assert len(bloom) == 0
+
+    print("Clear test passed")
+
+
+if __name__ == '__main__':
+    test_no_false_negative()
+    test_false_positive_rate_close_to_target()
+    test_sizing()
+    test_clear()
+
+    print("\nAll BloomFilter tests passed!")
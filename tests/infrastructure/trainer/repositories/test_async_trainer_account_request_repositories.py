@@ -0,0 +1,147 @@
+"""Tests pour les repositories asynchrones"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+    EmailAlreadyUsedException,
+    AsyncVerifyEmailUniqueness,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import (
+    SqliteTrainerAccountRequestRepository,
+    ThreadPoolAsyncTrainerAccountRequestRepository,
+    InMemoryAsyncTrainerAccountRequestRepository,
+)
+
+
+def create_request(email: str = "jean.dupont@example.com") -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+
+
+async def exercise(repo) -> None:
+    requests = [create_request(f"user{i}@example.com") for i in range(5)]
+    await repo.save(requests[0])
+    await repo.save_many(requests[1:])
+
+    assert (await repo.find(requests[0].id)).id == requests[0].id
+    assert (await repo.find_by_email(requests[1].candidate_info.email)).id == requests[1].id
+    assert await repo.exists_by_email(requests[2].candidate_info.email)
+    assert not await repo.exists_by_email(Email("missing@example.com"))
+    assert await repo.exists_by_emails([requests[3].candidate_info.email, Email("missing@example.com")]) == {
+        requests[3].candidate_info.email
+    }
+    assert [r.id for r in await repo.find_many([requests[4].id, requests[0].id])] == [requests[4].id, requests[0].id]
+    assert len(await repo.find_pending_validation()) == 5
+    assert await repo.count_by_status(RequestStatus.pending_validation()) == 5
+    assert await repo.count_all() == 5
+
+    streamed = [request.id async for request in repo.iter_by_status(RequestStatus.pending_validation(), 2)]
+    assert sorted(r.value for r in streamed) == sorted(r.id.value for r in requests)
+
+    with pytest.raises(EmailAlreadyUsedException):
+        await repo.save(create_request("user0@example.com"))
+
+    await repo.delete(requests[0])
+    assert await repo.find(requests[0].id) is None
+    assert await repo.count_all() == 4
+
+    reserved, other = create_request("reserved@example.com"), create_request("reserved@example.com")
+    assert await repo.reserve_email(reserved.candidate_info.email, reserved.id)
+    assert not await repo.reserve_email(other.candidate_info.email, other.id)
+    assert not await repo.save_if_email_unused(other)
+    assert await repo.save_if_email_unused(reserved)
+
+
+def test_in_memory_async_repository():
+    asyncio.run(exercise(InMemoryAsyncTrainerAccountRequestRepository()))
+
+    print("In-memory async repository test passed")
+
+
+def test_thread_pool_adapter(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "async.db"), size=2)
+    repo = ThreadPoolAsyncTrainerAccountRequestRepository(SqliteTrainerAccountRequestRepository(pool), max_workers=2)
+
+    asyncio.run(exercise(repo))
+
+    repo.close()
+    pool.close()
+
+    print("Thread pool adapter test passed")
+
+
+def test_thread_pool_adapter_is_bounded(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "bounded.db"), size=2)
+    threads = set()
+
+    class RecordingRepository(SqliteTrainerAccountRequestRepository):
+        def exists_by_email(self, email):
+            threads.add(threading.get_ident())
+            return super().exists_by_email(email)
+
+    repo = ThreadPoolAsyncTrainerAccountRequestRepository(RecordingRepository(pool), max_workers=2)
+
+    async def scenario():
+        await asyncio.gather(*(repo.exists_by_email(Email(f"u{i}@example.com")) for i in range(200)))
+
+    asyncio.run(scenario())
+
+    assert 1 <= len(threads) <= 2
+    assert threading.get_ident() not in threads
+    repo.close()
+    pool.close()
+
+    print("Bounded thread pool test passed")
+
+
+def test_async_verify_email_uniqueness():
+    async def scenario():
+        repo = InMemoryAsyncTrainerAccountRequestRepository()
+        await repo.save(create_request("taken@example.com"))
+        service = AsyncVerifyEmailUniqueness(repo)
+
+        assert not await service.is_available(Email("taken@example.com"))
+        assert await service.is_available(Email("free@example.com"))
+        with pytest.raises(EmailAlreadyUsedException):
+            await service.execute(Email("taken@example.com"))
+        assert await service.execute_many([
+            Email("free@example.com"),
+            Email("taken@example.com"),
+            Email("free@example.com"),
+        ]) == [True, False, False]
+
+    asyncio.run(scenario())
+
+    print("Async email uniqueness test passed")
+
+
+if __name__ == '__main__':
+    test_in_memory_async_repository()
+    with tempfile.TemporaryDirectory() as directory:
+        (Path(directory) / "a").mkdir()
+        (Path(directory) / "b").mkdir()
+        test_thread_pool_adapter(Path(directory) / "a")
+        test_thread_pool_adapter_is_bounded(Path(directory) / "b")
+    test_async_verify_email_uniqueness()
+
+    print("\nAll async repository tests passed!")
@@ -0,0 +1,152 @@
+"""Tests pour le décorateur de repository à filtre de Bloom"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    VerifyEmailUniqueness,
+)
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    BloomFilterTrainerAccountRequestRepository,
+    SqliteTrainerAccountRequestRepository,
+)
+
+
+def create_request(email: str) -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+
+
+class CountingRepository(IndexedInMemoryTrainerAccountRequestRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.exists_calls = 0
+
+    def exists_by_email(self, email):
+        self.exists_calls += 1
+        return super().exists_by_email(email)
+
+
+def test_new_emails_do_not_reach_the_repository():
+    inner = CountingRepository()
+    repo = BloomFilterTrainerAccountRequestRepository(inner, capacity=1000)
+    repo.save(create_request("taken@example.com"))
+
+    assert repo.exists_by_email(Email("taken@example.com")) is True
+    for i in range(200):
+        assert repo.exists_by_email(Email(f"new{i}@example.com")) is False
+
+    stats = repo.stats()
+    assert inner.exists_calls == 1 + stats['false_positives']
+    assert stats['true_positives'] == 1
+    assert stats['negatives'] + stats['false_positives'] == 200
+    assert stats['lookups'] == 201
+
+    print("Negative cache test passed")
+
+
+def test_filter_is_built_from_existing_data():
+    inner = IndexedInMemoryTrainerAccountRequestRepository()
+    inner.save(create_request("existing@example.com"))
+
+    repo = BloomFilterTrainerAccountRequestRepository(inner, capacity=100)
+
+    assert repo.exists_by_email(Email("existing@example.com")) is True
+    assert repo.find_by_email(Email("existing@example.com")) is not None
+    assert repo.stats()['items'] == 1
+
+    print("Initial build test passed")
+
+
+class EmailOnlySqliteRepository(SqliteTrainerAccountRequestRepository):
+
+    def iter_by_status(self, status, batch_size=500):
+        raise AssertionError("the filter must be rebuilt without loading aggregates")
+
+
+def test_rebuild_reads_only_emails():
+    inner = EmailOnlySqliteRepository.connect(':memory:')
+    inner.save_many([create_request(f"stored{i}@example.com") for i in range(7)])
+
+    repo = BloomFilterTrainerAccountRequestRepository(inner, capacity=100)
+    repo.rebuild()
+
+    assert sorted(email.value for email in inner.iter_emails(batch_size=3)) == \
+        sorted(f"stored{i}@example.com" for i in range(7))
+    assert repo.stats()['items'] == 7
+    assert repo.exists_by_email(Email("stored3@example.com")) is True
+
+    print("Email-only rebuild test passed")
+
+
+def test_delete_is_never_answered_from_a_stale_filter():
+    inner = IndexedInMemoryTrainerAccountRequestRepository()
+    repo = BloomFilterTrainerAccountRequestRepository(inner, capacity=100, rebuild_ratio=0.5)
+    requests = [create_request(f"user{i}@example.com") for i in range(4)]
+    repo.save_many(requests)
+
+    repo.delete(requests[0])
+    assert repo.exists_by_email(Email("user0@example.com")) is False
+    assert repo.stats()['stale_items'] == 1
+
+    repo.delete(requests[1])
+    repo.delete(requests[2])
+
+    stats = repo.stats()
+    assert stats['rebuilds'] == 2
+    assert stats['items'] == 1
+    assert repo.exists_by_email(Email("user3@example.com")) is True
+
+    print("Delete rebuild test passed")
+
+
+def test_filter_grows_past_its_capacity():
+    repo = BloomFilterTrainerAccountRequestRepository(
+        IndexedInMemoryTrainerAccountRequestRepository(), capacity=10
+    )
+    for i in range(50):
+        repo.save(create_request(f"user{i}@example.com"))
+
+    assert repo.stats()['capacity'] >= 50
+    assert all(repo.exists_by_email(Email(f"user{i}@example.com")) for i in range(50))
+
+    print("Capacity growth test passed")
+
+
+def test_bulk_check_through_service():
+    inner = IndexedInMemoryTrainerAccountRequestRepository()
+    repo = BloomFilterTrainerAccountRequestRepository(inner, capacity=100)
+    repo.save(create_request("taken@example.com"))
+    verifier = VerifyEmailUniqueness(repo)
+
+    availability = verifier.availability_map([Email("taken@example.com"), Email("free@example.com")])
+
+    assert availability == {Email("taken@example.com"): False, Email("free@example.com"): True}
+
+    print("Bulk check test passed")
+
+
+if __name__ == '__main__':
+    test_new_emails_do_not_reach_the_repository()
+    test_filter_is_built_from_existing_data()
+    test_rebuild_reads_only_emails()
+    test_delete_is_never_answered_from_a_stale_filter()
+    test_filter_grows_past_its_capacity()
+    test_bulk_check_through_service()
+
+    print("\nAll Bloom filter repository tests passed!")
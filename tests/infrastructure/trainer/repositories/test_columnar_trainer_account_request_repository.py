@@ -0,0 +1,210 @@
+"""Tests pour le repository compact par colonnes"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+    RequestId,
+    RequestPage,
+    EmailAlreadyUsedException,
+)
+from infrastructure.trainer import ColumnarTrainerAccountRequestRepository
+
+
+def create_candidat_info(email: str = "test@example.com") -> CandidatInfo:
+    return CandidatInfo.create("Jean", "Dupont", email)
+
+
+def create_skills():
+    return [
+        Skill.create(SkillName("Python"), SkillLevel.expert()),
+        Skill.create(SkillName("Java"), SkillLevel.beginner()),
+    ]
+
+
+def create_dated_requests(count: int):
+    base = datetime(2024, 1, 1, 9, 0)
+    return [
+        TrainerAccountRequest(
+            request_id=RequestId.generate(),
+            candidate_info=create_candidat_info(f"dated{i}@example.com"),
+            skills=create_skills(),
+            status=RequestStatus.pending_validation(),
+            submission_date=base + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+
+
+def test_round_trip():
+    repo = ColumnarTrainerAccountRequestRepository()
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+
+    found = repo.find(request.id)
+
+    assert found is not request
+    assert found.id == request.id
+    assert found.candidate_info == request.candidate_info
+    assert found.statut is request.statut
+    assert found.submission_date == request.submission_date
+    assert [s.id for s in found.skills] == [s.id for s in request.skills]
+    assert [s.name for s in found.skills] == [s.name for s in request.skills]
+    assert [s.level for s in found.skills] == [s.level for s in request.skills]
+    assert repo.find_by_email(Email("TEST@example.com")).id == request.id
+    assert repo.find(RequestId.generate()) is None
+
+    print("Round trip test passed")
+
+
+def test_update_in_place_and_with_new_skills():
+    repo = ColumnarTrainerAccountRequestRepository()
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+
+    request.skills[1].upgrade_level(SkillLevel.intermediate())
+    request.approve()
+    repo.save(request)
+    found = repo.find(request.id)
+    assert found.statut == RequestStatus.approved()
+    assert found.skills[1].level == SkillLevel.intermediate()
+
+    fewer = TrainerAccountRequest(
+        request.id, request.candidate_info, request.skills[:1], request.statut, request.submission_date
+    )
+    repo.save(fewer)
+    assert len(repo.find(request.id).skills) == 1
+    assert repo.count_by_status(RequestStatus.approved()) == 1
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 0
+    assert repo.count_all() == 1
+
+    print("Update test passed")
+
+
+def test_email_uniqueness():
+    repo = ColumnarTrainerAccountRequestRepository()
+    repo.save(TrainerAccountRequest.submit(create_candidat_info(), create_skills()))
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(TrainerAccountRequest.submit(create_candidat_info(), create_skills()))
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save_many([TrainerAccountRequest.submit(create_candidat_info(), create_skills())])
+
+    assert repo.exists_by_emails([Email("test@example.com"), Email("new@example.com")]) == {
+        Email("test@example.com")
+    }
+
+    # a batch may swap the emails of two stored requests
+    first, second = create_dated_requests(2)
+    repo.save_many([first, second])
+    repo.save_many([
+        TrainerAccountRequest(request.id, other.candidate_info, request.skills, request.statut, request.submission_date)
+        for request, other in ((first, second), (second, first))
+    ])
+    assert repo.find_by_email(second.candidate_info.email).id == first.id
+    assert repo.find_by_email(first.candidate_info.email).id == second.id
+
+    print("Email uniqueness test passed")
+
+
+def test_email_reservation():
+    repo = ColumnarTrainerAccountRequestRepository()
+    email = Email("test@example.com")
+    owner = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    other = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+
+    assert repo.reserve_email(email, owner.id)
+    assert not repo.reserve_email(email, other.id)
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(other)
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save_many([other])
+
+    repo.save(owner)
+    assert repo.reserve_email(email, owner.id)
+    assert not repo.reserve_email(email, other.id)
+
+    expiring = ColumnarTrainerAccountRequestRepository(reservation_ttl=timedelta(0))
+    assert expiring.reserve_email(email, owner.id)
+    expiring.save(other)
+
+    print("Email reservation test passed")
+
+
+def test_status_queries_and_pagination():
+    repo = ColumnarTrainerAccountRequestRepository()
+    requests = create_dated_requests(7)
+    repo.save_many(reversed(requests))
+    expected = sorted(requests, key=RequestPage.cursor_of)
+
+    assert [r.id for r in repo.find_pending_validation()] == [r.id for r in expected]
+    first = repo.find_by_status_page(RequestStatus.pending_validation(), limit=4)
+    second = repo.find_by_status_page(RequestStatus.pending_validation(), first.next_cursor, 4)
+    assert [r.id for r in first] + [r.id for r in second] == [r.id for r in expected]
+    assert not second.has_next
+    iterated = list(repo.iter_by_status(RequestStatus.pending_validation(), batch_size=3))
+    assert [r.id for r in iterated] == [r.id for r in expected]
+
+    print("Status queries test passed")
+
+
+def test_delete_and_compact():
+    repo = ColumnarTrainerAccountRequestRepository()
+    requests = create_dated_requests(4)
+    repo.save_many(requests)
+
+    repo.delete(requests[1])
+    repo.delete(requests[1])
+
+    assert repo.find(requests[1].id) is None
+    assert repo.exists_by_email(requests[1].candidate_info.email) is False
+    assert repo.count_all() == 3
+    assert len(repo.find_pending_validation()) == 3
+
+    before = repo.memory_usage()['skill_columns']
+    repo.compact()
+
+    assert repo.memory_usage()['skill_columns'] <= before
+    remaining = sorted([requests[0], requests[2], requests[3]], key=RequestPage.cursor_of)
+    assert [r.id for r in repo.find_pending_validation()] == [r.id for r in remaining]
+    assert repo.find_by_email(requests[3].candidate_info.email).id == requests[3].id
+
+    print("Delete and compact test passed")
+
+
+def test_memory_usage_is_reported():
+    repo = ColumnarTrainerAccountRequestRepository()
+    repo.save_many(create_dated_requests(100))
+
+    usage = repo.memory_usage()
+
+    assert usage['total'] == sum(value for key, value in usage.items() if key != 'total')
+    assert usage['string_tables'] < usage['emails']
+
+    print("Memory usage test passed")
+
+
+if __name__ == '__main__':
+    test_round_trip()
+    test_update_in_place_and_with_new_skills()
+    test_email_uniqueness()
+    test_email_reservation()
+    test_status_queries_and_pagination()
+    test_delete_and_compact()
+    test_memory_usage_is_reported()
+
+    print("\nAll Columnar repository tests passed!")
@@ -0,0 +1,172 @@
+"""Tests pour le repository en mémoire thread-safe"""
+
+import sys
+import threading
+from datetime import timedelta
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+    EmailAlreadyUsedException,
+)
+from infrastructure.trainer import ConcurrentInMemoryTrainerAccountRequestRepository
+
+
+def create_request(email: str = "jean.dupont@example.com") -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+
+
+def test_save_and_find():
+    repo = ConcurrentInMemoryTrainerAccountRequestRepository(stripes=4)
+    request = create_request()
+    repo.save(request)
+
+    assert repo.find(request.id) == request
+    assert repo.find_by_email(request.candidate_info.email) == request
+    assert repo.exists_by_email(request.candidate_info.email)
+    assert repo.find_pending_validation() == [request]
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 1
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(create_request())
+    assert not repo.save_if_email_unused(create_request())
+
+    repo.delete(request)
+    assert repo.count_all() == 0
+    assert repo.save_if_email_unused(create_request())
+
+    print("Save and find test passed")
+
+
+def test_reservation():
+    repo = ConcurrentInMemoryTrainerAccountRequestRepository()
+    email = Email("jean.dupont@example.com")
+    owner, other = create_request(), create_request()
+
+    assert repo.reserve_email(email, owner.id)
+    assert repo.reserve_email(email, owner.id)
+    assert not repo.reserve_email(email, other.id)
+    assert not repo.exists_by_email(email)
+    assert not repo.save_if_email_unused(other)
+
+    assert repo.save_if_email_unused(owner)
+    repo.release_email(email, owner.id)
+    assert repo.find_by_email(email) == owner
+
+    released = Email("released@example.com")
+    assert repo.reserve_email(released, owner.id)
+    repo.release_email(released, owner.id)
+    assert repo.reserve_email(released, other.id)
+
+    print("Reservation test passed")
+
+
+def test_reservations_expire():
+    repo = ConcurrentInMemoryTrainerAccountRequestRepository(reservation_ttl=timedelta(0))
+    email = Email("jean.dupont@example.com")
+    owner, other = create_request(), create_request()
+
+    assert repo.reserve_email(email, owner.id)
+    assert repo.reserve_email(email, other.id)
+    assert repo.save_if_email_unused(owner)
+    assert not repo.reserve_email(email, other.id)
+
+    print("Reservation expiry test passed")
+
+
+def test_counts_follow_saves_from_many_threads():
+    repo = ConcurrentInMemoryTrainerAccountRequestRepository(stripes=4)
+    requests = [create_request(f"user{i}@example.com") for i in range(200)]
+    repo.save_many(requests)
+
+    def approve(chunk):
+        for request in chunk:
+            request.approve()
+            repo.save(request)
+
+    threads = [threading.Thread(target=approve, args=(requests[i::4],)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for request in requests[3::8]:
+        repo.delete(request)
+
+    deleted = len(requests[3::8])
+    approved = len(requests) - len(requests[3::4])
+    assert repo.count_by_status(RequestStatus.approved()) == approved
+    assert repo.count_by_status(RequestStatus.pending_validation()) == len(requests) - approved - deleted
+    assert repo.count_all() == len(requests) - deleted
+
+    print("Concurrent counters test passed")
+
+
+def test_concurrent_submissions_never_duplicate_an_email():
+    repo = ConcurrentInMemoryTrainerAccountRequestRepository(stripes=8)
+    emails = [f"user{i}@example.com" for i in range(200)]
+    won = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for email in emails:
+            request = create_request(email)
+            if repo.reserve_email(request.candidate_info.email, request.id):
+                assert repo.save_if_email_unused(request)
+                won.append(email)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(won) == sorted(emails)
+    assert repo.count_all() == len(emails)
+
+    print("Concurrent submissions test passed")
+
+
+def test_unsaved_changes_never_show_through_queries():
+    repo = ConcurrentInMemoryTrainerAccountRequestRepository(stripes=4)
+    saved, loaded = create_request("saved@example.com"), create_request("loaded@example.com")
+    repo.save_many([saved, loaded])
+
+    saved.approve()
+    repo.find(loaded.id).reject()
+
+    pending = RequestStatus.pending_validation()
+    found = repo.find_by_status(pending)
+    assert sorted(request.id.value for request in found) == sorted([saved.id.value, loaded.id.value])
+    assert all(request.statut == pending for request in found)
+    assert repo.count_by_status(pending) == len(found) == 2
+    assert repo.find_by_status(RequestStatus.approved()) == []
+    assert repo.count_by_status(RequestStatus.approved()) == 0
+
+    print("Unsaved changes test passed")
+
+
+if __name__ == '__main__':
+    test_save_and_find()
+    test_reservation()
+    test_reservations_expire()
+    test_counts_follow_saves_from_many_threads()
+    test_concurrent_submissions_never_duplicate_an_email()
+    test_unsaved_changes_never_show_through_queries()
+
+    print("\nAll concurrent in-memory repository tests passed!")
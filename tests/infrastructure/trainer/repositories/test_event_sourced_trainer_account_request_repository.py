@@ -0,0 +1,296 @@
+"""Tests pour le repository event-sourcé"""
+
+import sys
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+    EmailAlreadyUsedException,
+    ConcurrentModificationException,
+    TrainerAccountRequestSubmitted,
+    TrainerAccountRequestApproved,
+    SkillLevelUpgraded,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import EventSourcedTrainerAccountRequestRepository
+
+
+def create_request(email: str = "jean.dupont@example.com") -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [
+            Skill.create(SkillName("Python"), SkillLevel.beginner()),
+            Skill.create(SkillName("Java"), SkillLevel.intermediate()),
+        ],
+    )
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "events.db"), size=2)
+    yield pool
+    pool.close()
+
+
+def test_save_and_replay(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool)
+    request = create_request()
+    repo.save(request)
+    assert request.events == ()
+
+    skill = request.skills[0]
+    request.upgrade_skill(skill.id, SkillLevel.expert())
+    request.approve()
+    repo.save(request)
+
+    found = repo.find(request.id)
+    assert found.statut == RequestStatus.approved()
+    assert found.candidate_info == request.candidate_info
+    assert found.submission_date == request.submission_date
+    assert [(s.id, s.name, s.level) for s in found.skills] == [(s.id, s.name, s.level) for s in request.skills]
+
+    stream = repo.event_store.read(request.id.value)
+    assert [version for version, _ in stream] == [1, 2, 3]
+    assert [type(event) for _, event in stream] == [
+        TrainerAccountRequestSubmitted,
+        SkillLevelUpgraded,
+        TrainerAccountRequestApproved,
+    ]
+
+    print("Save and replay test passed")
+
+
+def test_queries_use_the_index(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool)
+    requests = [create_request(f"user{i}@example.com") for i in range(4)]
+    repo.save_many(requests)
+    requests[0].reject()
+    repo.save(requests[0])
+
+    assert repo.find_by_email(requests[1].candidate_info.email).id == requests[1].id
+    assert repo.exists_by_email(requests[2].candidate_info.email)
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 3
+    assert repo.count_by_status(RequestStatus.rejected()) == 1
+    assert repo.count_all() == 4
+
+    pending = sorted(requests[1:], key=lambda request: (request.submission_date, request.id.value))
+    assert [r.id for r in repo.find_pending_validation()] == [r.id for r in pending]
+    page = repo.find_by_status_page(RequestStatus.pending_validation(), limit=2)
+    rest = repo.find_by_status_page(RequestStatus.pending_validation(), page.next_cursor, limit=2)
+    assert [r.id for r in page] + [r.id for r in rest] == [r.id for r in pending]
+
+    print("Index queries test passed")
+
+
+def test_email_uniqueness(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool)
+    repo.save(create_request())
+    duplicate = create_request()
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(duplicate)
+
+    assert repo.event_store.read(duplicate.id.value) == []
+    assert len(duplicate.events) == 1
+
+    print("Email uniqueness test passed")
+
+
+def test_email_reservation(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool)
+    owner, other = create_request(), create_request()
+    email = owner.candidate_info.email
+
+    assert repo.reserve_email(email, owner.id)
+    assert repo.reserve_email(email, owner.id)
+    assert not repo.reserve_email(email, other.id)
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(other)
+    assert repo.event_store.read(other.id.value) == []
+
+    repo.save(owner)
+    repo.release_email(email, owner.id)
+    assert repo.find_by_email(email).id == owner.id
+    assert not repo.reserve_email(email, other.id)
+
+    free = Email("free@example.com")
+    assert repo.reserve_email(free, owner.id)
+    repo.release_email(free, owner.id)
+    assert repo.reserve_email(free, other.id)
+
+    # a reservation nobody releases expires
+    expiring = EventSourcedTrainerAccountRequestRepository(pool, reservation_ttl=timedelta(0))
+    late = create_request("late@example.com")
+    assert expiring.reserve_email(late.candidate_info.email, owner.id)
+    expiring.save(late)
+
+    print("Email reservation test passed")
+
+
+def test_stream_must_start_with_submission(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool)
+    request = create_request()
+    request.clear_events()
+    request.approve()
+
+    with pytest.raises(ValueError):
+        repo.save(request)
+
+    print("Stream start test passed")
+
+
+def test_snapshots(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool, snapshot_every=5)
+    request = create_request()
+    skill = request.skills[1]
+    repo.save(request)
+    for _ in range(11):
+        request.upgrade_skill(skill.id, SkillLevel.expert())
+        repo.save(request)
+
+    version, state = repo.event_store.load_snapshot(request.id.value)
+    assert version == 10
+    assert state['skills'][1][2] == 'EXPERT'
+
+    found = repo.find(request.id)
+    assert found.skills[1].level == SkillLevel.expert()
+
+    without_snapshots = EventSourcedTrainerAccountRequestRepository(pool, snapshot_every=None)
+    assert without_snapshots.find(request.id).skills[1].level == SkillLevel.expert()
+
+    print("Snapshots test passed")
+
+
+def test_delete_keeps_the_stream(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool)
+    request = create_request()
+    repo.save(request)
+
+    repo.delete(request)
+
+    assert repo.find(request.id) is None
+    assert not repo.exists_by_email(request.candidate_info.email)
+    assert len(repo.event_store.read(request.id.value)) == 1
+
+    print("Delete test passed")
+
+
+def test_stale_aggregate_is_rejected(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool)
+    request = create_request()
+    repo.save(request)
+
+    first = repo.find(request.id)
+    second = repo.find(request.id)
+    first.approve()
+    repo.save(first)
+    second.reject()
+
+    with pytest.raises(ConcurrentModificationException) as error:
+        repo.save(second)
+
+    assert (error.value.expected_version, error.value.actual_version) == (1, 2)
+    assert len(second.events) == 1
+    assert repo.find(request.id).statut == RequestStatus.approved()
+
+    # the saved aggregate knows its new version and can be saved again
+    first.upgrade_skill(first.skills[0].id, SkillLevel.expert())
+    repo.save(first)
+    assert len(repo.event_store.read(request.id.value)) == 3
+
+    print("Stale aggregate test passed")
+
+
+def test_counters_and_save_without_events(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool, snapshot_every=100)
+    requests = [create_request(f"user{i}@example.com") for i in range(3)]
+    repo.save_many(requests)
+    requests[0].approve()
+    repo.save(requests[0])
+    repo.delete(requests[1])
+
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 1
+    assert repo.count_by_status(RequestStatus.approved()) == 1
+    assert repo.count_all() == 2
+    with pool.connection() as connection:
+        counted = connection.execute("SELECT COUNT(*) FROM es_trainer_requests").fetchone()[0]
+    assert counted == 2
+
+    # nothing to append: nothing is written, not even a snapshot
+    repo.save(requests[2])
+    assert repo.event_store.load_snapshot(requests[2].id.value) is None
+    assert len(repo.event_store.read(requests[2].id.value)) == 1
+
+    requests[2].approve()
+    requests[2].clear_events()
+    with pytest.raises(ValueError, match="not recorded as events"):
+        repo.save(requests[2])
+    assert repo.find(requests[2].id).statut == RequestStatus.pending_validation()
+
+    unknown = create_request("unknown@example.com")
+    unknown.clear_events()
+    with pytest.raises(ValueError):
+        repo.save(unknown)
+
+    print("Counters and save without events test passed")
+
+
+def test_snapshots_rebuild_the_replayed_aggregate(pool):
+    repo = EventSourcedTrainerAccountRequestRepository(pool, snapshot_every=2)
+    request = create_request()
+    repo.save(request)
+    request.upgrade_skill(request.skills[0].id, SkillLevel.expert())
+    repo.save(request)
+    repo.save(request)
+    request.approve()
+    repo.save(request)
+    repo.save(request)
+    assert repo.event_store.load_snapshot(request.id.value)[0] == 2
+
+    with_snapshots = repo.find(request.id)
+    replayed = EventSourcedTrainerAccountRequestRepository(pool, snapshot_every=None).find(request.id)
+
+    assert with_snapshots == replayed
+    assert with_snapshots.candidate_info == replayed.candidate_info
+    assert with_snapshots.statut == replayed.statut == RequestStatus.approved()
+    assert [(skill.id, skill.name, skill.level) for skill in with_snapshots.skills] == \
+        [(skill.id, skill.name, skill.level) for skill in replayed.skills]
+    assert with_snapshots.submission_date == replayed.submission_date
+
+    print("Snapshot and replay test passed")
+
+
+if __name__ == '__main__':
+    tests = [
+        test_save_and_replay,
+        test_queries_use_the_index,
+        test_email_uniqueness,
+        test_email_reservation,
+        test_stream_must_start_with_submission,
+        test_snapshots,
+        test_delete_keeps_the_stream,
+        test_stale_aggregate_is_rejected,
+        test_counters_and_save_without_events,
+        test_snapshots_rebuild_the_replayed_aggregate,
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for index, test in enumerate(tests):
+            test_pool = SqliteConnectionPool(str(Path(directory) / f"events{index}.db"), size=2)
+            test(test_pool)
+            test_pool.close()
+
+    print("\nAll event-sourced repository tests passed!")
@@ -0,0 +1,359 @@
+"""Tests pour le repository en mémoire indexé"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+    EmailAlreadyUsedException,
+    RequestPage,
+    RequestId,
+)
+from infrastructure.trainer import IndexedInMemoryTrainerAccountRequestRepository
+
+
+def create_candidat_info(email: str = "test@example.com") -> CandidatInfo:
+    return CandidatInfo.create("Jean", "Dupont", email)
+
+
+def create_skills():
+    return [Skill.create(SkillName("Python"), SkillLevel.expert())]
+
+
+def create_dated_requests(count: int):
+    # pairs of requests share a submission date: the id breaks the tie
+    base = datetime(2024, 1, 1, 9, 0)
+    return [
+        TrainerAccountRequest(
+            request_id=RequestId.generate(),
+            candidate_info=create_candidat_info(f"dated{i}@example.com"),
+            skills=create_skills(),
+            status=RequestStatus.pending_validation(),
+            submission_date=base + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+
+
+def with_status(request: TrainerAccountRequest, status: RequestStatus) -> TrainerAccountRequest:
+    return TrainerAccountRequest(
+        request_id=request.id,
+        candidate_info=request.candidate_info,
+        skills=request.skills,
+        status=status,
+        submission_date=request.submission_date,
+    )
+
+
+def test_find_by_email_uses_normalized_email():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    request = TrainerAccountRequest.submit(create_candidat_info("user@example.com"), create_skills())
+    repo.save(request)
+
+    assert repo.find_by_email(Email("USER@Example.com ")) == request
+    assert repo.exists_by_email(Email("user@example.com")) is True
+    assert repo.exists_by_email(Email("other@example.com")) is False
+    assert repo.find_by_email(Email("other@example.com")) is None
+
+    print("Find by email test passed")
+
+
+def test_status_index_follows_saved_status():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 1
+
+    approved = with_status(request, RequestStatus.approved())
+    repo.save(approved)
+
+    assert repo.find_pending_validation() == []
+    assert repo.find_by_status(RequestStatus.approved()) == [approved]
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 0
+    assert repo.count_by_status(RequestStatus.approved()) == 1
+    assert repo.count_all() == 1
+
+    print("Status index test passed")
+
+
+def test_find_by_status_is_in_submission_order():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    requests = [
+        TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills())
+        for i in range(5)
+    ]
+    for request in requests:
+        repo.save(request)
+
+    assert repo.find_pending_validation() == sorted(requests, key=RequestPage.cursor_of)
+
+    print("Find by status order test passed")
+
+
+def test_delete_removes_indexes():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+
+    repo.delete(request)
+    repo.delete(request)
+
+    assert repo.find(request.id) is None
+    assert repo.exists_by_email(request.candidate_info.email) is False
+    assert repo.find_pending_validation() == []
+    assert repo.count_all() == 0
+
+    other = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(other)
+    assert repo.find_by_email(other.candidate_info.email) == other
+
+    print("Delete test passed")
+
+
+def test_save_rejects_email_owned_by_another_request():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    repo.save(TrainerAccountRequest.submit(create_candidat_info(), create_skills()))
+    duplicate = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(duplicate)
+
+    assert repo.find(duplicate.id) is None
+    assert repo.count_all() == 1
+
+    print("Email conflict test passed")
+
+
+def test_email_reservation():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    email = Email("test@example.com")
+    owner = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    other = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+
+    assert repo.reserve_email(email, owner.id)
+    assert not repo.reserve_email(email, other.id)
+    assert not repo.exists_by_email(email)
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(other)
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save_many([other])
+    assert not repo.save_if_email_unused(other)
+
+    # saving consumes the reservation
+    repo.save(owner)
+    repo.release_email(email, owner.id)
+    assert repo.find_by_email(email) == owner
+    assert repo.reserve_email(email, owner.id)
+    assert not repo.reserve_email(email, other.id)
+
+    free = Email("free@example.com")
+    assert repo.reserve_email(free, owner.id)
+    repo.release_email(free, other.id)
+    assert not repo.reserve_email(free, other.id)
+    repo.release_email(free, owner.id)
+    assert repo.reserve_email(free, other.id)
+
+    # a reservation nobody releases expires
+    expiring = IndexedInMemoryTrainerAccountRequestRepository(reservation_ttl=timedelta(0))
+    assert expiring.reserve_email(email, owner.id)
+    assert expiring.reserve_email(email, other.id)
+    expiring.save(other)
+
+    print("Email reservation test passed")
+
+
+def test_clear():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    for i in range(3):
+        repo.save(TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills()))
+
+    repo.clear()
+
+    assert repo.count_all() == 0
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 0
+    assert repo.exists_by_email(Email("user0@example.com")) is False
+
+    print("Clear test passed")
+
+
+def test_batch_operations():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    requests = [
+        TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills())
+        for i in range(4)
+    ]
+
+    repo.save_many(requests)
+
+    assert repo.count_all() == 4
+    assert repo.find_many([requests[3].id, requests[1].id]) == [requests[3], requests[1]]
+    assert repo.exists_by_emails([
+        Email("user0@example.com"), Email("USER2@example.com"), Email("new@example.com"),
+    ]) == {Email("user0@example.com"), Email("user2@example.com")}
+
+    print("Batch operations test passed")
+
+
+def test_save_many_is_checked_before_storing():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    repo.save(TrainerAccountRequest.submit(create_candidat_info("taken@example.com"), create_skills()))
+    fresh = TrainerAccountRequest.submit(create_candidat_info("fresh@example.com"), create_skills())
+    clash = TrainerAccountRequest.submit(create_candidat_info("taken@example.com"), create_skills())
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save_many([fresh, clash])
+
+    twin1 = TrainerAccountRequest.submit(create_candidat_info("twin@example.com"), create_skills())
+    twin2 = TrainerAccountRequest.submit(create_candidat_info("twin@example.com"), create_skills())
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save_many([twin1, twin2])
+
+    assert repo.count_all() == 1
+    assert repo.find(fresh.id) is None
+
+    print("Save many atomicity test passed")
+
+
+def test_save_many_can_swap_emails():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    first, second = create_dated_requests(2)
+    repo.save_many([first, second])
+
+    swapped = [
+        TrainerAccountRequest(request.id, other.candidate_info, request.skills, request.statut, request.submission_date)
+        for request, other in ((first, second), (second, first))
+    ]
+    repo.save_many(swapped)
+
+    assert repo.find_by_email(second.candidate_info.email).id == first.id
+    assert repo.find_by_email(first.candidate_info.email).id == second.id
+    assert repo.count_all() == 2
+
+    print("Email swap test passed")
+
+
+def test_status_pagination():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    requests = create_dated_requests(7)
+    for request in reversed(requests):
+        repo.save(request)
+    expected = sorted(requests, key=RequestPage.cursor_of)
+
+    first = repo.find_by_status_page(RequestStatus.pending_validation(), limit=3)
+    second = repo.find_by_status_page(RequestStatus.pending_validation(), first.next_cursor, 3)
+    last = repo.find_by_status_page(RequestStatus.pending_validation(), second.next_cursor, 3)
+
+    assert [r.id for r in first] == [r.id for r in expected[:3]]
+    assert [r.id for r in second] == [r.id for r in expected[3:6]]
+    assert [r.id for r in last] == [expected[6].id]
+    assert not last.has_next
+    assert len(repo.find_by_status_page(RequestStatus.approved())) == 0
+
+    iterated = list(repo.iter_by_status(RequestStatus.pending_validation(), batch_size=2))
+    assert [r.id for r in iterated] == [r.id for r in expected]
+
+    print("Status pagination test passed")
+
+
+def test_pagination_follows_status_changes():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    requests = create_dated_requests(4)
+    repo.save_many(requests)
+
+    repo.save(with_status(requests[1], RequestStatus.approved()))
+    repo.delete(requests[2])
+
+    page = repo.find_by_status_page(RequestStatus.pending_validation(), limit=10)
+    assert {r.id for r in page} == {requests[0].id, requests[3].id}
+    assert [r.id for r in repo.find_by_status_page(RequestStatus.approved())] == [requests[1].id]
+
+    # enough removals to compact the index, and approvals arriving out of submission order
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    many = create_dated_requests(300)
+    repo.save_many(many)
+    for request in reversed(many[::2]):
+        repo.save(with_status(request, RequestStatus.approved()))
+    pending = [r.id for r in repo.iter_by_status(RequestStatus.pending_validation(), batch_size=7)]
+    assert pending == [r.id for r in sorted(many[1::2], key=RequestPage.cursor_of)]
+    approved = [r.id for r in repo.iter_by_status(RequestStatus.approved(), batch_size=7)]
+    assert approved == [r.id for r in sorted(many[::2], key=RequestPage.cursor_of)]
+    assert repo.count_by_status(RequestStatus.approved()) == 150
+
+    print("Pagination consistency test passed")
+
+
+def test_counters_follow_status_transitions():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    requests = [
+        TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills())
+        for i in range(3)
+    ]
+    repo.save_many(requests)
+
+    requests[0].approve()
+    repo.save(requests[0])
+    requests[1].reject()
+    repo.save(requests[1])
+    repo.delete(requests[2])
+
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 0
+    assert repo.count_by_status(RequestStatus.approved()) == 1
+    assert repo.count_by_status(RequestStatus.rejected()) == 1
+    assert repo.count_all() == 2
+
+    print("Counters test passed")
+
+
+def test_unsaved_changes_never_show_through_queries():
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    saved, loaded = (
+        TrainerAccountRequest.submit(create_candidat_info(email), create_skills())
+        for email in ("saved@example.com", "loaded@example.com")
+    )
+    repo.save_many([saved, loaded])
+
+    saved.approve()
+    repo.find(loaded.id).reject()
+
+    pending = RequestStatus.pending_validation()
+    found = repo.find_by_status(pending)
+    assert sorted(request.id.value for request in found) == sorted([saved.id.value, loaded.id.value])
+    assert all(request.statut == pending for request in found)
+    assert repo.count_by_status(pending) == len(found) == 2
+    assert repo.find_by_status(RequestStatus.approved()) == []
+    assert repo.count_by_status(RequestStatus.approved()) == 0
+
+    print("Unsaved changes test passed")
+
+
+if __name__ == '__main__':
+    test_find_by_email_uses_normalized_email()
+    test_status_index_follows_saved_status()
+    test_find_by_status_is_in_submission_order()
+    test_delete_removes_indexes()
+    test_save_rejects_email_owned_by_another_request()
+    test_email_reservation()
+    test_clear()
+    test_batch_operations()
+    test_save_many_is_checked_before_storing()
+    test_save_many_can_swap_emails()
+    test_status_pagination()
+    test_pagination_follows_status_changes()
+    test_counters_follow_status_transitions()
+    test_unsaved_changes_never_show_through_queries()
+
+    print("\nAll Indexed repository tests passed!")
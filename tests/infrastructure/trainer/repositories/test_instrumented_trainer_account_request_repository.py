@@ -0,0 +1,116 @@
+"""Tests pour le repository et le service de vérification d'email instrumentés"""
+
+import sys
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    VerifyEmailUniqueness,
+    EmailAlreadyUsedException,
+)
+from infrastructure.monitoring import MetricsRegistry
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    InstrumentedTrainerAccountRequestRepository,
+    InstrumentedVerifyEmailUniqueness,
+)
+
+
+def create_request(email: str) -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+
+
+def test_repository_calls_are_timed():
+    registry = MetricsRegistry()
+    repo = InstrumentedTrainerAccountRequestRepository(IndexedInMemoryTrainerAccountRequestRepository(), registry)
+    request = create_request("john@example.com")
+
+    repo.save(request)
+    assert repo.find(request.id) == request
+    assert repo.exists_by_email(Email("john@example.com"))
+    assert not repo.exists_by_email(Email("jane@example.com"))
+
+    histograms = registry.snapshot()['histograms']
+    assert histograms['trainer_repository.save.seconds']['count'] == 1
+    assert histograms['trainer_repository.find.seconds']['count'] == 1
+    assert histograms['trainer_repository.exists_by_email.seconds']['count'] == 2
+
+    print("Repository timing test passed")
+
+
+def test_repository_errors_are_counted_and_raised():
+    registry = MetricsRegistry()
+    repo = InstrumentedTrainerAccountRequestRepository(IndexedInMemoryTrainerAccountRequestRepository(), registry)
+    repo.save(create_request("john@example.com"))
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(create_request("john@example.com"))
+
+    assert registry.counter('trainer_repository.save.errors').value == 1
+    assert registry.histogram('trainer_repository.save.seconds').count == 2
+
+    print("Repository error test passed")
+
+
+def test_disabled_registry_only_delegates():
+    registry = MetricsRegistry(enabled=False)
+    repo = InstrumentedTrainerAccountRequestRepository(IndexedInMemoryTrainerAccountRequestRepository(), registry)
+
+    repo.save(create_request("john@example.com"))
+    registry.enabled = True
+    repo.save(create_request("jane@example.com"))
+
+    assert repo.count_all() == 2
+    assert registry.histogram('trainer_repository.save.seconds').count == 1
+
+    print("Disabled instrumentation test passed")
+
+
+def test_verify_email_uniqueness_is_instrumented():
+    registry = MetricsRegistry()
+    repo = IndexedInMemoryTrainerAccountRequestRepository()
+    repo.save(create_request("john@example.com"))
+    verifier = InstrumentedVerifyEmailUniqueness(repo, registry)
+
+    verifier.execute(Email("jane@example.com"))
+    with pytest.raises(EmailAlreadyUsedException):
+        verifier.execute(Email("john@example.com"))
+    assert verifier.execute_many([Email("john@example.com"), Email("new@example.com")]) == [False, True]
+
+    assert isinstance(verifier, VerifyEmailUniqueness)
+    assert registry.histogram('verify_email_uniqueness.execute.seconds').count == 2
+    assert registry.counter('verify_email_uniqueness.email_already_used').value == 1
+    assert registry.counter('verify_email_uniqueness.execute.errors').value == 0
+    assert registry.histogram('verify_email_uniqueness.execute_many.seconds').count == 1
+    # called by execute_many
+    assert registry.histogram('verify_email_uniqueness.availability_map.seconds').count == 1
+
+    disabled = MetricsRegistry(enabled=False)
+    with pytest.raises(EmailAlreadyUsedException):
+        InstrumentedVerifyEmailUniqueness(repo, disabled).execute(Email("john@example.com"))
+    assert disabled.counter('verify_email_uniqueness.email_already_used').value == 0
+
+    print("Instrumented service test passed")
+
+
+if __name__ == '__main__':
+    test_repository_calls_are_timed()
+    test_repository_errors_are_counted_and_raised()
+    test_disabled_registry_only_delegates()
+    test_verify_email_uniqueness_is_instrumented()
+
+    print("\nAll instrumented repository tests passed!")
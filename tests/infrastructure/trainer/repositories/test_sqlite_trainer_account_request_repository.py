@@ -0,0 +1,421 @@
+"""Tests pour le repository SQLite"""
+
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    Email,
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    RequestStatus,
+    EmailAlreadyUsedException,
+    RequestId,
+    RequestPage,
+)
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import SqliteTrainerAccountRequestRepository
+
+
+def create_candidat_info(email: str = "test@example.com") -> CandidatInfo:
+    return CandidatInfo.create("Jean", "Dupont", email)
+
+
+def create_skills():
+    return [
+        Skill.create(SkillName("Python"), SkillLevel.expert()),
+        Skill.create(SkillName("Java"), SkillLevel.beginner()),
+    ]
+
+
+def create_dated_requests(count: int):
+    # pairs of requests share a submission date: the id breaks the tie
+    base = datetime(2024, 1, 1, 9, 0)
+    return [
+        TrainerAccountRequest(
+            request_id=RequestId.generate(),
+            candidate_info=create_candidat_info(f"dated{i}@example.com"),
+            skills=create_skills(),
+            status=RequestStatus.pending_validation(),
+            submission_date=base + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+
+
+def with_status(request: TrainerAccountRequest, status: RequestStatus) -> TrainerAccountRequest:
+    return TrainerAccountRequest(
+        request_id=request.id,
+        candidate_info=request.candidate_info,
+        skills=request.skills,
+        status=status,
+        submission_date=request.submission_date,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "trainer.db"), size=2)
+    yield SqliteTrainerAccountRequestRepository(pool)
+    pool.close()
+
+
+def test_save_and_find(repo):
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+
+    found = repo.find(request.id)
+
+    assert found is not None
+    assert found.id == request.id
+    assert found.candidate_info == request.candidate_info
+    assert found.statut == request.statut
+    assert found.submission_date == request.submission_date
+    assert [s.id for s in found.skills] == [s.id for s in request.skills]
+    assert [s.level for s in found.skills] == [s.level for s in request.skills]
+
+    print("Save and find test passed")
+
+
+def test_find_by_email_and_exists(repo):
+    repo.save(TrainerAccountRequest.submit(create_candidat_info("user@example.com"), create_skills()))
+
+    assert repo.find_by_email(Email("USER@example.com")) is not None
+    assert repo.find_by_email(Email("other@example.com")) is None
+    assert repo.exists_by_email(Email("user@example.com")) is True
+    assert repo.exists_by_email(Email("other@example.com")) is False
+
+    print("Find by email test passed")
+
+
+def test_find_by_status(repo):
+    requests = [
+        TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills())
+        for i in range(3)
+    ]
+    for request in requests:
+        repo.save(request)
+    repo.save(with_status(requests[1], RequestStatus.approved()))
+
+    pending = repo.find_pending_validation()
+    approved = repo.find_by_status(RequestStatus.approved())
+
+    assert [r.id for r in pending] == [requests[0].id, requests[2].id]
+    assert [r.id for r in approved] == [requests[1].id]
+    assert len(approved[0].skills) == 2
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 2
+    assert repo.count_all() == 3
+
+    print("Find by status test passed")
+
+
+def test_save_replaces_skills(repo):
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+    request.skills[0].upgrade_level(SkillLevel.expert())
+    updated = TrainerAccountRequest(
+        request_id=request.id,
+        candidate_info=request.candidate_info,
+        skills=request.skills[:1],
+        status=request.statut,
+        submission_date=request.submission_date,
+    )
+    repo.save(updated)
+
+    found = repo.find(request.id)
+
+    assert len(found.skills) == 1
+    assert repo.count_all() == 1
+
+    print("Save replaces skills test passed")
+
+
+def test_unique_email(repo):
+    repo.save(TrainerAccountRequest.submit(create_candidat_info(), create_skills()))
+    duplicate = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(duplicate)
+
+    assert repo.find(duplicate.id) is None
+    assert repo.count_all() == 1
+
+    print("Unique email test passed")
+
+
+def test_delete_cascades_to_skills(repo):
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+
+    repo.delete(request)
+
+    assert repo.find(request.id) is None
+    assert repo.exists_by_email(request.candidate_info.email) is False
+    with repo._pool.connection() as connection:
+        assert connection.execute("SELECT COUNT(*) FROM trainer_skills").fetchone()[0] == 0
+
+    print("Delete test passed")
+
+
+def test_batch_operations(repo):
+    requests = [
+        TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills())
+        for i in range(1200)
+    ]
+
+    repo.save_many(requests)
+
+    assert repo.count_all() == 1200
+    ids = [requests[1100].id, requests[3].id, requests[600].id]
+    found = repo.find_many(ids)
+    assert [r.id for r in found] == ids
+    assert all(len(r.skills) == 2 for r in found)
+    emails = [Email(f"user{i}@example.com") for i in range(0, 2400, 2)]
+    assert repo.exists_by_emails(emails) == {Email(f"user{i}@example.com") for i in range(0, 1200, 2)}
+
+    print("Batch operations test passed")
+
+
+def test_save_many_rolls_back_on_email_conflict(repo):
+    repo.save(TrainerAccountRequest.submit(create_candidat_info("taken@example.com"), create_skills()))
+    fresh = TrainerAccountRequest.submit(create_candidat_info("fresh@example.com"), create_skills())
+    clash = TrainerAccountRequest.submit(create_candidat_info("taken@example.com"), create_skills())
+
+    with pytest.raises(EmailAlreadyUsedException) as error:
+        repo.save_many([fresh, clash])
+
+    assert error.value.email == Email("taken@example.com")
+    assert repo.find(fresh.id) is None
+    assert repo.count_all() == 1
+
+    # a reservation held by another request is a conflict too
+    holder = TrainerAccountRequest.submit(create_candidat_info("held@example.com"), create_skills())
+    assert repo.reserve_email(Email("held@example.com"), holder.id)
+    late = TrainerAccountRequest.submit(create_candidat_info("held@example.com"), create_skills())
+    with pytest.raises(EmailAlreadyUsedException) as error:
+        repo.save_many([fresh, late])
+    assert error.value.email == Email("held@example.com")
+    repo.save_many([fresh, holder])
+    assert repo.count_all() == 3
+
+    print("Save many rollback test passed")
+
+
+def test_status_pagination(repo):
+    requests = create_dated_requests(7)
+    for request in reversed(requests):
+        repo.save(request)
+    expected = sorted(requests, key=RequestPage.cursor_of)
+
+    first = repo.find_by_status_page(RequestStatus.pending_validation(), limit=3)
+    second = repo.find_by_status_page(RequestStatus.pending_validation(), first.next_cursor, 3)
+    last = repo.find_by_status_page(RequestStatus.pending_validation(), second.next_cursor, 3)
+
+    assert [r.id for r in first] == [r.id for r in expected[:3]]
+    assert [r.id for r in second] == [r.id for r in expected[3:6]]
+    assert [r.id for r in last] == [expected[6].id]
+    assert not last.has_next
+    assert len(repo.find_by_status_page(RequestStatus.approved())) == 0
+
+    iterated = list(repo.iter_by_status(RequestStatus.pending_validation(), batch_size=2))
+    assert [r.id for r in iterated] == [r.id for r in expected]
+
+    print("Status pagination test passed")
+
+
+def test_counters_follow_status_transitions(repo):
+    requests = [
+        TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills())
+        for i in range(4)
+    ]
+    repo.save_many(requests)
+
+    requests[0].approve()
+    requests[1].reject()
+    repo.save_many(requests[:2])
+    repo.save(requests[1])
+    repo.delete(requests[2])
+
+    assert repo.count_by_status(RequestStatus.pending_validation()) == 1
+    assert repo.count_by_status(RequestStatus.approved()) == 1
+    assert repo.count_by_status(RequestStatus.rejected()) == 1
+    assert repo.count_all() == 3
+
+    repo.clear()
+
+    assert repo.count_all() == 0
+    assert repo.count_by_status(RequestStatus.approved()) == 0
+
+    print("Counters test passed")
+
+
+def test_counters_are_backfilled_for_existing_databases(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "trainer.db"))
+    repo = SqliteTrainerAccountRequestRepository(pool)
+    for i in range(3):
+        repo.save(TrainerAccountRequest.submit(create_candidat_info(f"user{i}@example.com"), create_skills()))
+    with pool.transaction() as connection:
+        connection.execute("DROP TABLE trainer_request_counts")
+
+    reopened = SqliteTrainerAccountRequestRepository(pool)
+
+    assert reopened.count_by_status(RequestStatus.pending_validation()) == 3
+    assert reopened.count_all() == 3
+    pool.close()
+
+    print("Counters backfill test passed")
+
+
+def test_data_survives_new_repository(tmp_path):
+    database = str(tmp_path / "trainer.db")
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    first = SqliteConnectionPool(database)
+    SqliteTrainerAccountRequestRepository(first).save(request)
+    first.close()
+
+    second = SqliteConnectionPool(database)
+    found = SqliteTrainerAccountRequestRepository(second).find(request.id)
+    with second.connection() as connection:
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+    second.close()
+
+    assert found is not None
+    assert journal_mode == 'wal'
+
+    print("Persistence test passed")
+
+
+def test_email_reservation(repo):
+    email = Email("reserved@example.com")
+    owner = TrainerAccountRequest.submit(create_candidat_info("reserved@example.com"), create_skills())
+    other = TrainerAccountRequest.submit(create_candidat_info("reserved@example.com"), create_skills())
+
+    assert repo.reserve_email(email, owner.id)
+    assert repo.reserve_email(email, owner.id)
+    assert not repo.reserve_email(email, other.id)
+    assert not repo.exists_by_email(email)
+
+    # the reservation is enforced by the database, not only by reserve_email
+    assert not repo.save_if_email_unused(other)
+    assert repo.save_if_email_unused(owner)
+    assert not repo.reserve_email(email, other.id)
+
+    free = Email("free@example.com")
+    assert repo.reserve_email(free, owner.id)
+    repo.release_email(free, owner.id)
+    assert repo.reserve_email(free, other.id)
+
+    print("Email reservation test passed")
+
+
+def test_reservations_expire(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "expiring.db"), size=2)
+    repo = SqliteTrainerAccountRequestRepository(pool, reservation_ttl=timedelta(0))
+    email = Email("reserved@example.com")
+    owner = TrainerAccountRequest.submit(create_candidat_info("reserved@example.com"), create_skills())
+    other = TrainerAccountRequest.submit(create_candidat_info("reserved@example.com"), create_skills())
+
+    assert repo.reserve_email(email, owner.id)
+    assert repo.reserve_email(email, other.id)
+    repo.save(owner)
+    assert repo.find_by_email(email).id == owner.id
+    pool.close()
+
+    print("Reservation expiry test passed")
+
+
+def test_changing_email_consumes_its_reservation(repo):
+    request = TrainerAccountRequest.submit(create_candidat_info("old@example.com"), create_skills())
+    repo.save(request)
+    assert repo.reserve_email(Email("new@example.com"), request.id)
+
+    moved = TrainerAccountRequest(
+        request_id=request.id,
+        candidate_info=create_candidat_info("new@example.com"),
+        skills=request.skills,
+        status=request.statut,
+        submission_date=request.submission_date,
+    )
+    repo.save(moved)
+    repo.delete(moved)
+
+    # a reservation left behind would still hold the email after the delete
+    repo.save(TrainerAccountRequest.submit(create_candidat_info("new@example.com"), create_skills()))
+
+    print("Email change reservation test passed")
+
+
+def test_reads_see_a_single_snapshot(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "trainer.db"), size=2)
+    repo = SqliteTrainerAccountRequestRepository(pool)
+    request = TrainerAccountRequest.submit(create_candidat_info(), create_skills())
+    repo.save(request)
+
+    with pool.read_transaction() as connection:
+        query = "SELECT COUNT(*) FROM trainer_skills WHERE request_id = ?"
+        assert connection.execute(query, (request.id.value,)).fetchone()[0] == 2
+        # a delete committed by another connection in the middle of the read
+        repo.delete(request)
+        assert connection.execute(query, (request.id.value,)).fetchone()[0] == 2
+
+    assert repo.find(request.id) is None
+    pool.close()
+
+    print("Read snapshot test passed")
+
+
+def test_memory_database():
+    repo = SqliteTrainerAccountRequestRepository.connect(':memory:')
+    repo.save(TrainerAccountRequest.submit(create_candidat_info(), create_skills()))
+
+    assert repo.count_all() == 1
+
+    print("Memory database test passed")
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqliteConnectionPool(str(Path(directory) / "trainer.db"))
+        for test in (
+            test_save_and_find,
+            test_find_by_email_and_exists,
+            test_find_by_status,
+            test_save_replaces_skills,
+            test_unique_email,
+            test_delete_cascades_to_skills,
+            test_batch_operations,
+            test_save_many_rolls_back_on_email_conflict,
+            test_status_pagination,
+            test_counters_follow_status_transitions,
+            test_email_reservation,
+            test_changing_email_consumes_its_reservation,
+        ):
+            repository = SqliteTrainerAccountRequestRepository(pool)
+            repository.clear()
+            test(repository)
+        pool.close()
+        other = Path(directory) / "other"
+        other.mkdir()
+        test_data_survives_new_repository(other)
+        backfill = Path(directory) / "backfill"
+        backfill.mkdir()
+        test_counters_are_backfilled_for_existing_databases(backfill)
+        snapshot = Path(directory) / "snapshot"
+        snapshot.mkdir()
+        test_reads_see_a_single_snapshot(snapshot)
+        expiring = Path(directory) / "expiring"
+        expiring.mkdir()
+        test_reservations_expire(expiring)
+    test_memory_database()
+
+    print("\nAll SQLite repository tests passed!")
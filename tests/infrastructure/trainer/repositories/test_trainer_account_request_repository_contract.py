@@ -0,0 +1,121 @@
+"""Contrat commun aux repositories de demandes de compte formateur"""
+
+import sys
+import tempfile
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    EmailAlreadyUsedException,
+)
+from infrastructure.monitoring import MetricsRegistry
+from infrastructure.shared import SqliteConnectionPool
+from infrastructure.trainer import (
+    IndexedInMemoryTrainerAccountRequestRepository,
+    SqliteTrainerAccountRequestRepository,
+    BloomFilterTrainerAccountRequestRepository,
+    ColumnarTrainerAccountRequestRepository,
+    ConcurrentInMemoryTrainerAccountRequestRepository,
+    InstrumentedTrainerAccountRequestRepository,
+)
+
+
+def create_request(email: str) -> TrainerAccountRequest:
+    return TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", email),
+        [Skill.create(SkillName("Python"), SkillLevel.expert())],
+    )
+
+
+def with_email(request: TrainerAccountRequest, other: TrainerAccountRequest) -> TrainerAccountRequest:
+    return TrainerAccountRequest(
+        request.id, other.candidate_info, request.skills, request.statut, request.submission_date,
+    )
+
+
+def check_save_many_swaps_emails(repo) -> None:
+    first, second, third, outsider = (create_request(f"user{i}@example.com") for i in range(4))
+    repo.save_many([first, second, third, outsider])
+
+    repo.save_many([with_email(first, second), with_email(second, first)])
+    assert repo.find_by_email(second.candidate_info.email).id == first.id
+    assert repo.find_by_email(first.candidate_info.email).id == second.id
+
+    # a rotation through three requests
+    repo.save_many([with_email(first, third), with_email(second, second), with_email(third, first)])
+    assert repo.find_by_email(third.candidate_info.email).id == first.id
+    assert repo.find_by_email(second.candidate_info.email).id == second.id
+    assert repo.find_by_email(first.candidate_info.email).id == third.id
+
+    # an email owned outside the batch is still refused, and nothing is saved
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save_many([with_email(second, first), with_email(first, outsider)])
+    assert repo.find_by_email(outsider.candidate_info.email).id == outsider.id
+    assert repo.find_by_email(third.candidate_info.email).id == first.id
+    assert repo.find_by_email(first.candidate_info.email).id == third.id
+
+    with pytest.raises(EmailAlreadyUsedException):
+        repo.save(create_request("user0@example.com"))
+    assert repo.count_all() == 4
+
+
+def test_indexed_in_memory_repository():
+    check_save_many_swaps_emails(IndexedInMemoryTrainerAccountRequestRepository())
+
+    print("Indexed repository contract test passed")
+
+
+def test_columnar_repository():
+    check_save_many_swaps_emails(ColumnarTrainerAccountRequestRepository())
+
+    print("Columnar repository contract test passed")
+
+
+def test_concurrent_in_memory_repository():
+    check_save_many_swaps_emails(ConcurrentInMemoryTrainerAccountRequestRepository(stripes=4))
+
+    print("Concurrent repository contract test passed")
+
+
+def test_sqlite_repository(tmp_path):
+    pool = SqliteConnectionPool(str(tmp_path / "contract.db"), size=2)
+    check_save_many_swaps_emails(SqliteTrainerAccountRequestRepository(pool))
+    pool.close()
+
+    print("SQLite repository contract test passed")
+
+
+def test_decorated_repositories():
+    check_save_many_swaps_emails(
+        BloomFilterTrainerAccountRequestRepository(IndexedInMemoryTrainerAccountRequestRepository())
+    )
+    check_save_many_swaps_emails(
+        InstrumentedTrainerAccountRequestRepository(ColumnarTrainerAccountRequestRepository(), MetricsRegistry())
+    )
+
+    print("Decorated repositories contract test passed")
+
+
+# The event-sourced repository is left out: no event records an email change,
+# so the email a request was submitted with is the only one it ever has.
+
+
+if __name__ == '__main__':
+    test_indexed_in_memory_repository()
+    test_columnar_repository()
+    test_concurrent_in_memory_repository()
+    with tempfile.TemporaryDirectory() as directory:
+        test_sqlite_repository(Path(directory))
+    test_decorated_repositories()
+
+    print("\nAll repository contract tests passed!")
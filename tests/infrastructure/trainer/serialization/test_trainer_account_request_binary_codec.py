@@ -0,0 +1,216 @@
+"""Tests pour le codec binaire des demandes de compte formateur"""
+
+import io
+import pickle
+import sys
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+project_root = Path(__file__).parent.parent.parent.parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+from domain.trainer import (
+    CandidatInfo,
+    Skill,
+    SkillName,
+    SkillLevel,
+    TrainerAccountRequest,
+    TrainerAccountRequestSubmitted,
+)
+from infrastructure.trainer import TrainerAccountRequestBinaryCodec
+
+
+def create_request(email: str = "jean.dupont@example.com") -> TrainerAccountRequest:
+    request = TrainerAccountRequest.submit(
+        CandidatInfo.create("Jérôme", "Dupont", email),
+        [
+            Skill.create(SkillName("Python"), SkillLevel.expert()),
+            Skill.create(SkillName("Docker"), SkillLevel.beginner()),
+        ],
+    )
+    request.clear_events()
+    return request
+
+
+def assert_same_request(decoded: TrainerAccountRequest, request: TrainerAccountRequest) -> None:
+    assert decoded.id == request.id
+    assert decoded.candidate_info == request.candidate_info
+    assert decoded.statut == request.statut
+    assert decoded.submission_date == request.submission_date
+    assert [(skill.id, skill.name, skill.level) for skill in decoded.skills] == \
+        [(skill.id, skill.name, skill.level) for skill in request.skills]
+    assert decoded.events == ()
+
+
+def test_round_trip_of_every_type():
+    codec = TrainerAccountRequestBinaryCodec()
+    request = create_request()
+    request.approve()
+    request.clear_events()
+
+    assert_same_request(codec.decode(codec.encode(request)), request)
+
+    candidate_info = request.candidate_info
+    assert codec.decode(codec.encode(candidate_info)) == candidate_info
+
+    skill = request.skills[0]
+    decoded_skill = codec.decode(codec.encode(skill))
+    assert (decoded_skill.id, decoded_skill.name, decoded_skill.level) == (skill.id, skill.name, skill.level)
+
+    print("Round trip of every type test passed")
+
+
+def test_round_trip_of_submitted_event():
+    codec = TrainerAccountRequestBinaryCodec()
+    request = TrainerAccountRequest.submit(
+        CandidatInfo.create("Jean", "Dupont", "jean@example.com"),
+        [Skill.create(SkillName("Python"), SkillLevel.intermediate())],
+    )
+    [event] = request.pull_events()
+
+    decoded = codec.decode(codec.encode(event))
+    assert isinstance(decoded, TrainerAccountRequestSubmitted)
+    assert decoded.request_id == event.request_id
+    assert decoded.candidate_email == event.candidate_email
+    assert decoded.occurred_on == event.occurred_on
+    assert decoded.candidate_info == event.candidate_info
+    assert decoded.skills == event.skills
+
+    # events recorded before names and skills were carried
+    bare = TrainerAccountRequestSubmitted(event.request_id, event.candidate_email, datetime(2024, 1, 2, 3, 4, 5, 6))
+    decoded = codec.decode(codec.encode(bare))
+    assert decoded.candidate_info is None
+    assert decoded.skills == ()
+    assert decoded.occurred_on == bare.occurred_on
+
+    print("Round trip of submitted event test passed")
+
+
+def test_encoding_is_compact_and_decodes_from_a_memoryview():
+    codec = TrainerAccountRequestBinaryCodec()
+    request = create_request()
+    data = codec.encode(request)
+
+    # 2 header + 16 id + 3 strings + 1 status + 8 date + 2 count + 2 * (16 id + name + 1 level)
+    strings = len("Jérôme".encode('utf-8')) + len("Dupont") + len("jean.dupont@example.com") + 3 * 2
+    skills = 2 * (16 + 2 + 1) + len("Python") + len("Docker")
+    assert len(data) == 2 + 16 + strings + 1 + 8 + 2 + skills
+    assert len(data) < len(pickle.dumps(request)) / 2
+
+    buffer = bytearray(b'\x00' * 3 + data + b'\x00' * 3)
+    assert_same_request(codec.decode(memoryview(buffer)[3:-3]), request)
+
+    print("Compact encoding and memoryview decoding test passed")
+
+
+def test_streaming_many_records():
+    codec = TrainerAccountRequestBinaryCodec()
+    requests = [create_request(f"user{i}@example.com") for i in range(5)]
+    values = requests + [requests[0].candidate_info, requests[0].skills[0]]
+
+    frames = list(codec.encode_many(values))
+    assert len(frames) == len(values)
+    decoded = list(codec.decode_many(b''.join(frames)))
+    assert len(decoded) == len(values)
+    for decoded_request, request in zip(decoded, requests):
+        assert_same_request(decoded_request, request)
+    assert decoded[5] == requests[0].candidate_info
+
+    stream = io.BytesIO()
+    assert codec.write_many(requests, stream) == 5
+    stream.seek(0)
+    for decoded_request, request in zip(codec.read_many(stream), requests):
+        assert_same_request(decoded_request, request)
+
+    assert list(codec.decode_many(b'')) == []
+
+    print("Streaming many records test passed")
+
+
+def test_invalid_data_is_rejected():
+    codec = TrainerAccountRequestBinaryCodec()
+    data = codec.encode(create_request())
+
+    with pytest.raises(ValueError, match="version"):
+        codec.decode(b'\x09' + data[1:])
+    with pytest.raises(ValueError, match="record type"):
+        codec.decode(data[:1] + b'\x63' + data[2:])
+    with pytest.raises(ValueError, match="Truncated"):
+        codec.decode(data[:-5])
+    with pytest.raises(ValueError, match="unexpected bytes"):
+        codec.decode(data + b'\x00')
+    with pytest.raises(ValueError, match="Truncated"):
+        list(codec.decode_many(b''.join(codec.encode_many([create_request()]))[:-1]))
+    with pytest.raises(ValueError, match="Cannot encode"):
+        codec.encode("not a domain object")
+    with pytest.raises(ValueError, match="naive"):
+        codec.encode(TrainerAccountRequestSubmitted(
+            create_request().id,
+            create_request().candidate_info.email,
+            datetime.fromisoformat("2024-01-01T00:00:00+00:00"),
+        ))
+
+    print("Invalid data test passed")
+
+
+def test_read_many_detects_truncated_streams():
+    codec = TrainerAccountRequestBinaryCodec()
+    requests = [create_request(f"user{i}@example.com") for i in range(3)]
+    data = b''.join(codec.encode_many(requests))
+
+    class ShortReads(io.RawIOBase):
+        # hands out at most 3 bytes per read, like a pipe
+        def __init__(self, data):
+            self._stream = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def read(self, size=-1):
+            return self._stream.read(min(size, 3))
+
+    for decoded_request, request in zip(codec.read_many(ShortReads(data)), requests):
+        assert_same_request(decoded_request, request)
+    assert len(list(codec.read_many(ShortReads(data)))) == 3
+
+    last_frame = len(data) - len(codec.encode(requests[-1])) - 4
+    with pytest.raises(ValueError, match="Truncated frame header: 2 of 4 bytes"):
+        list(codec.read_many(io.BytesIO(data[:last_frame + 2])))
+    with pytest.raises(ValueError, match="Truncated frame: .* bytes"):
+        list(codec.read_many(ShortReads(data[:-1])))
+
+    print("Truncated stream test passed")
+
+
+def test_validate_checks_every_value():
+    codec = TrainerAccountRequestBinaryCodec()
+    candidate_info = CandidatInfo.create("Jean", "Dupont", "jean@example.com")
+    data = codec.encode(candidate_info)
+    tampered = data.replace(b"jean@example.com", b"jean_example.com")
+
+    with pytest.raises(ValueError, match="not a valid email"):
+        codec.decode(tampered)
+    with pytest.raises(ValueError, match="not a valid email"):
+        list(codec.decode_many(len(tampered).to_bytes(4, 'little') + tampered))
+    # the trusted path skips validation: only for bytes this system wrote
+    assert codec.decode(tampered, validate=False).email.value == "jean_example.com"
+
+    request = create_request()
+    assert_same_request(codec.decode(codec.encode(request), validate=False), request)
+
+    print("Validate test passed")
+
+
+if __name__ == '__main__':
+    test_round_trip_of_every_type()
+    test_round_trip_of_submitted_event()
+    test_encoding_is_compact_and_decodes_from_a_memoryview()
+    test_streaming_many_records()
+    test_invalid_data_is_rejected()
+    test_read_many_detects_truncated_streams()
+    test_validate_checks_every_value()
+
+    print("\nAll binary codec tests passed!")